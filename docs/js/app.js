@@ -5,7 +5,9 @@ const CONFIG = {
     PASSWORD: 'Sig1MpxP226KIT',
     SESSION_KEY: 'galileo_auth',
     SESSION_DURATION: 24 * 60 * 60 * 1000, // 24 hours
-    DATA_URL: './data/topics.json'};
+    DATA_URL: './data/topics.json',
+    INDEX_URL: './data/index.json',
+    DETAILS_URL: './data/details/'};
 
 // ========================================
 // GLOBAL STATE
@@ -17,6 +19,7 @@ let currentSort = 'relevance';
 let searchQuery = '';
 let searchDebounceTimer = null;
 let lastAutoGenerationDate = null;
+let loadedShards = new Map();
 
 // ========================================
 // AUTHENTICATION
@@ -99,6 +102,20 @@ async function initApp() {
 // ========================================
 async function loadTopics() {
     try {
+        // Zuerst nur den kompakten Index laden, Details kommen bei Bedarf
+        const indexResponse = await fetch(CONFIG.INDEX_URL);
+        if (indexResponse.ok) {
+            const index = await indexResponse.json();
+            allTopics = (index.topics || []).map(topic => ({
+                summary: topic.teaser || '',
+                sources: [],
+                ...topic
+            }));
+            loadedShards = new Map();
+            filteredTopics = [...allTopics];
+            return;
+        }
+
         const response = await fetch(CONFIG.DATA_URL);
         if (!response.ok) {
             // Fallback: Mock-Daten wenn keine echten Daten vorhanden
@@ -115,6 +132,26 @@ async function loadTopics() {
     }
 }
 
+async function loadTopicDetails(topic) {
+    // Themen aus topics.json bzw. Mock-Daten bringen ihre Details schon mit
+    if (!topic.shard || topic.storyline || topic.compact) return topic;
+
+    if (!loadedShards.has(topic.shard)) {
+        loadedShards.set(topic.shard, fetch(`${CONFIG.DETAILS_URL}${topic.shard}.json`)
+            .then(response => response.ok ? response.json() : {})
+            .catch(() => ({})));
+    }
+    const details = await loadedShards.get(topic.shard);
+
+    // Alle Themen des Shards ergänzen (ein Request pro Tag)
+    allTopics.forEach(t => {
+        if (t.shard === topic.shard && details[t.id]) {
+            Object.assign(t, details[t.id]);
+        }
+    });
+    return topic;
+}
+
 function generateMockData() {
     return [
         {
@@ -370,9 +407,9 @@ function matchesSearch(topic) {
     const searchableText = [
         topic.title,
         topic.summary,
-        topic.visualReason,
+        topic.visualReason || '',
         ...topic.tags,
-        ...topic.sources.map(s => s.headline || s.name)
+        ...(topic.sources || []).map(s => s.headline || s.name)
     ].join(' ').toLowerCase();
 
     // Return true if ANY search term is found (OR logic)
@@ -440,7 +477,7 @@ function sortTopics() {
 
     switch (currentSort) {
         case 'relevance':
-            filteredTopics.sort((a, b) => b.tags.length - a.tags.length);
+            filteredTopics.sort((a, b) => (b.galileo_relevance || 0) - (a.galileo_relevance || 0));
             break;
         case 'date':
             filteredTopics.sort((a, b) => new Date(b.date) - new Date(a.date));
@@ -526,10 +563,17 @@ function renderTopics() {
     `).join('');
 }
 
-function showTopicDetail(topicId) {
+async function showTopicDetail(topicId) {
     const topic = allTopics.find(t => t.id === topicId);
     if (!topic) return;
 
+    await loadTopicDetails(topic);
+    // Kurzform-Themen (außerhalb der Top K) haben keine Storyline
+    if (!topic.storyline && !topic.compact) {
+        console.warn('Details konnten nicht geladen werden:', topic.shard);
+        return;
+    }
+
     const modal = document.getElementById('topicModal');
     const modalTitle = document.getElementById('modalTitle');
     const modalBody = document.getElementById('modalBody');
@@ -552,7 +596,7 @@ function showTopicDetail(topicId) {
 
             <div style="margin-bottom: 2rem;">
                 <h3>🎬 Visuelles Potenzial (${topic.visualRating}/5 ⭐)</h3>
-                <p><strong>Begründung:</strong> ${topic.visualReason}</p>
+                ${topic.visualReason ? `<p><strong>Begründung:</strong> ${topic.visualReason}</p>` : ''}
             </div>
 
             <div style="margin-bottom: 2rem;">
@@ -567,7 +611,7 @@ function showTopicDetail(topicId) {
                 </ul>
             </div>
 
-            <div style="margin-bottom: 2rem;">
+            ${topic.storyline ? `<div style="margin-bottom: 2rem;">
                 <h3>🎭 Storyline-Entwurf (${topic.storyline.duration})</h3>
                 <div style="background: var(--bg-light); padding: 1.5rem; border-radius: 8px;">
                     <h4>Struktur:</h4>
@@ -588,7 +632,10 @@ function showTopicDetail(topicId) {
                     <h4>Dramaturgischer Bogen:</h4>
                     <p style="font-style: italic;">${topic.storyline.dramaticArc}</p>
                 </div>
-            </div>
+            </div>` : `<div style="margin-bottom: 2rem;">
+                <h3>🎭 Storyline-Entwurf</h3>
+                <p>Kurzeintrag außerhalb der Top-Themen - keine Storyline vorhanden.</p>
+            </div>`}
 
             <div>
                 <h3>🔍 Duplikat-Check</h3>
@@ -3,21 +3,52 @@ Galileo Research Tool - Automatische Themenrecherche für TV-Redakteure
 
 Dieses Paket enthält alle Module für die automatische Recherche,
 Analyse und Bewertung von TV-Themen für die Sendung Galileo.
+
+Die Exporte werden erst beim ersten Zugriff geladen (PEP 562), damit
+`import scripts` nicht requests, feedparser und NumPy mitzieht.
 """
 
+import importlib
+import os
+import sys
+from typing import TYPE_CHECKING, Any, List
+
 __version__ = "1.0.0"
 __author__ = "Maximus Film GmbH"
 __email__ = "support@maximusfilm.de"
 
-# Module exports
-from .main_research import GalileoResearchTool
-from .news_scraper import NewsScraperService
-from .ai_analyzer import AIAnalyzerService
-from .duplicate_checker import DuplicateCheckerService
-
-__all__ = [
-    'GalileoResearchTool',
-    'NewsScraperService',
-    'AIAnalyzerService',
-    'DuplicateCheckerService',
-]
+# Module exports: Name -> Modul
+_EXPORTS = {
+    'GalileoResearchTool': 'main_research',
+    'NewsScraperService': 'news_scraper',
+    'AIAnalyzerService': 'ai_analyzer',
+    'DuplicateCheckerService': 'duplicate_checker',
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .main_research import GalileoResearchTool
+    from .news_scraper import NewsScraperService
+    from .ai_analyzer import AIAnalyzerService
+    from .duplicate_checker import DuplicateCheckerService
+
+
+def __getattr__(name: str) -> Any:
+    """Lädt einen Export beim ersten Zugriff"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Die Module importieren sich gegenseitig flach (wie beim Aufruf als Skript)
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    if package_dir not in sys.path:
+        sys.path.insert(0, package_dir)
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Weitere Zugriffe ohne __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
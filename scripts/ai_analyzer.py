@@ -4,34 +4,206 @@ AI Analyzer Service
 Analysiert Artikel auf Galileo-Relevanz und visuelles Potenzial
 """
 
+import hashlib
 import os
 import json
-from typing import Dict, Any, List, Optional
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 import random
 
+from analysis_cache import AnalysisCache
+from article_store import SeenArticleStore
+from llm_client import DeadlineExceeded, LLMClient
+from records import NOT_ANALYZED, Source, Storyline, Topic
+from run_metrics import RunMetrics
+from storage import json_default
+from topic_store import topic_id
+
+if TYPE_CHECKING:
+    from local_analyzer import LocalAnalyzerPool
+
+
+# Version des Analyse-Prompts (Teil des Cache-Schlüssels - bei Änderungen
+# am Prompt hochzählen, damit alte Ergebnisse nicht wiederverwendet werden)
+PROMPT_VERSION = 'v1'
+
+# Mindest-Relevanz, ab der ein Artikel überhaupt als Thema gilt
+MIN_RELEVANCE = 4
+
+# Maximale Länge der Zusammenfassung im Prompt
+SUMMARY_PROMPT_CHARS = 1000
+
+# Erwartete Antwortlänge pro Artikel (für max_tokens und das Token-Limit)
+RESPONSE_TOKENS_PER_ARTICLE = 400
+
+BATCH_PROMPT_HEADER = '''Analysiere folgende Artikel für die TV-Sendung Galileo.
+
+Bewerte jeden Artikel:
+1. Galileo-Relevanz (1-10) als "galileo_relevance"
+2. Schlagwörter als "tags" (aus: {tags})
+3. Visuelles Potenzial (1-5 Sterne) als "visualRating"
+4. Warum ist das Thema visuell stark/schwach? als "visualReason"
+5. Kurze Zusammenfassung als "summary"
+6. Story-Vorschlag (5-20 Min) als "storyline" mit duration, structure,
+   locations, protagonists und dramaticArc
+
+Galileo-Kriterien:
+- Wissensvermittlung unterhaltsam
+- Visuell filmbar
+- Gesellschaftlich relevant oder unterhaltsam
+- Für breites Publikum interessant
+
+Antworte im JSON-Format: {{"results": [{{"index": <Artikelnummer>, ...}}]}}
+'''
+
+
+# Antwort in einem Markdown-Codeblock (```json ... ```)
+JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(.*?)```', re.DOTALL | re.IGNORECASE)
+
+
+def parse_model_json(content: str) -> Any:
+    """
+    Liest das JSON einer Modell-Antwort
+
+    Ohne JSON-Modus verpacken Modelle das JSON gern in einen Codeblock
+    oder schreiben einen Satz davor; verwendet wird das erste JSON-Objekt
+    bzw. die erste JSON-Liste.
+
+    Args:
+        content: Rohe Modell-Antwort
+
+    Returns:
+        Geparstes JSON
+
+    Raises:
+        ValueError: Antwort enthält kein gültiges JSON
+    """
+    match = JSON_FENCE_RE.search(content)
+    text = match.group(1) if match else content
+    decoder = json.JSONDecoder()
+    for start, char in enumerate(text):
+        if char in '{[':
+            try:
+                return decoder.raw_decode(text, start)[0]
+            except ValueError:
+                continue
+    raise ValueError("Modell-Antwort enthält kein JSON")
+
+
+# Vorberechnete Textbausteine des Mock-Modus (einmal pro Prozess)
+MOCK_SUMMARY_PREFIXES = (
+    "Dieses Thema ist hochaktuell und visuell stark umsetzbar. ",
+    "Perfekt für Galileo: Wissenschaft trifft Entertainment. ",
+    "Gesellschaftlich relevantes Thema mit großem visuellen Potenzial. "
+)
+
+MOCK_VISUAL_REASONS_HIGH = (
+    "Spektakuläre visuelle Elemente, gut filmbare Experimente, beeindruckende Locations",
+    "Physisch beobachtbare Prozesse, Action-reich, visuell faszinierend",
+    "Hervorragende Dreh-Möglichkeiten, spektakuläre Settings, visuell einprägsam"
+)
+
+MOCK_VISUAL_REASONS_LOW = (
+    "Begrenzte visuelle Möglichkeiten, hauptsächlich Interviews",
+    "Abstrakte Thematik, schwer zu visualisieren",
+    "Visuell eher schwach, benötigt kreative Umsetzung"
+)
+
+# Storyline-Gerüste (unveränderlich) werden von allen Themen gemeinsam genutzt
+MOCK_STORYLINES = tuple(
+    Storyline(
+        duration=duration,
+        structure=(
+            "Intro: Thema vorstellen (2 Min)",
+            "Hauptteil: Vor Ort Reportage (6-10 Min)",
+            "Experteneinschätzung (2-3 Min)",
+            "Finale: Fazit und Ausblick (2 Min)"
+        ),
+        locations=(
+            "Hauptdrehort",
+            "Experteninterview-Location"
+        ),
+        protagonists=(
+            "Protagonist/Betroffener",
+            "Experte zum Thema",
+            "Galileo Reporter"
+        ),
+        dramatic_arc="Von der Neugier zur Erkenntnis - eine spannende Entdeckungsreise"
+    )
+    for duration in ("8-12 Minuten", "10-15 Minuten", "12-18 Minuten")
+)
+
 
 class AIAnalyzerService:
     """Service für AI-basierte Analyse von Artikeln"""
 
-    def __init__(self):
+    def __init__(self, max_batch_size: int = 10, max_batch_tokens: int = 4000,
+                 analysis_cache: Optional[AnalysisCache] = None, max_concurrency: int = 4,
+                 requests_per_minute: int = 60, tokens_per_minute: int = 90000,
+                 run_deadline: Optional[float] = 900.0, metrics: Optional[RunMetrics] = None,
+                 seed: Optional[int] = None, local_pool: Optional['LocalAnalyzerPool'] = None):
         """
         Initialisiert den AI-Analyzer
 
-        HINWEIS: In Produktion würde hier die OpenAI API oder Claude API
-        verwendet werden. Erfordert API-Key in Umgebungsvariable:
+        Verwendet die OpenAI API oder Claude API, wenn ein API-Key in einer
+        Umgebungsvariable gesetzt ist:
         - OPENAI_API_KEY oder
         - ANTHROPIC_API_KEY
+        Optional: GALILEO_LLM_MODEL sowie OPENAI_BASE_URL / ANTHROPIC_BASE_URL
+        (z.B. für einen lokalen Stub-Server). Mit local_pool wird ohne API
+        lokal auf allen Kernen bewertet.
+
+        Args:
+            max_batch_size: Maximale Anzahl Artikel pro Batch-Prompt
+            max_batch_tokens: Token-Budget pro Batch-Prompt
+            analysis_cache: Cache für Analyseergebnisse (None = kein Cache)
+            max_concurrency: Maximale Anzahl parallel laufender Batches
+            requests_per_minute: Request-Limit der API
+            tokens_per_minute: Token-Limit der API
+            run_deadline: Zeitlimit für analyze_batch in Sekunden (None = keins)
+            metrics: Messwerte des Laufs (Latenz pro Artikel und Batch)
+            seed: Seed des Mock-Modus (None = zufällig, gleicher Seed =
+                reproduzierbare Ergebnisse)
+            local_pool: Lokales Modell im Prozess-Pool statt API bzw. Mock
         """
-        self.api_key = os.getenv('OPENAI_API_KEY') or os.getenv('ANTHROPIC_API_KEY')
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_batch_tokens = max_batch_tokens
+        self.analysis_cache = analysis_cache
+        self.max_concurrency = max(1, max_concurrency)
+        self.run_deadline = run_deadline
+        self.metrics = metrics
+        self.seed = seed if seed is not None else random.getrandbits(63)
+        self.rng = random.Random(self.seed)
+        self.client: Optional[LLMClient] = None
+        self.local_pool = local_pool
+
+        if os.getenv('OPENAI_API_KEY'):
+            provider, self.api_key = 'openai', os.getenv('OPENAI_API_KEY')
+        else:
+            provider, self.api_key = 'anthropic', os.getenv('ANTHROPIC_API_KEY')
 
-        if not self.api_key:
+        if self.local_pool:
+            print(f"      🖥️  Lokale Analyse: {self.local_pool.name} ({self.local_pool.workers} Prozesse)")
+            self.mock_mode = False
+            self.model = self.local_pool.name
+        elif not self.api_key:
             print("      ⚠️  Kein API-Key gefunden - verwende Mock-Modus")
             self.mock_mode = True
+            self.model = 'mock'
         else:
             self.mock_mode = False
-            # In Produktion: OpenAI/Claude Client initialisieren
-            # from openai import OpenAI
-            # self.client = OpenAI(api_key=self.api_key)
+            self.client = LLMClient(
+                provider,
+                self.api_key,
+                model=os.getenv('GALILEO_LLM_MODEL'),
+                base_url=os.getenv(f'{provider.upper()}_BASE_URL'),
+                max_concurrency=self.max_concurrency,
+                requests_per_minute=requests_per_minute,
+                tokens_per_minute=tokens_per_minute
+            )
+            self.model = self.client.model
 
         # Galileo-Schlagwörter
         self.available_tags = [
@@ -52,6 +224,8 @@ class AIAnalyzerService:
             "Spektakulär"
         ]
 
+        self._mock_tag_table = self._build_mock_tag_table()
+
         # Kriterien für visuelle Stärke
         self.visual_criteria = {
             'high': [
@@ -81,10 +255,384 @@ class AIAnalyzerService:
         Returns:
             Analysiertes Thema oder None wenn nicht relevant
         """
+        fields = self._cache_lookup(article)
+        if fields is None:
+            fields = self._analyze_fields(article)
+
+        return self._build_topic(article, fields)
+
+    def _analyze_fields(self, article: Dict[str, Any], deadline: Optional[float] = None) -> Dict[str, Any]:
+        """Ermittelt die Analysefelder eines Artikels (ohne Cache-Abfrage)"""
         if self.mock_mode:
-            return self._mock_analysis(article)
+            fields = self._mock_fields(article)
+        elif self.local_pool:
+            fields = self.local_pool.analyze([article])[0]
         else:
-            return self._real_ai_analysis(article)
+            fields = self._real_ai_fields(article, deadline)
+        self._cache_store(article, fields)
+        return fields
+
+    def _cache_lookup(self, article: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Liefert gecachte Analysefelder eines Artikels (oder None)"""
+        if not self.analysis_cache:
+            return None
+        key = self.analysis_cache.make_key(article, PROMPT_VERSION, self.model)
+        return self.analysis_cache.get(key)
+
+    def _cache_store(self, article: Dict[str, Any], fields: Dict[str, Any]) -> None:
+        """Legt die Analysefelder eines Artikels im Cache ab"""
+        if not self.analysis_cache:
+            return
+        key = self.analysis_cache.make_key(article, PROMPT_VERSION, self.model)
+        self.analysis_cache.put(key, fields)
+
+    def start_deadline(self) -> Optional[float]:
+        """
+        Berechnet das Zeitlimit eines Laufs ab jetzt
+
+        Returns:
+            Spätester Zeitpunkt (time.monotonic) oder None ohne Zeitlimit
+        """
+        return time.monotonic() + self.run_deadline if self.run_deadline else None
+
+    def analyze_batch(self, articles: List[Dict[str, Any]],
+                      max_batch_tokens: Optional[int] = None,
+                      deadline: Optional[float] = None) -> List[Any]:
+        """
+        Analysiert mehrere Artikel mit möglichst wenigen Modell-Aufrufen
+
+        Die Artikel werden bis zum Token-Budget in einen gemeinsamen Prompt
+        gepackt, die Antwort wird wieder den einzelnen Artikeln zugeordnet.
+        Fehlt ein Artikel in der Antwort oder schlägt ein ganzer Batch fehl,
+        wird der Artikel einzeln nachanalysiert.
+
+        Args:
+            articles: Liste von Artikel-Daten
+            max_batch_tokens: Token-Budget pro Batch (Default: self.max_batch_tokens)
+            deadline: Gemeinsames Zeitlimit mehrerer Aufrufe, z.B. aller Batches
+                eines Streaming-Laufs (Default: start_deadline() dieses Aufrufs)
+
+        Returns:
+            Analyseergebnisse in Eingabe-Reihenfolge (None = nicht relevant,
+            NOT_ANALYZED = wegen Zeitlimit oder Fehler nicht analysiert)
+        """
+        results: List[Any] = [NOT_ANALYZED] * len(articles)
+        budget = max_batch_tokens or self.max_batch_tokens
+
+        # Cache-Treffer brauchen keinen Modell-Aufruf
+        pending = []
+        for index, article in enumerate(articles):
+            fields = self._cache_lookup(article)
+            if fields is None:
+                pending.append(index)
+            else:
+                results[index] = self._build_topic(article, fields)
+
+        pending_articles = [articles[i] for i in pending]
+        if self.local_pool:
+            self._analyze_local(pending_articles, pending, results)
+            return results
+
+        batches = [
+            [pending[i] for i in batch_indices]
+            for batch_indices in self._pack_batches(pending_articles, budget)
+        ]
+        if not batches:
+            return results
+
+        if deadline is None:
+            deadline = self.start_deadline()
+        workers = min(self.max_concurrency, len(batches))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='analyze') as executor:
+            futures = [
+                executor.submit(self._run_batch, [articles[i] for i in indices], deadline)
+                for indices in batches
+            ]
+            skipped = 0
+            for indices, future in zip(batches, futures):
+                topics = future.result()
+                if topics is None:
+                    skipped += len(indices)
+                    continue
+                for index, topic in zip(indices, topics):
+                    results[index] = topic
+
+        if skipped:
+            print(f"      ⏱️  Zeitlimit erreicht - {skipped} Artikel nicht analysiert")
+            if self.metrics:
+                self.metrics.increment('articles_skipped', skipped)
+        if self.client and self.client.retries:
+            print(f"      ℹ️  {self.client.retries} wiederholte API-Anfragen (429/5xx)")
+
+        return results
+
+    def _analyze_local(self, articles: List[Dict[str, Any]], indices: List[int],
+                       results: List[Optional[Dict[str, Any]]]) -> None:
+        """
+        Bewertet Artikel mit dem lokalen Modell (ein Aufruf, Blöcke auf alle Kerne)
+
+        Args:
+            articles: Noch nicht analysierte Artikel
+            indices: Positionen der Artikel in results
+            results: Ergebnisliste (wird ergänzt)
+        """
+        if not articles:
+            return
+
+        started = time.perf_counter()
+        for index, article, fields in zip(indices, articles, self.local_pool.analyze(articles)):
+            self._cache_store(article, fields)
+            results[index] = self._build_topic(article, fields)
+
+        if self.metrics:
+            elapsed = time.perf_counter() - started
+            self.metrics.observe('batch', elapsed)
+            for _ in articles:
+                self.metrics.observe('article', elapsed / len(articles))
+
+    def close(self) -> None:
+        """Beendet die Worker des lokalen Modells (sofern gestartet)"""
+        if self.local_pool:
+            self.local_pool.close()
+
+    def _run_batch(self, batch: List[Dict[str, Any]],
+                   deadline: Optional[float]) -> Optional[List[Optional[Dict[str, Any]]]]:
+        """
+        Analysiert einen Batch, Fehler werden pro Batch isoliert
+
+        Args:
+            batch: Artikel des Batches
+            deadline: Spätester Zeitpunkt (time.monotonic)
+
+        Returns:
+            Analyseergebnisse in Batch-Reihenfolge oder None bei Zeitüberschreitung
+        """
+        if deadline is not None and time.monotonic() >= deadline:
+            return None
+
+        started = time.perf_counter()
+        try:
+            return self._analyze_packed(batch, deadline)
+        except DeadlineExceeded:
+            return None
+        except Exception as e:
+            print(f"      ⚠️  Batch-Analyse fehlgeschlagen ({str(e)}) - analysiere einzeln")
+            if self.metrics:
+                self.metrics.increment('batches_failed')
+            return [self._analyze_single_safe(article, deadline) for article in batch]
+        finally:
+            if self.metrics:
+                elapsed = time.perf_counter() - started
+                self.metrics.observe('batch', elapsed)
+                # Ein Aufruf für den ganzen Batch: Latenz anteilig pro Artikel
+                for _ in batch:
+                    self.metrics.observe('article', elapsed / len(batch))
+
+    def _pack_batches(self, articles: List[Dict[str, Any]], budget: int) -> List[List[int]]:
+        """
+        Teilt Artikel anhand des Token-Budgets in Batches auf
+
+        Args:
+            articles: Liste von Artikel-Daten
+            budget: Token-Budget pro Batch
+
+        Returns:
+            Liste von Batches (Indizes in die Artikel-Liste)
+        """
+        batches: List[List[int]] = []
+        current: List[int] = []
+        header_cost = self._estimate_tokens(self._build_batch_prompt([]))
+        used = header_cost
+
+        for index, article in enumerate(articles):
+            cost = self._estimate_tokens(self._format_article(index, article))
+            full = len(current) >= self.max_batch_size or used + cost > budget
+            if current and full:
+                batches.append(current)
+                current = []
+                used = header_cost
+            current.append(index)
+            used += cost
+
+        if current:
+            batches.append(current)
+        return batches
+
+    def _estimate_tokens(self, text: str) -> int:
+        """Grobe Token-Schätzung (ca. 4 Zeichen pro Token)"""
+        return len(text) // 4 + 1
+
+    def _format_article(self, index: int, article: Dict[str, Any]) -> str:
+        """Formatiert einen Artikel als Abschnitt im Batch-Prompt"""
+        return (
+            f"[{index}]\n"
+            f"Titel: {article.get('title', '')}\n"
+            f"Zusammenfassung: {article.get('summary', '')[:SUMMARY_PROMPT_CHARS]}\n"
+        )
+
+    def _build_batch_prompt(self, batch: List[Dict[str, Any]]) -> str:
+        """
+        Baut den gemeinsamen Prompt für einen Batch
+
+        Args:
+            batch: Artikel des Batches
+
+        Returns:
+            Prompt-Text
+        """
+        header = BATCH_PROMPT_HEADER.format(tags=', '.join(self.available_tags))
+        articles = "\n".join(self._format_article(i, article) for i, article in enumerate(batch))
+        return f"{header}\n{articles}"
+
+    def _analyze_packed(self, batch: List[Dict[str, Any]],
+                        deadline: Optional[float] = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        Analysiert einen Batch mit einem Modell-Aufruf
+
+        Args:
+            batch: Artikel des Batches
+            deadline: Spätester Zeitpunkt (time.monotonic)
+
+        Returns:
+            Analyseergebnisse in Batch-Reihenfolge
+        """
+        prompt = self._build_batch_prompt(batch)
+        content = self._complete_batch(prompt, batch, deadline)
+        parsed = self._parse_batch_response(content, len(batch))
+
+        topics = []
+        for index, article in enumerate(batch):
+            fields = parsed.get(index)
+            if fields is None:
+                # Teilausfall: Artikel fehlt oder ist ungültig in der Antwort
+                topics.append(self._analyze_single_safe(article, deadline))
+            else:
+                self._cache_store(article, fields)
+                topics.append(self._build_topic(article, fields))
+        return topics
+
+    def _complete_batch(self, prompt: str, batch: List[Dict[str, Any]],
+                        deadline: Optional[float] = None) -> str:
+        """
+        Schickt den Batch-Prompt an das Modell
+
+        Args:
+            prompt: Batch-Prompt
+            batch: Artikel des Batches (für den Mock-Modus)
+            deadline: Spätester Zeitpunkt (time.monotonic)
+
+        Returns:
+            Rohe Modell-Antwort (JSON)
+        """
+        if self.mock_mode:
+            return self._mock_batch_response(batch)
+
+        return self.client.complete(
+            prompt,
+            max_tokens=RESPONSE_TOKENS_PER_ARTICLE * len(batch),
+            deadline=deadline
+        )
+
+    def _parse_batch_response(self, content: str, batch_size: int) -> Dict[int, Dict[str, Any]]:
+        """
+        Ordnet die Modell-Antwort wieder den Artikeln zu
+
+        Args:
+            content: Rohe Modell-Antwort (JSON, ggf. im Codeblock)
+            batch_size: Anzahl Artikel im Batch
+
+        Returns:
+            Dict Batch-Index -> validierte Analysefelder
+        """
+        data = parse_model_json(content)
+        items = data.get('results', []) if isinstance(data, dict) else data
+
+        parsed = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            index = item.get('index')
+            if not isinstance(index, int) or not 0 <= index < batch_size:
+                continue
+            fields = self._validate_fields(item)
+            if fields is not None:
+                parsed[index] = fields
+        return parsed
+
+    def _validate_fields(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Prüft und bereinigt die Analysefelder eines Artikels
+
+        Args:
+            item: Analysefelder aus der Modell-Antwort
+
+        Returns:
+            Bereinigte Felder oder None wenn unbrauchbar
+        """
+        try:
+            relevance = int(item['galileo_relevance'])
+            visual_rating = int(item.get('visualRating', 3))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        tags = [tag for tag in item.get('tags', []) if tag in self.available_tags]
+        storyline = item.get('storyline')
+
+        return {
+            'galileo_relevance': max(1, min(10, relevance)),
+            'tags': tags,
+            'summary': str(item.get('summary', '')),
+            'visualRating': max(1, min(5, visual_rating)),
+            'visualReason': str(item.get('visualReason', '')),
+            'storyline': storyline if isinstance(storyline, dict) else None
+        }
+
+    def _analyze_single_safe(self, article: Dict[str, Any], deadline: Optional[float] = None) -> Any:
+        """Einzelanalyse, Fehler führen zu NOT_ANALYZED statt zum Abbruch"""
+        try:
+            return self._build_topic(article, self._analyze_fields(article, deadline))
+        except Exception as e:
+            print(f"      ✗ Analyse fehlgeschlagen: {article.get('title', '')[:60]} ({str(e)})")
+            if self.metrics:
+                self.metrics.increment('articles_failed')
+            return NOT_ANALYZED
+
+    def _build_topic(self, article: Dict[str, Any], fields: Dict[str, Any]) -> Optional[Topic]:
+        """
+        Setzt aus Artikel und Analysefeldern das Thema zusammen
+
+        Args:
+            article: Artikel-Daten
+            fields: Analysefelder (Relevanz, Tags, Bewertung, Storyline)
+
+        Returns:
+            Thema oder None wenn nicht relevant genug
+        """
+        if fields['galileo_relevance'] < MIN_RELEVANCE:
+            return None  # Nicht relevant genug
+
+        return Topic(
+            id=topic_id(article),
+            title=article.get('title', 'Unbekanntes Thema'),
+            tags=fields['tags'],
+            summary=fields['summary'],
+            visual_rating=fields['visualRating'],
+            visual_reason=fields['visualReason'],
+            credibility=article.get('credibility', 'yellow'),
+            # Zusammengefasste Meldungen bringen bereits alle Quellen mit
+            sources=article.get('sources') or [
+                Source(
+                    name=article.get('source', 'Unbekannte Quelle'),
+                    url=article.get('link', '#'),
+                    credibility=article.get('credibility', 'yellow')
+                )
+            ],
+            is_duplicate=False,  # Wird später vom DuplicateChecker gesetzt
+            duplicate_info='Noch nicht geprüft',
+            storyline=fields['storyline'] or self._generate_storyline(article),
+            date=article.get('published', '2025-12-11'),
+            galileo_relevance=fields['galileo_relevance']
+        )
 
     def _mock_analysis(self, article: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -96,39 +644,88 @@ class AIAnalyzerService:
         Returns:
             Mock-Analyseergebnis
         """
-        # Zufällige Relevanz (70% relevant)
-        relevance = random.randint(1, 10)
-        if relevance < 4:
-            return None  # Nicht relevant genug
+        return self._build_topic(article, self._mock_fields(article))
+
+    def _mock_fields(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Erzeugt zufällige Analysefelder für den Mock-Modus
 
-        # Generiere Mock-Daten
-        num_tags = random.randint(2, 5)
-        tags = random.sample(self.available_tags, num_tags)
-        visual_rating = random.randint(3, 5)
+        Alle Zufallswerte stammen aus einem Hash über Seed und Artikel-Schlüssel:
+        gleicher Seed, gleiche Ergebnisse - unabhängig von Reihenfolge,
+        Batch-Aufteilung und Threads.
 
-        topic = {
-            'id': random.randint(1000, 9999),
-            'title': article.get('title', 'Unbekanntes Thema'),
-            'tags': tags,
-            'summary': self._generate_mock_summary(article),
+        Args:
+            article: Artikel-Daten
+
+        Returns:
+            Analysefelder wie aus einer Modell-Antwort
+        """
+        draw = self._mock_draw(article)
+
+        # Zufällige Relevanz 1-10
+        relevance = draw % 10 + 1
+        draw //= 10
+        visual_rating = draw % 3 + 3
+        draw //= 3
+        tags = self._mock_tag_table[draw % len(self._mock_tag_table)]
+        draw //= len(self._mock_tag_table)
+
+        return {
+            'galileo_relevance': relevance,
+            'tags': list(tags),
+            'summary': self._generate_mock_summary(article, draw % 3),
             'visualRating': visual_rating,
-            'visualReason': self._generate_visual_reason(visual_rating),
-            'credibility': article.get('credibility', 'yellow'),
-            'sources': [
-                {
-                    'name': article.get('source', 'Unbekannte Quelle'),
-                    'url': article.get('link', '#'),
-                    'credibility': article.get('credibility', 'yellow')
-                }
-            ],
-            'isDuplicate': False,  # Wird später vom DuplicateChecker gesetzt
-            'duplicateInfo': 'Noch nicht geprüft',
-            'storyline': self._generate_storyline(article),
-            'date': article.get('published', '2025-12-11'),
-            'galileo_relevance': relevance
+            'visualReason': self._generate_visual_reason(visual_rating, draw // 3 % 3),
+            'storyline': MOCK_STORYLINES[draw // 9 % len(MOCK_STORYLINES)]
         }
 
-        return topic
+    def mock_analyses(self, articles: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Erzeugt Mock-Analysen direkt, ohne Prompt, JSON und Threads (Lasttests)
+
+        Args:
+            articles: Liste von Artikel-Daten
+
+        Returns:
+            Analyseergebnisse in Eingabe-Reihenfolge (None = nicht relevant)
+        """
+        return [self._build_topic(article, self._mock_fields(article)) for article in articles]
+
+    def _mock_draw(self, article: Dict[str, Any]) -> int:
+        """64 reproduzierbare Zufallsbits pro Artikel (Seed + Artikel-Schlüssel)"""
+        key = f"{self.seed}|{SeenArticleStore.article_key(article)}"
+        return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'big')
+
+    def _build_mock_tag_table(self, size: int = 256) -> List[Tuple[str, ...]]:
+        """
+        Berechnet einmalig die Schlagwort-Kombinationen des Mock-Modus
+
+        Args:
+            size: Anzahl Kombinationen
+
+        Returns:
+            Kombinationen aus 2-5 Schlagwörtern
+        """
+        return [
+            tuple(self.rng.sample(self.available_tags, self.rng.randint(2, 5)))
+            for _ in range(size)
+        ]
+
+    def _mock_batch_response(self, batch: List[Dict[str, Any]]) -> str:
+        """
+        Erzeugt eine Batch-Antwort im selben Format wie das Modell
+
+        Args:
+            batch: Artikel des Batches
+
+        Returns:
+            JSON-Antwort mit einem Ergebnis pro Artikel
+        """
+        results = [
+            dict(self._mock_fields(article), index=index)
+            for index, article in enumerate(batch)
+        ]
+        return json.dumps({'results': results}, ensure_ascii=False, default=json_default)
 
     def _real_ai_analysis(self, article: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -140,89 +737,45 @@ class AIAnalyzerService:
         Returns:
             AI-Analyseergebnis
         """
-        # HINWEIS: Implementierung für Produktion
-        #
-        # prompt = f'''
-        # Analysiere folgenden Artikel für die TV-Sendung Galileo:
-        #
-        # Titel: {article['title']}
-        # Zusammenfassung: {article['summary']}
-        #
-        # Bewerte:
-        # 1. Galileo-Relevanz (1-10)
-        # 2. Schlagwörter (aus: {', '.join(self.available_tags)})
-        # 3. Visuelles Potenzial (1-5 Sterne)
-        # 4. Warum ist das Thema visuell stark/schwach?
-        # 5. Story-Vorschlag (5-20 Min)
-        #
-        # Galileo-Kriterien:
-        # - Wissensvermittlung unterhaltsam
-        # - Visuell filmbar
-        # - Gesellschaftlich relevant oder unterhaltsam
-        # - Für breites Publikum interessant
-        #
-        # Antworte im JSON-Format.
-        # '''
-        #
-        # response = self.client.chat.completions.create(
-        #     model="gpt-4",
-        #     messages=[{"role": "user", "content": prompt}],
-        #     response_format={"type": "json_object"}
-        # )
-        #
-        # return json.loads(response.choices[0].message.content)
-
-        # Fallback auf Mock wenn API nicht verfügbar
-        return self._mock_analysis(article)
-
-    def _generate_mock_summary(self, article: Dict[str, Any]) -> str:
+        return self._build_topic(article, self._real_ai_fields(article))
+
+    def _real_ai_fields(self, article: Dict[str, Any], deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Fragt die Analysefelder eines Artikels beim Modell an
+
+        Verwendet denselben Prompt wie die Batch-Analyse mit nur einem Artikel.
+
+        Args:
+            article: Artikel-Daten
+            deadline: Spätester Zeitpunkt (time.monotonic)
+
+        Returns:
+            Validierte Analysefelder
+
+        Raises:
+            LLMError: Bei API-Fehlern
+            ValueError: Bei unbrauchbarer Modell-Antwort
+        """
+        prompt = self._build_batch_prompt([article])
+        content = self.client.complete(prompt, max_tokens=RESPONSE_TOKENS_PER_ARTICLE, deadline=deadline)
+
+        fields = self._parse_batch_response(content, 1).get(0)
+        if fields is None:
+            raise ValueError("Ungültige Modell-Antwort")
+        return fields
+
+    def _generate_mock_summary(self, article: Dict[str, Any], choice: int = 0) -> str:
         """Generiert Mock-Zusammenfassung"""
-        templates = [
-            f"Dieses Thema ist hochaktuell und visuell stark umsetzbar. {article.get('summary', '')[:200]}",
-            f"Perfekt für Galileo: Wissenschaft trifft Entertainment. {article.get('summary', '')[:200]}",
-            f"Gesellschaftlich relevantes Thema mit großem visuellen Potenzial. {article.get('summary', '')[:200]}"
-        ]
-        return random.choice(templates)
+        return MOCK_SUMMARY_PREFIXES[choice % len(MOCK_SUMMARY_PREFIXES)] + article.get('summary', '')[:200]
 
-    def _generate_visual_reason(self, rating: int) -> str:
+    def _generate_visual_reason(self, rating: int, choice: int = 0) -> str:
         """Generiert Begründung für visuelle Bewertung"""
-        if rating >= 4:
-            reasons = [
-                "Spektakuläre visuelle Elemente, gut filmbare Experimente, beeindruckende Locations",
-                "Physisch beobachtbare Prozesse, Action-reich, visuell faszinierend",
-                "Hervorragende Dreh-Möglichkeiten, spektakuläre Settings, visuell einprägsam"
-            ]
-        else:
-            reasons = [
-                "Begrenzte visuelle Möglichkeiten, hauptsächlich Interviews",
-                "Abstrakte Thematik, schwer zu visualisieren",
-                "Visuell eher schwach, benötigt kreative Umsetzung"
-            ]
-        return random.choice(reasons)
+        reasons = MOCK_VISUAL_REASONS_HIGH if rating >= 4 else MOCK_VISUAL_REASONS_LOW
+        return reasons[choice % len(reasons)]
 
-    def _generate_storyline(self, article: Dict[str, Any]) -> Dict[str, Any]:
-        """Generiert Storyline-Vorschlag"""
-        durations = ["8-12 Minuten", "10-15 Minuten", "12-18 Minuten"]
-
-        return {
-            'duration': random.choice(durations),
-            'structure': [
-                "Intro: Thema vorstellen (2 Min)",
-                "Hauptteil: Vor Ort Reportage (6-10 Min)",
-                "Experteneinschätzung (2-3 Min)",
-                "Finale: Fazit und Ausblick (2 Min)"
-            ],
-            'locations': [
-                "Hauptdrehort",
-                "Experteninterview-Location"
-            ],
-            'protagonists': [
-                "Protagonist/Betroffener",
-                "Experte zum Thema",
-                "Galileo Reporter"
-            ],
-            'dramaticArc': "Von der Neugier zur Erkenntnis - eine spannende Entdeckungsreise"
-        }
+    def _generate_storyline(self, article: Dict[str, Any]) -> Storyline:
+        """Generiert Storyline-Vorschlag (gemeinsam genutztes Gerüst, nicht verändern)"""
+        return MOCK_STORYLINES[self._mock_draw(article) % len(MOCK_STORYLINES)]
 
 
 def test_analyzer():
@@ -242,7 +795,7 @@ def test_analyzer():
 
     if result:
         print("\n✅ Analyse erfolgreich:")
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        print(json.dumps(result, indent=2, ensure_ascii=False, default=json_default))
     else:
         print("\n❌ Artikel nicht relevant genug")
 
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Analysis Cache
+Inhaltsadressierter Cache für AI-Analyseergebnisse
+"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+from storage import atomic_write_json, cache_path, load_json
+
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+class AnalysisCache:
+    """Disk-Cache für Analysefelder mit TTL und LRU-Verdrängung"""
+
+    def __init__(self, path: Optional[str] = None, ttl_days: int = 30, max_entries: int = 5000):
+        """
+        Initialisiert den Analyse-Cache
+
+        Args:
+            path: Pfad zur Cache-Datei (Default: .cache/analysis_cache.json)
+            ttl_days: Gültigkeit eines Eintrags in Tagen
+            max_entries: Maximale Anzahl Einträge (älteste Zugriffe fliegen raus)
+        """
+        self.path = path or cache_path('analysis_cache.json')
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        # Reihenfolge = Zugriffsreihenfolge (vorne am längsten unbenutzt)
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict(
+            load_json(self.path, {}).get('entries', [])
+        )
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(article: Dict[str, Any], prompt_version: str, model: str) -> str:
+        """
+        Berechnet den Cache-Schlüssel eines Artikels
+
+        Gleiche Meldungen verschiedener Quellen (z.B. Agenturtexte bei
+        Tagesschau, Spiegel und Zeit) landen so auf demselben Eintrag.
+
+        Args:
+            article: Artikel-Daten
+            prompt_version: Version des Analyse-Prompts
+            model: Verwendetes Modell
+
+        Returns:
+            SHA256-Hexdigest
+        """
+        title = WHITESPACE_RE.sub(' ', article.get('title', '')).strip().lower()
+        summary = WHITESPACE_RE.sub(' ', article.get('summary', '')).strip().lower()
+        content = '\x1f'.join((model, prompt_version, title, summary))
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Liefert zwischengespeicherte Analysefelder
+
+        Args:
+            key: Cache-Schlüssel
+
+        Returns:
+            Analysefelder oder None (nicht vorhanden oder abgelaufen)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.time() - entry['created'] > self.ttl_seconds:
+                del self._entries[key]
+                self._dirty = True
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._dirty = True
+            self.hits += 1
+            return entry['fields']
+
+    def put(self, key: str, fields: Dict[str, Any]) -> None:
+        """
+        Speichert Analysefelder
+
+        Args:
+            key: Cache-Schlüssel
+            fields: Analysefelder
+        """
+        with self._lock:
+            self._entries[key] = {'created': time.time(), 'fields': fields}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def hit_rate(self) -> float:
+        """Anteil der Cache-Treffer (0.0 - 1.0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def save(self) -> None:
+        """Schreibt den Cache auf Platte (nur wenn sich etwas geändert hat)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            atomic_write_json(self.path, {'entries': list(self._entries.items())})
+            self._dirty = False
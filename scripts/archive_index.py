@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Archive Index
+Invertierter Index (Schlüsselwort -> Archiv-Einträge) für den Duplikat-Check
+"""
+
+from collections import Counter
+from typing import Dict, Any, Iterable, List, Set
+
+from normalizer import normalize_word
+
+
+class ArchiveIndex:
+    """In-Memory-Index über bereits behandelte Galileo-Themen"""
+
+    def __init__(self, entries: Iterable[Dict[str, Any]] = ()):
+        """
+        Baut den Index einmalig auf
+
+        Args:
+            entries: Archiv-Einträge mit 'id', 'title' und 'keywords'
+        """
+        self._entries: Dict[Any, Dict[str, Any]] = {}
+        self._postings: Dict[str, Set[Any]] = {}
+
+        for entry in entries:
+            self.add(entry)
+
+    @classmethod
+    def from_titles(cls, titles: Iterable[str]) -> 'ArchiveIndex':
+        """
+        Erzeugt einen Index aus einfachen Themen-Titeln (z.B. Mock-Archiv)
+
+        Args:
+            titles: Titel, Schlüsselwörter durch Leerzeichen getrennt
+                (werden wie die Themen-Titel normalisiert)
+
+        Returns:
+            Fertiger Index
+        """
+        return cls(
+            {'id': number, 'title': title, 'keywords': [normalize_word(word) for word in title.split()]}
+            for number, title in enumerate(titles, 1)
+        )
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        """
+        Nimmt einen Archiv-Eintrag in den Index auf
+
+        Args:
+            entry: Archiv-Eintrag mit 'id', 'title' und 'keywords'
+        """
+        entry_id = entry['id']
+        if entry_id in self._entries:
+            self.remove(entry_id)
+
+        keywords = frozenset(entry['keywords'])
+        self._entries[entry_id] = dict(entry, keywords=keywords)
+        for keyword in keywords:
+            self._postings.setdefault(keyword, set()).add(entry_id)
+
+    def remove(self, entry_id: Any) -> None:
+        """
+        Entfernt einen Archiv-Eintrag aus dem Index
+
+        Args:
+            entry_id: ID des Eintrags
+        """
+        entry = self._entries.pop(entry_id, None)
+        if entry is None:
+            return
+        for keyword in entry['keywords']:
+            postings = self._postings[keyword]
+            postings.discard(entry_id)
+            if not postings:
+                del self._postings[keyword]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def revision(self) -> None:
+        """In-Memory-Index hat keinen persistenten Stand"""
+        return None
+
+    def episodes(self) -> List[Dict[str, Any]]:
+        """
+        Liefert alle Einträge (z.B. für den Aufbau abgeleiteter Indizes)
+
+        Returns:
+            Einträge mit 'id' und 'title'
+        """
+        return [{'id': entry['id'], 'title': entry['title']} for entry in self._entries.values()]
+
+    def match(self, keywords: Iterable[str], min_common: int = 2) -> List[Dict[str, Any]]:
+        """
+        Findet Archiv-Einträge mit genügend gemeinsamen Schlüsselwörtern
+
+        Es werden nur die Einträge angefasst, die mindestens ein Schlüsselwort
+        mit der Anfrage teilen.
+
+        Args:
+            keywords: Schlüsselwörter des Themas
+            min_common: Mindestanzahl gemeinsamer Schlüsselwörter
+
+        Returns:
+            Treffer mit 'id', 'title' und 'common' (beste zuerst)
+        """
+        counts: Counter = Counter()
+        for keyword in set(keywords):
+            counts.update(self._postings.get(keyword, ()))
+
+        matches = [
+            {
+                'id': entry_id,
+                'title': self._entries[entry_id]['title'],
+                'common': common
+            }
+            for entry_id, common in counts.items()
+            if common >= min_common
+        ]
+        matches.sort(key=lambda m: (-m['common'], str(m['id'])))
+        return matches
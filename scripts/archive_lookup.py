@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Archive Lookup
+Parallele Abfrage externer Galileo-Archive (Mediathek, Episodenführer) mit Ergebnis-Cache
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from html.parser import HTMLParser
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple
+from urllib.parse import urljoin
+
+import requests
+
+from normalizer import extract_keywords, normalize_text
+from storage import atomic_write_json, cache_path, load_json
+
+
+class ArchiveLookupCache:
+    """Disk-Cache Quelle + Anfrage -> Archiv-Treffer mit TTL"""
+
+    def __init__(self, path: Optional[str] = None, ttl_hours: float = 24 * 7, max_entries: int = 20000):
+        """
+        Initialisiert den Lookup-Cache
+
+        Args:
+            path: Pfad zur Cache-Datei (Default: .cache/archive_lookup_cache.json)
+            ttl_hours: Gültigkeit eines Eintrags in Stunden
+            max_entries: Maximale Anzahl Einträge (älteste fliegen raus)
+        """
+        self.path = path or cache_path('archive_lookup_cache.json')
+        self.ttl_seconds = ttl_hours * 60 * 60
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        # Reihenfolge = Einfügereihenfolge (vorne am ältesten)
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict(
+            load_json(self.path, {}).get('entries', [])
+        )
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(source_name: str, query: str) -> str:
+        """Cache-Schlüssel aus Quelle und normalisierter Anfrage"""
+        return f"{source_name}\x1f{normalize_text(query)}"
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Liefert die zwischengespeicherten Treffer einer Anfrage
+
+        Args:
+            key: Cache-Schlüssel
+
+        Returns:
+            Archiv-Treffer (ggf. leer) oder None (nicht vorhanden oder abgelaufen)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.time() - entry['created'] > self.ttl_seconds:
+                del self._entries[key]
+                self._dirty = True
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return entry['results']
+
+    def put(self, key: str, results: List[Dict[str, Any]]) -> None:
+        """
+        Speichert die Treffer einer Anfrage (auch leere Ergebnisse)
+
+        Args:
+            key: Cache-Schlüssel
+            results: Archiv-Treffer
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = {'created': time.time(), 'results': results}
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Schreibt den Cache auf Platte (nur wenn sich etwas geändert hat)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            atomic_write_json(self.path, {'entries': list(self._entries.items())})
+            self._dirty = False
+
+
+def parse_json(response: requests.Response) -> List[Dict[str, Any]]:
+    """Format 'json': Liste von Episoden oder {"episodes": [...]}"""
+    data = response.json()
+    if isinstance(data, dict):
+        data = data.get('episodes', [])
+    return data if isinstance(data, list) else []
+
+
+class _LinkCollector(HTMLParser):
+    """Sammelt Ziel und Text aller Links einer HTML-Seite"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links: List[Tuple[str, str]] = []
+        self._href: Optional[str] = None
+        self._title = ''
+        self._text: List[str] = []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == 'a':
+            attributes = dict(attrs)
+            self._href = attributes.get('href')
+            self._title = attributes.get('title') or ''
+            self._text = []
+
+    def handle_data(self, data: str) -> None:
+        if self._href is not None:
+            self._text.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == 'a' and self._href is not None:
+            text = ' '.join(' '.join(self._text).split()) or self._title.strip()
+            if text:
+                self.links.append((self._href, text))
+            self._href = None
+
+
+def parse_html(response: requests.Response) -> List[Dict[str, Any]]:
+    """
+    Format 'html': Episoden aus den Links einer Such- bzw. Serienseite
+
+    Jeder Link wird zum Kandidaten (Linktext bzw. title-Attribut als Titel);
+    Navigation und Werbung fallen später beim Schlüsselwort-Vergleich heraus.
+    """
+    collector = _LinkCollector()
+    collector.feed(response.text)
+    collector.close()
+
+    episodes = []
+    seen = set()
+    for href, title in collector.links:
+        if title in seen:
+            continue
+        seen.add(title)
+        episodes.append({'id': urljoin(response.url, href), 'title': title})
+    return episodes
+
+
+# Antwort-Formate der Archiv-Quellen ('format' einer Quelle)
+PARSERS: Dict[str, Callable[[requests.Response], List[Dict[str, Any]]]] = {
+    'json': parse_json,
+    'html': parse_html,
+}
+
+
+class ArchiveLookup:
+    """Fragt alle aktiven Archiv-Quellen parallel ab und bricht bei sicherem Treffer ab"""
+
+    def __init__(self, session: requests.Session, sources: List[Dict[str, Any]],
+                 cache: Optional[ArchiveLookupCache] = None, max_workers: int = 8,
+                 timeout: float = 10.0, min_common: int = 2, min_confidence: float = 0.6):
+        """
+        Initialisiert die Lookup-Engine
+
+        Args:
+            session: Gemeinsame HTTP-Session (bekommt einen Connection-Pool
+                passend zu max_workers)
+            sources: Archiv-Quellen mit 'name', 'search_url', 'enabled' und
+                entweder 'format' (Schlüssel aus PARSERS) oder 'parse'
+                (eigene Funktion Antwort -> Episoden)
+            cache: Ergebnis-Cache (Default: .cache/archive_lookup_cache.json)
+            max_workers: Maximale Anzahl paralleler Requests
+            timeout: Timeout pro Request in Sekunden
+            min_common: Mindestanzahl gemeinsamer Schlüsselwörter eines Treffers
+            min_confidence: Anteil der Themen-Schlüsselwörter, ab dem ein Treffer
+                als sicher gilt (weitere Quellen werden dann nicht mehr abgewartet)
+        """
+        for source in sources:
+            if not callable(source.get('parse')) and source.get('format') not in PARSERS:
+                raise ValueError(
+                    f"Archiv-Quelle {source.get('name')}: 'format' ({', '.join(PARSERS)}) "
+                    f"oder 'parse' fehlt"
+                )
+        self.session = session
+        self.sources = sources
+        self.cache = cache or ArchiveLookupCache()
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.min_common = min_common
+        self.min_confidence = min_confidence
+
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # Worker erst bei der ersten Online-Abfrage starten - ohne aktive
+        # Quellen (Default) entstehen keine Threads
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Statistik für die Ausgabe
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.failed = 0
+        self.short_circuits = 0
+
+    def close(self) -> None:
+        """Wartet auf noch laufende Anfragen und beendet die Worker (falls gestartet)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Liefert den Worker-Pool, startet ihn bei Bedarf"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='archive-lookup')
+            return self._executor
+
+    @property
+    def enabled_sources(self) -> List[Dict[str, Any]]:
+        """Aktive Archiv-Quellen"""
+        return [source for source in self.sources if source.get('enabled')]
+
+    def lookup(self, titles: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Sucht mehrere Themen gleichzeitig in allen aktiven Quellen
+
+        Sobald eine Quelle für ein Thema einen sicheren Treffer liefert,
+        wird auf die übrigen Quellen dieses Themas nicht mehr gewartet.
+
+        Args:
+            titles: Themen-Titel
+
+        Returns:
+            Treffer mit 'id', 'title', 'common', 'confidence' und 'source'
+            pro Thema (beste zuerst, gleiche Reihenfolge wie titles)
+        """
+        sources = self.enabled_sources
+        results: List[List[Dict[str, Any]]] = [[] for _ in titles]
+        if not sources or not titles:
+            return results
+
+        keywords = [set(extract_keywords(title)) for title in titles]
+        done = [False] * len(titles)
+        pending: Dict[Future, Tuple[int, Dict[str, Any]]] = {}
+
+        for index, title in enumerate(titles):
+            for source in sources:
+                cached = self.cache.get(self.cache.make_key(source['name'], title))
+                if cached is not None:
+                    done[index] = self._collect(results[index], cached, keywords[index], source) or done[index]
+                elif not done[index]:
+                    pending[self._get_executor().submit(self._fetch, source, title)] = (index, source)
+
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index, source = pending.pop(future)
+                if not self._collect(results[index], future.result(), keywords[index], source):
+                    continue
+                done[index] = True
+                # Auf die übrigen Quellen des Themas nicht mehr warten: noch nicht
+                # gestartete Anfragen entfallen, laufende füllen nur den Cache
+                for other, (other_index, _) in list(pending.items()):
+                    if other_index == index:
+                        del pending[other]
+                        other.cancel()
+                        self.short_circuits += 1
+
+        for matches in results:
+            matches.sort(key=lambda match: (-match['confidence'], -match['common'], match['title']))
+        return results
+
+    def search(self, source: Dict[str, Any], query: str) -> List[Dict[str, Any]]:
+        """
+        Fragt eine einzelne Quelle ab (Ergebnis landet im Cache)
+
+        Args:
+            source: Archiv-Quelle
+            query: Suchbegriff (Themen-Titel)
+
+        Returns:
+            Gefundene Episoden mit 'id' und 'title' (leer bei Fehlern)
+        """
+        cached = self.cache.get(self.cache.make_key(source['name'], query))
+        if cached is not None:
+            return cached
+        return self._fetch(source, query)
+
+    def _fetch(self, source: Dict[str, Any], query: str) -> List[Dict[str, Any]]:
+        """Lädt die Treffer einer Quelle ohne Cache-Abfrage und speichert sie"""
+        parse: Callable[[requests.Response], List[Dict[str, Any]]] = source.get('parse') or PARSERS[source['format']]
+        try:
+            with self._lock:
+                self.requests += 1
+            response = self.session.get(
+                source['search_url'],
+                params={source.get('query_param', 'q'): query},
+                timeout=source.get('timeout', self.timeout)
+            )
+            response.raise_for_status()
+            episodes = [
+                {'id': episode.get('id'), 'title': episode['title']}
+                for episode in parse(response)
+                if isinstance(episode, dict) and episode.get('title')
+            ]
+        except Exception as e:
+            # Fehler nicht cachen - beim nächsten Lauf erneut versuchen
+            with self._lock:
+                self.failed += 1
+            print(f"      ✗ {source['name']}: Archiv-Suche fehlgeschlagen ({str(e)})")
+            return []
+
+        self.cache.put(self.cache.make_key(source['name'], query), episodes)
+        return episodes
+
+    def _collect(self, matches: List[Dict[str, Any]], episodes: List[Dict[str, Any]],
+                 keywords: Set[str], source: Dict[str, Any]) -> bool:
+        """
+        Bewertet die Episoden einer Quelle gegen die Schlüsselwörter des Themas
+
+        Args:
+            matches: Trefferliste des Themas (wird ergänzt)
+            episodes: Episoden der Quelle
+            keywords: Schlüsselwörter des Themas
+            source: Archiv-Quelle
+
+        Returns:
+            True wenn ein sicherer Treffer dabei war
+        """
+        confident = False
+        for episode in episodes:
+            common = len(keywords.intersection(extract_keywords(episode['title'])))
+            if common < self.min_common:
+                continue
+            confidence = common / len(keywords)
+            matches.append({
+                'id': episode.get('id'),
+                'title': episode['title'],
+                'common': common,
+                'confidence': round(confidence, 3),
+                'source': source['name']
+            })
+            confident = confident or confidence >= self.min_confidence
+        return confident
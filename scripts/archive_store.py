@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Archive Store
+Persistente SQLite-Datenbank bereits ausgestrahlter Galileo-Episoden
+"""
+
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Any, Iterable, List, Optional
+
+from normalizer import NORMALIZER_VERSION, normalize_word
+from storage import cache_path
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS episodes (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT UNIQUE NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    air_date TEXT,
+    keywords TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS episode_terms (
+    term TEXT NOT NULL,
+    episode_rowid INTEGER NOT NULL,
+    PRIMARY KEY (term, episode_rowid)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS episode_terms_by_episode ON episode_terms (episode_rowid);
+CREATE VIRTUAL TABLE IF NOT EXISTS episodes_fts USING fts5(
+    title, description, content='episodes', content_rowid='rowid'
+);
+"""
+
+
+class ArchiveStore:
+    """SQLite-Archiv mit Schlüsselwort-Index und FTS5-Volltextsuche"""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Öffnet (oder erzeugt) die Archiv-Datenbank
+
+        Args:
+            path: Pfad zur Datenbank (Default: .cache/galileo_archive.sqlite3)
+        """
+        self.path = path or cache_path('galileo_archive.sqlite3')
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM episodes").fetchone()[0]
+
+    def close(self) -> None:
+        """Schließt die Datenbank"""
+        with self._lock:
+            self._conn.close()
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Liest einen Metadaten-Wert (z.B. Version der Schlüsselwort-Extraktion)"""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        """Schreibt einen Metadaten-Wert"""
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def upsert(self, episodes: Iterable[Dict[str, Any]],
+               extract_keywords: Callable[[str], List[str]]) -> int:
+        """
+        Fügt Episoden ein oder aktualisiert sie (ohne kompletten Neuaufbau)
+
+        Args:
+            episodes: Episoden mit 'title' und optional 'id', 'description',
+                'air_date', 'keywords'
+            extract_keywords: Funktion für Schlüsselwörter, falls die Episode
+                keine eigenen mitbringt
+
+        Returns:
+            Anzahl verarbeiteter Episoden
+        """
+        count = 0
+        with self._lock, self._conn:
+            if self._stale_terms():
+                # Bestehende Einträge erst auf die aktuelle Normalisierung bringen
+                self._reindex(extract_keywords)
+
+            for episode in episodes:
+                title = (episode.get('title') or '').strip()
+                if not title:
+                    continue
+
+                episode_id = str(episode.get('id') or self._make_id(episode))
+                description = episode.get('description') or ''
+                keywords = episode.get('keywords') or []
+                if isinstance(keywords, str):
+                    keywords = keywords.split()
+
+                self._delete(episode_id)
+                cursor = self._conn.execute(
+                    "INSERT INTO episodes (id, title, description, air_date, keywords) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (episode_id, title, description, episode.get('air_date') or None, ' '.join(keywords))
+                )
+                rowid = cursor.lastrowid
+                self._conn.executemany(
+                    "INSERT INTO episode_terms (term, episode_rowid) VALUES (?, ?)",
+                    [(term, rowid) for term in self._terms(title, keywords, extract_keywords)]
+                )
+                self._conn.execute(
+                    "INSERT INTO episodes_fts (rowid, title, description) VALUES (?, ?, ?)",
+                    (rowid, title, description)
+                )
+                count += 1
+
+            # Neuer Archiv-Stand: abgeleitete Indizes (z.B. Vektoren) neu bauen
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('revision', ?)",
+                (str(time.time_ns()),)
+            )
+            self._set_normalizer_version()
+
+        return count
+
+    def needs_reindex(self) -> bool:
+        """True wenn die Schlüsselwörter von einer anderen Normalisierung stammen"""
+        with self._lock:
+            return self._stale_terms()
+
+    def reindex(self, extract_keywords: Callable[[str], List[str]]) -> int:
+        """
+        Berechnet den Schlüsselwort-Index aller Episoden neu
+
+        Args:
+            extract_keywords: Funktion für Schlüsselwörter aus dem Titel
+
+        Returns:
+            Anzahl neu indexierter Episoden
+        """
+        with self._lock, self._conn:
+            return self._reindex(extract_keywords)
+
+    def _reindex(self, extract_keywords: Callable[[str], List[str]]) -> int:
+        """Neuaufbau von episode_terms (Lock und Transaktion müssen gehalten werden)"""
+        rows = self._conn.execute("SELECT rowid, title, keywords FROM episodes").fetchall()
+        self._conn.execute("DELETE FROM episode_terms")
+        self._conn.executemany(
+            "INSERT INTO episode_terms (term, episode_rowid) VALUES (?, ?)",
+            (
+                (term, rowid)
+                for rowid, title, keywords in rows
+                for term in self._terms(title, keywords.split(), extract_keywords)
+            )
+        )
+        self._set_normalizer_version()
+        return len(rows)
+
+    def _stale_terms(self) -> bool:
+        """Prüft die Normalisierungs-Version (Lock muss gehalten werden)"""
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'normalizer_version'").fetchone()
+        if row is not None and row[0] == str(NORMALIZER_VERSION):
+            return False
+        return self._conn.execute("SELECT 1 FROM episodes LIMIT 1").fetchone() is not None
+
+    def _set_normalizer_version(self) -> None:
+        """Vermerkt die aktuelle Normalisierungs-Version (Lock muss gehalten werden)"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('normalizer_version', ?)",
+            (str(NORMALIZER_VERSION),)
+        )
+
+    @staticmethod
+    def _terms(title: str, keywords: List[str],
+               extract_keywords: Callable[[str], List[str]]) -> List[str]:
+        """
+        Index-Begriffe einer Episode
+
+        Args:
+            title: Titel der Episode
+            keywords: Eigene Schlüsselwörter (ggf. leer)
+            extract_keywords: Funktion für Schlüsselwörter aus dem Titel
+
+        Returns:
+            Normalisierte, eindeutige Begriffe
+        """
+        if keywords:
+            return sorted({normalize_word(keyword) for keyword in keywords})
+        return sorted(set(extract_keywords(title)))
+
+    def revision(self) -> Optional[str]:
+        """Kennung des aktuellen Archiv-Stands (ändert sich bei jedem Upsert)"""
+        return self.get_meta('revision')
+
+    def episodes(self) -> List[Dict[str, Any]]:
+        """
+        Liefert alle Episoden (z.B. für den Aufbau abgeleiteter Indizes)
+
+        Returns:
+            Episoden mit 'id', 'title', 'description' und 'air_date'
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, title, description, air_date FROM episodes ORDER BY rowid"
+            ).fetchall()
+        return [
+            {'id': row[0], 'title': row[1], 'description': row[2], 'air_date': row[3]}
+            for row in rows
+        ]
+
+    def _delete(self, episode_id: str) -> None:
+        """Entfernt eine Episode samt Index-Einträgen (Lock muss gehalten werden)"""
+        row = self._conn.execute(
+            "SELECT rowid, title, description FROM episodes WHERE id = ?", (episode_id,)
+        ).fetchone()
+        if row is None:
+            return
+
+        rowid, title, description = row
+        self._conn.execute(
+            "INSERT INTO episodes_fts (episodes_fts, rowid, title, description) "
+            "VALUES ('delete', ?, ?, ?)",
+            (rowid, title, description)
+        )
+        self._conn.execute("DELETE FROM episode_terms WHERE episode_rowid = ?", (rowid,))
+        self._conn.execute("DELETE FROM episodes WHERE rowid = ?", (rowid,))
+
+    def _make_id(self, episode: Dict[str, Any]) -> str:
+        """Stabile ID für Episoden ohne eigene ID (Titel + Sendedatum)"""
+        content = f"{episode.get('title', '').strip().lower()}|{episode.get('air_date') or ''}"
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()[:16]
+
+    def import_file(self, path: str, extract_keywords: Callable[[str], List[str]]) -> int:
+        """
+        Importiert Episoden aus einer JSON- oder CSV-Datei
+
+        JSON: Liste von Episoden (oder {"episodes": [...]}).
+        CSV: Kopfzeile mit den Spalten title, id, description, air_date, keywords.
+
+        Args:
+            path: Pfad zur Importdatei
+            extract_keywords: Funktion für Schlüsselwörter
+
+        Returns:
+            Anzahl importierter Episoden
+        """
+        if path.lower().endswith('.csv'):
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                return self.upsert(csv.DictReader(f), extract_keywords)
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data.get('episodes', [])
+        return self.upsert(data, extract_keywords)
+
+    def match(self, keywords: Iterable[str], min_common: int = 2) -> List[Dict[str, Any]]:
+        """
+        Findet Episoden mit genügend gemeinsamen Schlüsselwörtern
+
+        Args:
+            keywords: Schlüsselwörter des Themas
+            min_common: Mindestanzahl gemeinsamer Schlüsselwörter
+
+        Returns:
+            Treffer mit 'id', 'title' und 'common' (beste zuerst)
+        """
+        terms = sorted(set(keywords))
+        if not terms:
+            return []
+
+        placeholders = ', '.join('?' * len(terms))
+        query = (
+            "SELECT e.id, e.title, COUNT(*) AS common "
+            "FROM episode_terms t JOIN episodes e ON e.rowid = t.episode_rowid "
+            f"WHERE t.term IN ({placeholders}) "
+            "GROUP BY t.episode_rowid HAVING common >= ? "
+            "ORDER BY common DESC, e.id"
+        )
+        with self._lock:
+            rows = self._conn.execute(query, (*terms, min_common)).fetchall()
+
+        return [{'id': row[0], 'title': row[1], 'common': row[2]} for row in rows]
+
+    def search(self, text: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Volltextsuche über Titel und Beschreibung (FTS5)
+
+        Args:
+            text: Suchbegriffe (werden mit OR verknüpft)
+            limit: Maximale Anzahl Treffer
+
+        Returns:
+            Treffer mit 'id', 'title' und 'air_date' (beste zuerst)
+        """
+        words = [word.replace('"', '') for word in text.split()]
+        query = ' OR '.join(f'"{word}"' for word in words if word)
+        if not query:
+            return []
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT e.id, e.title, e.air_date FROM episodes_fts f "
+                "JOIN episodes e ON e.rowid = f.rowid "
+                "WHERE episodes_fts MATCH ? ORDER BY rank LIMIT ?",
+                (query, limit)
+            ).fetchall()
+
+        return [{'id': row[0], 'title': row[1], 'air_date': row[2]} for row in rows]
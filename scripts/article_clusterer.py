@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Article Clusterer
+Fasst dieselbe Meldung verschiedener Quellen vor der Analyse zusammen (MinHash/LSH)
+"""
+
+import random
+import zlib
+from typing import Dict, Any, List, Optional, Tuple
+
+from normalizer import TAG_RE, normalize_text
+from records import Source
+
+
+# Rangfolge der Seriosität (niedriger = besser)
+CREDIBILITY_RANK = {'green': 0, 'yellow': 1, 'red': 2}
+
+# Mersenne-Primzahl für die universellen Hash-Funktionen (klein gehalten,
+# damit die Arithmetik in Maschinenwort-Größe bleibt)
+PRIME = (1 << 31) - 1
+
+# Meldung mit bereits analysiertem Artikel: (bekannte Artikel, neue Artikel)
+Anchored = Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]
+
+# NumPy wird erst mit dem ersten Clusterer geladen (Importzeit ~80 ms)
+np = None
+
+
+def _load_numpy():
+    """
+    Lädt NumPy bei Bedarf
+
+    Returns:
+        numpy-Modul oder None, wenn nicht installiert
+    """
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover - optionale Abhängigkeit
+            return None
+        np = numpy
+    return np
+
+
+class ArticleClusterer:
+    """Near-Duplicate-Erkennung über MinHash-Signaturen und LSH-Bänder"""
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, threshold: float = 0.5,
+                 shingle_size: int = 5, summary_chars: int = 300, seed: int = 42):
+        """
+        Initialisiert den Clusterer
+
+        Args:
+            num_perm: Anzahl Hash-Funktionen pro Signatur
+            bands: Anzahl LSH-Bänder (num_perm muss durch bands teilbar sein)
+            threshold: Mindest-Jaccard-Ähnlichkeit für ein Near-Duplicate
+            shingle_size: Länge der Zeichen-Shingles
+            summary_chars: Wie viel der Zusammenfassung einfließt
+            seed: Seed für die Hash-Funktionen (reproduzierbare Cluster)
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm muss durch bands teilbar sein")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.summary_chars = summary_chars
+
+        rng = random.Random(seed)
+        self._hash_params = [
+            (rng.randrange(1, PRIME), rng.randrange(0, PRIME))
+            for _ in range(num_perm)
+        ]
+        # Zustand für die inkrementelle Variante (add / add_known)
+        self._band_buckets: List[Dict[tuple, int]] = [{} for _ in range(bands)]
+        self._representatives: List[Dict[str, Any]] = []
+        self._rep_signatures: List[List[int]] = []
+        self._rep_anchors: List[Optional[Anchored]] = []
+
+        # Meldungen mit bereits bekanntem Artikel: (bekannte, neue Artikel)
+        self.anchored: List[Anchored] = []
+
+        if _load_numpy() is not None:
+            # Vektorisierte Variante: alle Hash-Funktionen in einem Schritt
+            self._a = np.array([a for a, _ in self._hash_params], dtype=np.uint64)[:, None]
+            self._b = np.array([b for _, b in self._hash_params], dtype=np.uint64)[:, None]
+
+    def cluster(self, articles: List[Dict[str, Any]],
+                known: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """
+        Fasst Near-Duplicates zu je einem repräsentativen Artikel zusammen
+
+        Der Repräsentant ist der Artikel mit der besten Seriosität (bei
+        Gleichstand der zuerst gefundene). Er trägt alle Quellen des Clusters
+        unter 'sources' und die Originalartikel unter 'members'.
+
+        Bereits analysierte Artikel (known) dienen als Anker: Ein Cluster mit
+        bekanntem Artikel ist keine neue Meldung. Seine neuen Artikel stehen
+        danach in self.anchored statt im Ergebnis.
+
+        Args:
+            articles: Neue gescrapte Artikel
+            known: Bekannte Artikel desselben Laufs (Default: keine)
+
+        Returns:
+            Ein Artikel pro Cluster ohne bekannten Artikel (Reihenfolge des
+            ersten Auftretens)
+        """
+        new_count = len(articles)
+        articles = list(articles) + list(known or [])
+        signatures = [self.signature(article) for article in articles]
+        parent = list(range(len(articles)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        # Kandidaten über LSH-Bänder, bestätigt über die geschätzte Ähnlichkeit
+        for band in range(self.bands):
+            buckets: Dict[tuple, int] = {}
+            start = band * self.rows
+            for i, signature in enumerate(signatures):
+                if signature is None:
+                    continue
+                key = tuple(signature[start:start + self.rows])
+                first = buckets.setdefault(key, i)
+                if first != i and find(first) != find(i):
+                    if self.similarity(signatures[first], signature) >= self.threshold:
+                        parent[find(i)] = find(first)
+
+        clusters: Dict[int, List[int]] = {}
+        for i in range(len(articles)):
+            clusters.setdefault(find(i), []).append(i)
+
+        self.anchored = []
+        representatives = []
+        for members in sorted(clusters.values(), key=lambda m: m[0]):
+            new = [articles[i] for i in members if i < new_count]
+            if not new:
+                continue
+            anchors = [articles[i] for i in members if i >= new_count]
+            if anchors:
+                self.anchored.append((anchors, new))
+            else:
+                representatives.append(self._merge(new))
+        return representatives
+
+    def add(self, article: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """
+        Ordnet einen einzelnen Artikel inkrementell einem Cluster zu
+
+        Für die Streaming-Pipeline: Jeder neue Repräsentant bekommt sofort
+        eine eigene 'sources'-Liste. Spätere Duplikate hängen ihre Quelle
+        dort an - auch wenn der Repräsentant bereits analysiert wird, da das
+        Thema dieselbe Liste übernimmt.
+
+        Gehört der Artikel zu einer Meldung mit bekanntem Artikel (add_known),
+        entsteht kein Cluster; er landet in self.anchored.
+
+        Args:
+            article: Gescrapter Artikel
+
+        Returns:
+            Tuple aus Repräsentant und True wenn ein neuer Cluster entstand
+        """
+        signature = self.signature(article)
+
+        candidate = self._match(signature)
+        if candidate is not None:
+            self._join(candidate, article)
+            return self._representatives[candidate], False
+
+        representative = article.copy()
+        representative['sources'] = [source_of(article)]
+        representative['members'] = [article]
+        if signature is not None:
+            self._register(representative, signature, None)
+        return representative, True
+
+    def add_known(self, article: Dict[str, Any]) -> None:
+        """
+        Registriert einen bereits analysierten Artikel als Anker (inkrementell)
+
+        Spätere neue Artikel derselben Meldung hängen sich an ihn
+        (self.anchored), statt einen neuen Cluster zu bilden. Kommt der
+        bekannte Artikel erst nach einem neuen Cluster derselben Meldung an,
+        wird er dessen Mitglied: die frische Analyse ersetzt dann seine
+        gespeicherte.
+
+        Args:
+            article: Bekannter Artikel
+        """
+        signature = self.signature(article)
+        if signature is None:
+            return
+
+        candidate = self._match(signature)
+        if candidate is not None:
+            anchored = self._rep_anchors[candidate]
+            if anchored is not None:
+                anchored[0].append(article)
+            else:
+                self._join(candidate, article)
+            return
+
+        anchored = ([article], [])
+        self.anchored.append(anchored)
+        self._register(article, signature, anchored)
+
+    def _match(self, signature: Any) -> Optional[int]:
+        """Index des Clusters, zu dem eine Signatur gehört (None = keiner)"""
+        if signature is None:
+            return None
+        for band, buckets in enumerate(self._band_buckets):
+            start = band * self.rows
+            candidate = buckets.get(tuple(signature[start:start + self.rows]))
+            if candidate is None:
+                continue
+            if self.similarity(self._rep_signatures[candidate], signature) >= self.threshold:
+                return candidate
+        return None
+
+    def _join(self, index: int, article: Dict[str, Any]) -> None:
+        """Fügt einen neuen Artikel einem bestehenden Cluster hinzu"""
+        anchored = self._rep_anchors[index]
+        if anchored is not None:
+            anchored[1].append(article)
+            return
+        representative = self._representatives[index]
+        representative['sources'].append(source_of(article))
+        representative['members'].append(article)
+
+    def _register(self, representative: Dict[str, Any], signature: List[int],
+                  anchored: Optional[Anchored]) -> None:
+        """Nimmt einen Cluster in die LSH-Bänder der inkrementellen Variante auf"""
+        index = len(self._representatives)
+        self._representatives.append(representative)
+        self._rep_signatures.append(signature)
+        self._rep_anchors.append(anchored)
+        for band, buckets in enumerate(self._band_buckets):
+            start = band * self.rows
+            buckets.setdefault(tuple(signature[start:start + self.rows]), index)
+
+    def signature(self, article: Dict[str, Any]) -> Any:
+        """
+        Berechnet die MinHash-Signatur eines Artikels
+
+        Args:
+            article: Artikel-Daten
+
+        Returns:
+            Liste von num_perm Minima oder None bei leerem Text
+        """
+        summary = TAG_RE.sub(' ', article.get('summary', ''))[:self.summary_chars]
+        text = normalize_text(f"{article.get('title', '')} {summary}")
+        if not text:
+            return None
+
+        size = self.shingle_size
+        hashes = {
+            zlib.crc32(text[i:i + size].encode('utf-8'))
+            for i in range(max(1, len(text) - size + 1))
+        }
+        if np is not None:
+            values = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+            return ((self._a * values + self._b) % PRIME).min(axis=1).tolist()
+        return [min((a * h + b) % PRIME for h in hashes) for a, b in self._hash_params]
+
+    def similarity(self, first: List[int], second: List[int]) -> float:
+        """Geschätzte Jaccard-Ähnlichkeit zweier Signaturen"""
+        return sum(1 for a, b in zip(first, second) if a == b) / self.num_perm
+
+    def _merge(self, members: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Baut den repräsentativen Artikel eines Clusters
+
+        Args:
+            members: Artikel des Clusters (Fundreihenfolge)
+
+        Returns:
+            Repräsentant mit allen Quellen
+        """
+        if len(members) == 1:
+            return members[0]
+
+        ranked = sorted(members, key=lambda a: CREDIBILITY_RANK.get(a.get('credibility'), 3))
+        representative = ranked[0].copy()
+        representative['sources'] = [source_of(article) for article in ranked]
+        representative['members'] = ranked
+        return representative
+
+
+def source_of(article: Dict[str, Any]) -> Source:
+    """Quellenangabe eines Artikels im Format von topics.json"""
+    return Source(
+        name=article.get('source', 'Unbekannte Quelle'),
+        url=article.get('link', '#'),
+        credibility=article.get('credibility', 'yellow')
+    )
+
+
+def best_credibility(sources: List[Dict[str, Any]], default: str = 'yellow') -> str:
+    """
+    Liefert die beste Seriosität einer Quellenliste
+
+    Args:
+        sources: Quellenangaben
+        default: Ergebnis bei leerer Liste
+
+    Returns:
+        'green', 'yellow' oder 'red'
+    """
+    ranked = sorted(
+        (source.get('credibility', default) for source in sources),
+        key=lambda credibility: CREDIBILITY_RANK.get(credibility, 3)
+    )
+    return ranked[0] if ranked else default
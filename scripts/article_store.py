@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Article Store
+Merkt sich bereits verarbeitete Artikel über mehrere Läufe hinweg
+"""
+
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from storage import atomic_write_json, cache_path, load_json
+
+
+# Query-Parameter, die nur dem Tracking dienen und den Artikel nicht ändern:
+# ganze Familien per Präfix (utm_source, utm_medium, ...), einzelne Namen exakt
+# (sonst fielen z.B. 'refid' oder 'reference' mit weg)
+TRACKING_PREFIXES = ('utm_', 'at_', 'wt_')
+TRACKING_PARAMS = frozenset(('ref', 'xtor', 'fbclid', 'gclid'))
+
+
+def is_tracking_param(key: str) -> bool:
+    """Prüft ob ein Query-Parameter nur dem Tracking dient"""
+    key = key.lower()
+    return key in TRACKING_PARAMS or key.startswith(TRACKING_PREFIXES)
+
+
+def normalize_link(link: str) -> str:
+    """
+    Normalisiert eine Artikel-URL für den Vergleich
+
+    Args:
+        link: Original-URL aus dem Feed
+
+    Returns:
+        URL ohne Fragment, Tracking-Parameter und abschließenden Slash
+    """
+    parts = urlsplit(link.strip())
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query)
+        if not is_tracking_param(key)
+    ]
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        path,
+        urlencode(sorted(query)),
+        ''
+    ))
+
+
+class SeenArticleStore:
+    """Persistenter Speicher bereits gesehener Artikel samt Analyse"""
+
+    def __init__(self, path: Optional[str] = None, retention_days: int = 30):
+        """
+        Initialisiert den Artikel-Speicher
+
+        Args:
+            path: Pfad zur Speicherdatei (Default: .cache/seen_articles.json)
+            retention_days: Nach wie vielen Tagen ohne Sichtung ein Artikel
+                vergessen wird
+        """
+        self.path = path or cache_path('seen_articles.json')
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        self._articles: Dict[str, Dict[str, Any]] = load_json(self.path, {}).get('articles', {})
+        self._known_this_run: List[str] = []
+        # Abgefragte bekannte Artikel (Anker für das Zusammenfassen)
+        self._known_articles: List[Dict[str, Any]] = []
+
+    @staticmethod
+    def article_key(article: Dict[str, Any]) -> str:
+        """
+        Bestimmt den stabilen Schlüssel eines Artikels
+
+        Args:
+            article: Artikel-Daten
+
+        Returns:
+            GUID, sonst normalisierter Link, sonst Titel
+        """
+        if article.get('guid'):
+            return f"guid:{article['guid']}"
+        if article.get('link'):
+            return f"link:{normalize_link(article['link'])}"
+        return f"title:{article.get('title', '').strip().lower()}"
+
+    @staticmethod
+    def content_hash(article: Dict[str, Any]) -> str:
+        """
+        Hash über den Inhalt eines Artikels (erkennt geänderte Artikel)
+
+        Args:
+            article: Artikel-Daten
+
+        Returns:
+            SHA1-Hexdigest über Titel und Zusammenfassung
+        """
+        content = f"{article.get('title', '').strip()}\n{article.get('summary', '').strip()}"
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+    def is_known(self, article: Dict[str, Any]) -> bool:
+        """
+        Prüft ob ein Artikel unverändert bereits verarbeitet wurde
+
+        Bekannte Artikel werden für diesen Lauf vorgemerkt, damit ihre
+        gespeicherte Analyse wiederverwendet werden kann.
+
+        Args:
+            article: Artikel-Daten
+
+        Returns:
+            True wenn Artikel bekannt und unverändert
+        """
+        key = self.article_key(article)
+        with self._lock:
+            stored = self._articles.get(key)
+            if not stored or stored['hash'] != self.content_hash(article):
+                return False
+            stored['last_seen'] = datetime.now().isoformat()
+            self._known_this_run.append(key)
+            self._known_articles.append(article)
+            return True
+
+    def remember(self, article: Dict[str, Any], analysis: Optional[Dict[str, Any]]) -> None:
+        """
+        Speichert einen verarbeiteten Artikel samt Analyseergebnis
+
+        Args:
+            article: Artikel-Daten
+            analysis: Analyseergebnis (None = nicht relevant, wird ebenfalls
+                gespeichert damit der Artikel nicht erneut analysiert wird)
+        """
+        now = datetime.now().isoformat()
+        with self._lock:
+            self._articles[self.article_key(article)] = {
+                'hash': self.content_hash(article),
+                'analysis': analysis,
+                'last_seen': now
+            }
+
+    def analysis_of(self, article: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Gespeicherte Analyse eines Artikels
+
+        Args:
+            article: Artikel-Daten
+
+        Returns:
+            Analyseergebnis (Änderungen daran werden mitgespeichert) oder None
+        """
+        with self._lock:
+            stored = self._articles.get(self.article_key(article))
+        return stored['analysis'] if stored else None
+
+    def reused_analyses(self) -> List[Dict[str, Any]]:
+        """
+        Liefert die gespeicherten Analysen der in diesem Lauf bekannten Artikel
+
+        Returns:
+            Liste der Analyseergebnisse (ohne nicht relevante Artikel)
+        """
+        with self._lock:
+            # Dieselbe Meldung kann in mehreren Quellen bekannt sein
+            analyses = [
+                self._articles[key]['analysis'] for key in dict.fromkeys(self._known_this_run)
+                if key in self._articles
+            ]
+        return [analysis for analysis in analyses if analysis]
+
+    def known_this_run(self) -> List[str]:
+        """Schlüssel der in diesem Lauf als bekannt erkannten Artikel (für Checkpoints)"""
+        with self._lock:
+            return list(self._known_this_run)
+
+    def known_articles(self) -> List[Dict[str, Any]]:
+        """Die in diesem Lauf abgefragten, bereits bekannten Artikel"""
+        with self._lock:
+            return list(self._known_articles)
+
+    def mark_known(self, keys: List[str], articles: Optional[List[Dict[str, Any]]] = None) -> None:
+        """
+        Übernimmt die bekannten Artikel eines früheren Prozesses (Checkpoint von 'scrape')
+
+        Args:
+            keys: Schlüssel aus known_this_run()
+            articles: Artikel aus known_articles()
+        """
+        with self._lock:
+            self._known_this_run = list(keys)
+            self._known_articles = list(articles or [])
+
+    def touch(self, keys: List[str]) -> None:
+        """
+        Behandelt Artikel einer in diesem Lauf nicht abgefragten Quelle als
+        unverändert gesehen (Analysen werden übernommen, nichts veraltet)
+
+        Args:
+            keys: Schlüssel der letzten Abfrage der Quelle
+        """
+        now = datetime.now().isoformat()
+        with self._lock:
+            for key in keys:
+                stored = self._articles.get(key)
+                if stored:
+                    stored['last_seen'] = now
+                    self._known_this_run.append(key)
+
+    def prune(self) -> int:
+        """
+        Vergisst Artikel, die länger als retention_days nicht gesehen wurden
+
+        Returns:
+            Anzahl entfernter Artikel
+        """
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).isoformat()
+        with self._lock:
+            stale = [key for key, entry in self._articles.items() if entry['last_seen'] < cutoff]
+            for key in stale:
+                del self._articles[key]
+        return len(stale)
+
+    def save(self) -> None:
+        """Schreibt den Speicher auf Platte und beendet den aktuellen Lauf"""
+        with self._lock:
+            atomic_write_json(self.path, {'articles': self._articles})
+            self._known_this_run = []
+            self._known_articles = []
@@ -0,0 +1,569 @@
+#!/usr/bin/env python3
+"""
+Benchmark
+Reproduzierbare Offline-Messung von Scraper, AI-Analyse und Duplikat-Check
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - nicht unter Windows
+    resource = None
+
+import requests
+
+from run_metrics import RunMetrics
+from storage import json_default
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'feeds')
+
+# Bausteine für deutsch klingende Kunstwörter der synthetischen Daten
+SYLLABLES = (
+    'ber', 'lin', 'kli', 'ma', 'was', 'ser', 'for', 'schung', 'tech', 'nik',
+    'wan', 'del', 'strom', 'netz', 'mee', 'res', 'bo', 'den', 'zell', 'stoff',
+    'gar', 'ten', 'mond', 'licht', 'ro', 'bo', 'ter', 'kunst', 'rei', 'se',
+    'hal', 'le', 'bahn', 'hof', 'wald', 'brand', 'eis', 'berg', 'sand', 'sturm'
+)
+
+# Anteil der Anfragen, die ein Archiv-Thema (leicht verändert) wiederholen
+DUPLICATE_SHARE = 0.5
+
+# Start des Tools ohne Lauf: Import plus Konstruktion (Services bleiben ungeladen)
+STARTUP_CODE = 'import main_research; main_research.GalileoResearchTool()'
+
+# Module, die erst bei Bedarf geladen werden sollen
+HEAVY_MODULES = ('numpy', 'requests', 'feedparser')
+
+
+class FixtureAdapter(requests.adapters.BaseAdapter):
+    """Beantwortet fixture://-URLs aus aufgezeichneten Feed-Dateien"""
+
+    def __init__(self, directory: str):
+        super().__init__()
+        self.directory = directory
+        self._cache: Dict[str, bytes] = {}
+
+    def send(self, request, **kwargs) -> requests.Response:
+        filename = request.url[len('fixture://'):]
+        if filename not in self._cache:
+            with open(os.path.join(self.directory, filename), 'rb') as f:
+                self._cache[filename] = f.read()
+
+        response = requests.Response()
+        response.status_code = 200
+        response.headers['Content-Type'] = 'application/rss+xml'
+        response.raw = io.BytesIO(self._cache[filename])
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def fixture_sources(directory: str = FIXTURE_DIR) -> List[Dict[str, str]]:
+    """
+    Quellen-Konfiguration der aufgezeichneten Feeds
+
+    Args:
+        directory: Verzeichnis mit sources.json und den Feed-Dateien
+
+    Returns:
+        Quellen wie in sources.json
+    """
+    with open(os.path.join(directory, 'sources.json'), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    return [
+        {'name': entry['name'], 'type': 'rss', 'rss': f"fixture://{entry['file']}",
+         'credibility': entry['credibility']}
+        for entry in manifest['sources']
+    ]
+
+
+def synthetic_title(rng: random.Random, vocabulary: List[str]) -> str:
+    """Erzeugt einen Titel aus 4-7 Wörtern des Vokabulars"""
+    return ' '.join(rng.choice(vocabulary) for _ in range(rng.randint(4, 7)))
+
+
+def synthetic_vocabulary(seed: int, size: int = 20000) -> List[str]:
+    """
+    Deterministisches Vokabular aus Kunstwörtern
+
+    Args:
+        seed: Seed des Zufallsgenerators
+        size: Anzahl Wörter
+
+    Returns:
+        Wörter mit 2-4 Silben (Großschreibung wie Substantive)
+    """
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < size:
+        words.add(''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize())
+    return sorted(words)
+
+
+def synthetic_articles(count: int, seed: int) -> List[Dict[str, Any]]:
+    """
+    Deterministische Artikel für die Analyse
+
+    Args:
+        count: Anzahl Artikel
+        seed: Seed des Zufallsgenerators
+
+    Returns:
+        Artikel im Format von NewsScraperService
+    """
+    rng = random.Random(seed)
+    vocabulary = synthetic_vocabulary(seed)
+    return [
+        {
+            'title': synthetic_title(rng, vocabulary),
+            'summary': ' '.join(synthetic_title(rng, vocabulary) for _ in range(4)),
+            'link': f"https://example.org/artikel/{i}",
+            'guid': f"bench-{seed}-{i}",
+            'published': '2026-01-01T08:00:00',
+            'source': 'Benchmark',
+            'credibility': 'green' if i % 3 else 'yellow'
+        }
+        for i in range(count)
+    ]
+
+
+def synthetic_episodes(count: int, seed: int, samples: List[str],
+                       sample_every: int) -> Iterator[Dict[str, Any]]:
+    """
+    Erzeugt Archiv-Episoden als Stream (auch 1M Einträge ohne Liste im Speicher)
+
+    Args:
+        count: Anzahl Episoden
+        seed: Seed des Zufallsgenerators
+        samples: Liste, in die jeder sample_every-te Titel übernommen wird
+            (Grundlage für Duplikat-Anfragen)
+        sample_every: Abstand der gesammelten Titel
+
+    Yields:
+        Episoden mit 'id', 'title' und 'air_date'
+    """
+    rng = random.Random(seed)
+    vocabulary = synthetic_vocabulary(seed)
+    for i in range(count):
+        title = synthetic_title(rng, vocabulary)
+        if i % sample_every == 0:
+            samples.append(title)
+        yield {
+            'id': f"ep{i}",
+            'title': title,
+            'air_date': f"{2000 + i % 25}-{1 + i % 12:02d}-{1 + i % 28:02d}"
+        }
+
+
+def latency_summary(samples: List[float]) -> Dict[str, float]:
+    """p50/p99 in Millisekunden"""
+    if not samples:
+        return {'p50_ms': 0.0, 'p99_ms': 0.0}
+    ordered = sorted(samples)
+
+    def rank(fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000
+
+    return {'p50_ms': round(rank(0.5), 3), 'p99_ms': round(rank(0.99), 3)}
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Speicher-Peak des aktuellen Prozesses in MB (Linux: ru_maxrss in KB)"""
+    if resource is None:
+        return None
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def bench_scrape(repeat: int, seed: int) -> Dict[str, Any]:
+    """
+    Spielt die aufgezeichneten Feeds durch NewsScraperService ab
+
+    Args:
+        repeat: Anzahl Durchläufe über alle Quellen
+        seed: Unbenutzt (einheitliche Signatur)
+
+    Returns:
+        Messergebnis
+    """
+    from news_scraper import NewsScraperService
+    from source_registry import SourceRegistry
+
+    metrics = RunMetrics()
+    scraper = NewsScraperService(use_cache=False, metrics=metrics,
+                                 registry=SourceRegistry(fixture_sources()))
+    scraper.session.mount('fixture://', FixtureAdapter(FIXTURE_DIR))
+
+    articles = 0
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            # Aufgezeichnete Feeds sind älter als das übliche Zeitfenster
+            articles += len(scraper.fetch_all_sources([], days_back=36500))
+    wall = time.perf_counter() - started
+
+    return {
+        'items': articles,
+        'wall': round(wall, 4),
+        'throughput': round(articles / wall, 1),
+        **latency_summary(metrics.samples('source')),
+        'unit': 'Artikel/s (Latenz pro Quelle)'
+    }
+
+
+def bench_analyze(count: int, seed: int, workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Analysiert synthetische Artikel im deterministischen Mock-Modus
+
+    Args:
+        count: Anzahl Artikel
+        seed: Seed für Artikel und Mock-Analyse
+        workers: Prozesse des lokalen Heuristik-Modells statt Mock-Modus
+            (None = Mock-Modus)
+
+    Returns:
+        Messergebnis inkl. Prüfsumme (gleicher Seed = gleiche Ergebnisse)
+    """
+    # Immer Mock-Modus, auch wenn im Benchmark-Prozess API-Keys gesetzt sind
+    for key in ('OPENAI_API_KEY', 'ANTHROPIC_API_KEY'):
+        os.environ.pop(key, None)
+    from ai_analyzer import AIAnalyzerService
+    from local_analyzer import LocalAnalyzerPool
+
+    articles = synthetic_articles(count, seed)
+    metrics = RunMetrics()
+    local_pool = LocalAnalyzerPool(workers=workers) if workers is not None else None
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyzer = AIAnalyzerService(run_deadline=None, metrics=metrics, seed=seed, local_pool=local_pool)
+
+    # Start der Worker (inkl. Laden des Modells) zählt mit
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = analyzer.analyze_batch(articles)
+    wall = time.perf_counter() - started
+    analyzer.close()
+
+    digest = hashlib.sha1(json.dumps(results, sort_keys=True, default=json_default).encode('utf-8')).hexdigest()[:12]
+    return {
+        'items': count,
+        'wall': round(wall, 4),
+        'throughput': round(count / wall, 1),
+        **latency_summary(metrics.samples('article')),
+        'unit': 'Artikel/s (Latenz pro Artikel)',
+        'relevant': sum(1 for result in results if result),
+        'digest': digest
+    }
+
+
+def bench_dedup(size: int, queries: int, seed: int, mode: str) -> Dict[str, Any]:
+    """
+    Duplikat-Check gegen ein synthetisches Archiv
+
+    Args:
+        size: Anzahl Archiv-Episoden
+        queries: Anzahl geprüfter Themen
+        seed: Seed für Archiv und Anfragen
+        mode: Modus des DuplicateCheckerService ('keywords' oder 'semantic')
+
+    Returns:
+        Messergebnis inkl. Aufbauzeit des Archivs
+    """
+    from archive_store import ArchiveStore
+    from duplicate_checker import DuplicateCheckerService
+    from normalizer import extract_keywords
+
+    with tempfile.TemporaryDirectory(prefix='galileo-bench-') as directory:
+        path = os.path.join(directory, 'archive.sqlite3')
+        samples: List[str] = []
+        sample_every = max(1, size // queries)
+
+        started = time.perf_counter()
+        store = ArchiveStore(path)
+        store.upsert(synthetic_episodes(size, seed, samples, sample_every), extract_keywords)
+        store.close()
+        build = time.perf_counter() - started
+
+        checker = DuplicateCheckerService(archive_path=path, mode=mode)
+        rng = random.Random(seed + 1)
+        vocabulary = synthetic_vocabulary(seed + 1)
+        topics = []
+        for i in range(queries):
+            if i < queries * DUPLICATE_SHARE and samples:
+                # Archiv-Titel mit vertauschter Wortfolge und einem Zusatzwort
+                words = rng.choice(samples).split()
+                rng.shuffle(words)
+                topics.append({'title': ' '.join(words + [rng.choice(vocabulary)])})
+            else:
+                topics.append({'title': synthetic_title(rng, vocabulary)})
+
+        index_build = 0.0
+        if mode == 'semantic':
+            index_started = time.perf_counter()
+            checker.semantic_index()
+            index_build = time.perf_counter() - index_started
+
+        latencies = []
+        duplicates = 0
+        started = time.perf_counter()
+        for topic in topics:
+            topic_started = time.perf_counter()
+            duplicates += checker.check_topic(topic)['isDuplicate']
+            latencies.append(time.perf_counter() - topic_started)
+        wall = time.perf_counter() - started
+
+    return {
+        'items': queries,
+        'wall': round(wall, 4),
+        'throughput': round(queries / wall, 1),
+        **latency_summary(latencies),
+        'unit': 'Themen/s (Latenz pro Thema)',
+        'archive_build': round(build, 2),
+        'index_build': round(index_build, 2),
+        'duplicates': duplicates
+    }
+
+
+def bench_startup(repeat: int, seed: int) -> Dict[str, Any]:
+    """
+    Misst den Start des Tools in frischen Interpretern (python -X importtime)
+
+    Args:
+        repeat: Anzahl Starts
+        seed: Unbenutzt (einheitliche Signatur)
+
+    Returns:
+        Messergebnis inkl. der teuersten direkten Importe von main_research
+        und der dabei schon geladenen schweren Module
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    code = f"{STARTUP_CODE}; import sys; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            cwd=script_dir, capture_output=True, text=True, check=True
+        )
+        latencies.append(time.perf_counter() - started)
+    wall = sum(latencies)
+
+    # Ausgabe: "import time: self [us] | cumulative [us] | name", eingerückt nach
+    # Tiefe; Unter-Importe stehen vor ihrem Modul
+    imports, children = [], []
+    for line in process.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].rstrip()
+        if not name.startswith('  '):
+            if name.strip() == 'main_research':
+                imports = children
+            children = []
+        elif not name.startswith('    '):
+            children.append((int(parts[1]), name.strip()))
+    slowest = sorted(imports, reverse=True)[:5]
+
+    return {
+        'items': repeat,
+        'wall': round(wall, 4),
+        'throughput': round(repeat / wall, 1),
+        **latency_summary(latencies),
+        'unit': 'Starts/s (Latenz pro Start)',
+        'slowest_imports': {name: round(micros / 1000, 1) for micros, name in slowest},
+        'heavy_loaded': [m for m in process.stdout.strip().split(',') if m]
+    }
+
+
+def run_stage(name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Führt eine Benchmark-Stufe aus und ergänzt den Speicher-Peak
+
+    Args:
+        name: 'scrape', 'analyze', 'analyze-local', 'dedup' oder 'startup'
+        params: Parameter der Stufe
+
+    Returns:
+        Messergebnis
+    """
+    if name == 'scrape':
+        result = bench_scrape(params['repeat'], params['seed'])
+    elif name == 'analyze':
+        result = bench_analyze(params['articles'], params['seed'])
+    elif name == 'analyze-local':
+        result = bench_analyze(params['articles'], params['seed'], params['workers'] or 0)
+    elif name == 'dedup':
+        result = bench_dedup(params['size'], params['queries'], params['seed'], params['mode'])
+    elif name == 'startup':
+        result = bench_startup(params['repeat'], params['seed'])
+    else:
+        raise ValueError(f"Unbekannte Stufe: {name}")
+
+    result['peak_rss_mb'] = peak_rss_mb()
+    return result
+
+
+def run_isolated(name: str, params: Dict[str, Any], in_process: bool) -> Dict[str, Any]:
+    """
+    Führt eine Stufe in einem frischen Prozess aus (eigener Speicher-Peak)
+
+    Args:
+        name: Name der Stufe
+        params: Parameter der Stufe
+        in_process: Im aktuellen Prozess ausführen (z.B. für einen Profiler)
+
+    Returns:
+        Messergebnis
+    """
+    if in_process:
+        return run_stage(name, params)
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+        return executor.submit(run_stage, name, params).result()
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            tolerance: float) -> List[str]:
+    """
+    Vergleicht Ergebnisse mit einer gespeicherten Baseline
+
+    Args:
+        results: Aktuelle Ergebnisse
+        baseline: Frühere Ergebnisse (gleiche Schlüssel)
+        tolerance: Erlaubte relative Verschlechterung (z.B. 0.25)
+
+    Returns:
+        Beschreibungen der Regressionen (leer = alles in Ordnung)
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        if result['throughput'] < reference['throughput'] * (1 - tolerance):
+            regressions.append(f"{name}: Durchsatz {result['throughput']} < {reference['throughput']}")
+        if reference.get('p99_ms') and result['p99_ms'] > reference['p99_ms'] * (1 + tolerance):
+            regressions.append(f"{name}: p99 {result['p99_ms']} ms > {reference['p99_ms']} ms")
+        if reference.get('digest') and result.get('digest') != reference['digest']:
+            regressions.append(f"{name}: Ergebnis weicht ab (Prüfsumme {result.get('digest')})")
+    return regressions
+
+
+def record_fixtures(directory: str = FIXTURE_DIR) -> None:
+    """
+    Zeichnet die aktuell konfigurierten Live-Feeds als Fixtures auf
+
+    Args:
+        directory: Zielverzeichnis für Feed-Dateien und sources.json
+    """
+    from news_scraper import NewsScraperService
+
+    scraper = NewsScraperService(use_cache=False)
+    manifest = []
+    os.makedirs(directory, exist_ok=True)
+    for source in scraper.registry.of_type('rss'):
+        filename = ''.join(c if c.isalnum() else '_' for c in source['name'].lower()) + '.xml'
+        try:
+            _, body = scraper._download_feed(source)
+        except Exception as e:
+            print(f"   ✗ {source['name']}: Fehler ({str(e)})")
+            continue
+        with open(os.path.join(directory, filename), 'wb') as f:
+            f.write(body)
+        manifest.append({'name': source['name'], 'file': filename, 'credibility': source['credibility']})
+        print(f"   ✓ {source['name']}: {len(body) / 1024:.0f} KB")
+
+    with open(os.path.join(directory, 'sources.json'), 'w', encoding='utf-8') as f:
+        json.dump({'sources': manifest}, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+def main():
+    """Entry Point"""
+    parser = argparse.ArgumentParser(description="Offline-Benchmark des Galileo Research Tools")
+    parser.add_argument('--stages', default='scrape,analyze,dedup,startup',
+                        help="Kommagetrennte Stufen (Default: scrape,analyze,dedup,startup)")
+    parser.add_argument('--archive-sizes', default='10000,100000,1000000',
+                        help="Archivgrößen für den Duplikat-Check (Default: 10000,100000,1000000)")
+    parser.add_argument('--dedup-mode', choices=['keywords', 'semantic'], default='keywords')
+    parser.add_argument('--articles', type=int, default=20000, help="Artikel für die Analyse")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Prozesse für 'analyze-local' (Default: alle Kerne)")
+    parser.add_argument('--queries', type=int, default=500, help="Themen pro Duplikat-Check")
+    parser.add_argument('--repeat', type=int, default=20,
+                        help="Durchläufe über die Feed-Fixtures bzw. Starts des Tools")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help="Ergebnisse als JSON speichern")
+    parser.add_argument('--baseline', help="Mit früheren Ergebnissen (JSON) vergleichen")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Erlaubte Verschlechterung gegenüber der Baseline (Default: 0.25)")
+    parser.add_argument('--in-process', action='store_true',
+                        help="Stufen nicht in eigenen Prozessen ausführen")
+    parser.add_argument('--record', action='store_true',
+                        help="Live-Feeds als neue Fixtures aufzeichnen und beenden")
+    args = parser.parse_args()
+
+    if args.record:
+        print("📼 Zeichne Feeds auf...")
+        record_fixtures()
+        return
+
+    runs = []
+    for stage in [s.strip() for s in args.stages.split(',') if s.strip()]:
+        if stage == 'dedup':
+            for size in [int(s) for s in args.archive_sizes.split(',') if s.strip()]:
+                runs.append((f"dedup-{size}", 'dedup', {
+                    'size': size, 'queries': args.queries, 'seed': args.seed, 'mode': args.dedup_mode
+                }))
+        else:
+            runs.append((stage, stage, {
+                'repeat': args.repeat, 'articles': args.articles, 'seed': args.seed, 'workers': args.workers
+            }))
+
+    print("⏱️  GALILEO BENCHMARK")
+    print(f"{'Stufe':<16} {'Anzahl':>8} {'Durchsatz':>12} {'p50 ms':>9} {'p99 ms':>9} {'RSS MB':>8}")
+    results: Dict[str, Dict[str, Any]] = {}
+    for label, stage, params in runs:
+        result = run_isolated(stage, params, args.in_process)
+        results[label] = result
+        print(f"{label:<16} {result['items']:>8} {result['throughput']:>12} "
+              f"{result['p50_ms']:>9} {result['p99_ms']:>9} {result['peak_rss_mb'] or '-':>8}")
+        extras = {k: v for k, v in result.items()
+                  if k in ('archive_build', 'index_build', 'duplicates', 'relevant', 'digest',
+                           'slowest_imports', 'heavy_loaded')}
+        if extras:
+            print(f"{'':<16} {extras}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"📄 Ergebnisse: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"❌ Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+        print("✅ Keine Regression gegenüber der Baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Checkpoints
+Zwischenergebnisse der Schritte als JSONL im Arbeitsverzeichnis, damit
+einzelne Schritte neu laufen oder ein abgebrochener Lauf fortgesetzt werden kann
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from storage import atomic_write_bytes, atomic_write_json, cache_path, json_default, load_json
+
+
+# Schritte in Ausführungsreihenfolge (jeder liest den Checkpoint seines Vorgängers)
+STAGES = ('scrape', 'analyze', 'dedup', 'rank', 'save')
+
+MANIFEST_FILE = 'manifest.json'
+
+
+class CheckpointError(Exception):
+    """Benötigter Checkpoint fehlt oder ist unlesbar"""
+
+
+class CheckpointStore:
+    """Ein JSONL-Checkpoint pro Schritt plus Manifest der abgeschlossenen Schritte"""
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialisiert den Checkpoint-Speicher
+
+        Args:
+            directory: Arbeitsverzeichnis (Default: .cache/work)
+        """
+        self.directory = directory or cache_path('work')
+        self.manifest_path = os.path.join(self.directory, MANIFEST_FILE)
+
+    def path(self, stage: str) -> str:
+        """Pfad der JSONL-Datei eines Schritts"""
+        return os.path.join(self.directory, f"{stage}.jsonl")
+
+    def _manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Abgeschlossene Schritte mit Zeitpunkt, Anzahl und Metadaten"""
+        return load_json(self.manifest_path, {}).get('stages', {})
+
+    def completed(self) -> List[str]:
+        """
+        Abgeschlossene Schritte
+
+        Returns:
+            Schritte mit gültigem Checkpoint in Ausführungsreihenfolge
+        """
+        manifest = self._manifest()
+        return [stage for stage in STAGES if stage in manifest]
+
+    def last_completed(self) -> Optional[str]:
+        """Zuletzt abgeschlossener Schritt (None = noch keiner)"""
+        completed = self.completed()
+        return completed[-1] if completed else None
+
+    def write(self, stage: str, records: Optional[Iterable[Any]] = None,
+              meta: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Schreibt den Checkpoint eines Schritts und trägt ihn ins Manifest ein
+
+        Args:
+            stage: Name des Schritts
+            records: Ergebnisse (Datensätze oder Dicts, je eine JSONL-Zeile);
+                None = Schritt ohne Ausgabedaten (z.B. 'save')
+            meta: Zusätzlicher Zustand, den Folgeschritte brauchen
+
+        Returns:
+            Anzahl geschriebener Einträge
+        """
+        count = 0
+        if records is not None:
+            lines = [
+                json.dumps(record, ensure_ascii=False, default=json_default)
+                for record in records
+            ]
+            count = len(lines)
+            atomic_write_bytes(self.path(stage), ''.join(line + '\n' for line in lines).encode('utf-8'))
+
+        # Manifest erst nach der Datei: ein Abbruch dazwischen gilt als nicht abgeschlossen
+        manifest = self._manifest()
+        manifest[stage] = {
+            'created': datetime.now().isoformat(),
+            'count': count,
+            'meta': meta or {}
+        }
+        atomic_write_json(self.manifest_path, {'stages': manifest}, indent=2)
+        return count
+
+    def read(self, stage: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Liest den Checkpoint eines Schritts
+
+        Args:
+            stage: Name des Schritts
+
+        Returns:
+            Tuple aus Einträgen und Metadaten
+
+        Raises:
+            CheckpointError: Schritt nicht abgeschlossen oder Datei unlesbar
+        """
+        entry = self._manifest().get(stage)
+        if entry is None:
+            raise CheckpointError(
+                f"Kein Checkpoint für '{stage}' in {self.directory} - zuerst '{stage}' ausführen"
+            )
+
+        records = []
+        try:
+            with open(self.path(stage), 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        records.append(json.loads(line))
+        except (OSError, ValueError) as e:
+            raise CheckpointError(f"Checkpoint '{stage}' unlesbar ({str(e)})")
+
+        if len(records) != entry['count']:
+            raise CheckpointError(
+                f"Checkpoint '{stage}' unvollständig ({len(records)} von {entry['count']} Einträgen)"
+            )
+        return records, entry.get('meta', {})
+
+    def invalidate(self, stage: str) -> None:
+        """
+        Verwirft die Checkpoints eines Schritts und aller folgenden
+
+        Args:
+            stage: Erster Schritt, dessen Ergebnis neu berechnet wird
+        """
+        stale = STAGES[STAGES.index(stage):]
+        manifest = self._manifest()
+        if not any(name in manifest for name in stale):
+            return
+
+        for name in stale:
+            manifest.pop(name, None)
+        atomic_write_json(self.manifest_path, {'stages': manifest}, indent=2)
+        for name in stale:
+            if os.path.exists(self.path(name)):
+                os.unlink(self.path(name))
@@ -4,35 +4,87 @@ Duplicate Checker Service
 Prüft ob Themen bereits bei Galileo behandelt wurden
 """
 
+import os
+import sys
+import threading
 import requests
-from typing import Dict, Any, List
-from bs4 import BeautifulSoup
-import re
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Optional, Union
+
+from archive_index import ArchiveIndex
+from archive_lookup import ArchiveLookup, ArchiveLookupCache
+from archive_store import ArchiveStore
+from normalizer import extract_keywords
+from storage import cache_path
+
+if TYPE_CHECKING:
+    from semantic_index import SemanticIndex
+
+
+# Mindest-Ähnlichkeit im Modus 'semantic' - kalibriert an den aufgezeichneten
+# Feeds (fixtures/feeds, ohne Synonym-Tabelle): jeder Titel gegen die Teaser
+# aller 63 Meldungen. Ab 0.3 findet gut die Hälfte der Titel den eigenen Text,
+# nur einer erreicht einen fremden; ab 0.34 keiner mehr, dann aber nur gut ein Drittel
+DEFAULT_SEMANTIC_THRESHOLD = 0.3
 
 
 class DuplicateCheckerService:
     """Service zum Prüfen von Duplikaten im Galileo-Archiv"""
 
-    def __init__(self):
-        """Initialisiert den Duplicate Checker"""
+    def __init__(self, archive_path: Optional[str] = None, mode: str = 'keywords',
+                 semantic_threshold: float = DEFAULT_SEMANTIC_THRESHOLD,
+                 embed: Optional[Callable[[List[str]], Any]] = None,
+                 archive_sources: Optional[List[Dict[str, Any]]] = None,
+                 lookup_cache: Optional[ArchiveLookupCache] = None,
+                 synonyms: Optional[Dict[str, str]] = None):
+        """
+        Initialisiert den Duplicate Checker
+
+        Args:
+            archive_path: Pfad zur Archiv-Datenbank
+                (Default: .cache/galileo_archive.sqlite3)
+            mode: 'keywords' (mind. 2 gemeinsame Schlüsselwörter) oder
+                'semantic' (TF-IDF-Ähnlichkeit, benötigt NumPy)
+            semantic_threshold: Mindest-Ähnlichkeit (0-1) im Modus 'semantic'
+            embed: Optionale lokale Embedding-Funktion statt TF-IDF
+                (Liste Texte -> Matrix) für den Modus 'semantic'
+            archive_sources: Externe Archiv-Quellen (Default: Joyn und
+                wunschliste.de, beide deaktiviert)
+            lookup_cache: Cache der Archiv-Abfragen
+                (Default: .cache/archive_lookup_cache.json)
+            synonyms: Optionale Synonym-Tabelle für den Modus 'semantic'
+                (siehe semantic_index.load_synonyms)
+        """
+        if mode not in ('keywords', 'semantic'):
+            raise ValueError(f"Unbekannter Modus: {mode}")
+        self.mode = mode
+        self.semantic_threshold = semantic_threshold
+        self.embed = embed
+        self.synonyms = synonyms
+        self._semantic_index = None
+        self._semantic_lock = threading.Lock()  # Aufbau nur einmal, auch bei parallelen Checks
+
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
 
         # Quellen für Galileo-Episoden
-        self.archive_sources = [
+        self.archive_sources = archive_sources if archive_sources is not None else [
             {
                 'name': 'Joyn Mediathek',
                 'search_url': 'https://www.joyn.de/serien/galileo',
+                'format': 'html',
                 'enabled': False  # Deaktiviert für Demo
             },
             {
                 'name': 'wunschliste.de',
                 'search_url': 'https://www.wunschliste.de/serie/galileo',
+                'format': 'html',
                 'enabled': False  # Deaktiviert für Demo
             }
         ]
+        # Fragt aktive Quellen parallel über die gemeinsame Session ab
+        self.archive_lookup = ArchiveLookup(self.session, self.archive_sources, cache=lookup_cache)
 
         # Mock-Datenbank bereits behandelter Themen
         self.mock_archive = [
@@ -44,6 +96,22 @@ class DuplicateCheckerService:
             "schwarze löcher einführung"
         ]
 
+        self.min_common_keywords = 2
+        self.archive_path = archive_path or cache_path('galileo_archive.sqlite3')
+
+        # Echtes Archiv aus der lokalen Datenbank, falls bereits importiert -
+        # sonst Index über das Mock-Archiv. Beide beantworten match() und
+        # berühren nur Einträge, die ein Schlüsselwort mit dem Thema teilen.
+        self.archive: Union[ArchiveStore, ArchiveIndex]
+        store = ArchiveStore(self.archive_path) if os.path.exists(self.archive_path) else None
+        if store is not None and len(store) > 0:
+            if store.needs_reindex():
+                # Schlüsselwörter stammen von einer älteren Normalisierung
+                store.reindex(self._extract_keywords)
+            self.archive = store
+        else:
+            self.archive = ArchiveIndex.from_titles(self.mock_archive)
+
     def check_topic(self, topic: Dict[str, Any]) -> Dict[str, Any]:
         """
         Prüft ob ein Thema bereits behandelt wurde
@@ -54,23 +122,89 @@ class DuplicateCheckerService:
         Returns:
             Duplikat-Status und Info
         """
-        # Extrahiere Schlüsselwörter aus Titel
-        keywords = self._extract_keywords(topic.get('title', ''))
+        return self.check_topics([topic])[0]
 
-        # Prüfe gegen Mock-Archiv
-        is_duplicate = self._check_against_archive(keywords)
+    def check_topics(self, topics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Prüft mehrere Themen auf einmal
+
+        Im Modus 'semantic' wird der ganze Batch mit einer einzigen
+        Matrix-Multiplikation gegen das Archiv bewertet.
+
+        Args:
+            topics: Liste von Themen-Daten
 
-        if is_duplicate:
+        Returns:
+            Duplikat-Status und Info pro Thema (gleiche Reihenfolge)
+        """
+        if self.mode == 'semantic':
+            all_matches = self.semantic_index().query(
+                [topic.get('title', '') for topic in topics],
+                threshold=self.semantic_threshold
+            )
+        else:
+            # Extrahiere Schlüsselwörter aus Titel und prüfe gegen Archiv-Index
+            all_matches = [
+                self.find_matches(self._extract_keywords(topic.get('title', '')))
+                for topic in topics
+            ]
+
+        # Nur Themen ohne lokalen Treffer bei den externen Archiven nachschlagen
+        open_indices = [i for i, matches in enumerate(all_matches) if not matches]
+        if open_indices and self.archive_lookup.enabled_sources:
+            online_matches = self.archive_lookup.lookup([topics[i].get('title', '') for i in open_indices])
+            for i, matches in zip(open_indices, online_matches):
+                all_matches[i] = matches
+
+        return [self._duplicate_status(matches) for matches in all_matches]
+
+    def _duplicate_status(self, matches: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Baut das Duplikat-Ergebnis aus den Archiv-Treffern
+
+        Args:
+            matches: Archiv-Treffer (beste zuerst)
+
+        Returns:
+            Duplikat-Status und Info
+        """
+        if matches:
             return {
                 'isDuplicate': True,
-                'duplicateInfo': '⚠️ Ähnliches Thema wurde bereits bei Galileo behandelt'
+                'duplicateInfo': f"⚠️ Ähnliches Thema wurde bereits bei Galileo behandelt: {matches[0]['title']}",
+                'duplicateMatches': [match['title'] for match in matches]
             }
         else:
             return {
                 'isDuplicate': False,
-                'duplicateInfo': '✅ Noch nicht bei Galileo behandelt'
+                'duplicateInfo': '✅ Noch nicht bei Galileo behandelt',
+                'duplicateMatches': []
             }
 
+    def semantic_index(self) -> 'SemanticIndex':
+        """
+        Liefert den semantischen Index, baut ihn bei Bedarf (einmalig) auf
+
+        Returns:
+            Geladener Index (memory-mapped, sofern das Archiv persistent ist)
+        """
+        with self._semantic_lock:
+            if self._semantic_index is not None:
+                return self._semantic_index
+
+            # Erst hier laden: NumPy braucht nur der Modus 'semantic'
+            from semantic_index import SemanticIndex
+
+            index = SemanticIndex(embed=self.embed, synonyms=self.synonyms)
+            revision = self.archive.revision()
+            persistent = isinstance(self.archive, ArchiveStore)
+
+            if not (persistent and index.load(revision)):
+                index.build(self.archive.episodes(), revision, persist=persistent)
+
+            self._semantic_index = index
+            return index
+
     def _extract_keywords(self, title: str) -> List[str]:
         """
         Extrahiert Schlüsselwörter aus Titel
@@ -81,18 +215,9 @@ class DuplicateCheckerService:
         Returns:
             Liste von Schlüsselwörtern
         """
-        # Entferne Stoppwörter
-        stop_words = [
-            'der', 'die', 'das', 'ein', 'eine', 'und', 'oder', 'für',
-            'mit', 'von', 'zu', 'im', 'am', 'ist', 'sind', 'wird',
-            'werden', 'kann', 'könnte', 'neue', 'neuer', 'neues'
-        ]
-
-        # Tokenisiere und filtere
-        words = re.findall(r'\w+', title.lower())
-        keywords = [w for w in words if w not in stop_words and len(w) > 3]
-
-        return keywords
+        # Ohne Stoppwörter, gestemmt und mit gefalteten Umlauten - derselbe
+        # Normalizer wie beim Aufbau des Archiv-Index
+        return extract_keywords(title)
 
     def _check_against_archive(self, keywords: List[str]) -> bool:
         """
@@ -104,15 +229,20 @@ class DuplicateCheckerService:
         Returns:
             True wenn ähnliches Thema gefunden
         """
-        # Einfache Ähnlichkeitsprüfung
-        for archived_topic in self.mock_archive:
-            archived_keywords = archived_topic.split()
-            # Wenn 2+ gemeinsame Keywords: Potenzielles Duplikat
-            common = set(keywords) & set(archived_keywords)
-            if len(common) >= 2:
-                return True
+        return bool(self.find_matches(keywords))
+
+    def find_matches(self, keywords: List[str]) -> List[Dict[str, Any]]:
+        """
+        Sucht ähnliche Themen im Archiv über den invertierten Index
 
-        return False
+        Args:
+            keywords: Liste von Schlüsselwörtern
+
+        Returns:
+            Archiv-Treffer mit 'id', 'title' und 'common' (beste zuerst)
+        """
+        # Wenn 2+ gemeinsame Keywords: Potenzielles Duplikat
+        return self.archive.match(keywords, self.min_common_keywords)
 
     def search_joyn_mediathek(self, query: str) -> List[Dict[str, Any]]:
         """
@@ -124,9 +254,7 @@ class DuplicateCheckerService:
         Returns:
             Liste gefundener Episoden
         """
-        # HINWEIS: In Produktion würde hier Web-Scraping oder API-Call erfolgen
-        print(f"      ℹ️  Joyn-Suche würde hier '{query}' suchen")
-        return []
+        return self._search_source('Joyn Mediathek', query)
 
     def search_wunschliste(self, query: str) -> List[Dict[str, Any]]:
         """
@@ -138,20 +266,61 @@ class DuplicateCheckerService:
         Returns:
             Liste gefundener Episoden
         """
-        # HINWEIS: In Produktion würde hier Web-Scraping erfolgen
-        print(f"      ℹ️  Wunschliste-Suche würde hier '{query}' suchen")
-        return []
+        return self._search_source('wunschliste.de', query)
+
+    def _search_source(self, name: str, query: str) -> List[Dict[str, Any]]:
+        """
+        Durchsucht eine einzelne Archiv-Quelle (mit Cache)
 
-    def build_archive_database(self) -> None:
+        Args:
+            name: Name der Quelle in archive_sources
+            query: Suchbegriff
+
+        Returns:
+            Liste gefundener Episoden
+        """
+        source = next((source for source in self.archive_sources if source['name'] == name), None)
+        if source is None or not source.get('enabled'):
+            # HINWEIS: In Produktion würde hier Web-Scraping oder API-Call erfolgen
+            print(f"      ℹ️  {name}-Suche würde hier '{query}' suchen")
+            return []
+        return self.archive_lookup.search(source, query)
+
+    def save_cache(self) -> None:
+        """Speichert den Cache der Archiv-Abfragen"""
+        self.archive_lookup.cache.save()
+
+    def close(self) -> None:
+        """Beendet die Worker der Archiv-Abfragen und speichert deren Cache"""
+        self.archive_lookup.close()
+        self.save_cache()
+
+    def build_archive_database(self, source_file: Optional[str] = None) -> None:
         """
-        Baut vollständige Archiv-Datenbank auf (einmalig)
+        Baut die Archiv-Datenbank auf oder ergänzt sie inkrementell
 
-        Würde in Produktion alle Galileo-Episoden crawlen und indexieren
+        Bereits vorhandene Episoden werden aktualisiert, neue hinzugefügt -
+        ein kompletter Neuaufbau ist nicht nötig.
+
+        Args:
+            source_file: JSON- oder CSV-Datei mit Episoden
         """
         print("📚 Baue Archiv-Datenbank auf...")
-        print("   ℹ️  In Produktion würde hier das komplette Galileo-Archiv")
-        print("      von Joyn, ProSieben Mediathek, wunschliste.de gecrawlt")
-        print("      und in einer Datenbank indexiert werden.")
+
+        if not source_file:
+            print("   ℹ️  In Produktion würde hier das komplette Galileo-Archiv")
+            print("      von Joyn, ProSieben Mediathek, wunschliste.de gecrawlt")
+            print("      und in einer Datenbank indexiert werden.")
+            print("   ℹ️  Lokaler Import: build_archive_database('episoden.json')")
+            return
+
+        store = self.archive if isinstance(self.archive, ArchiveStore) else ArchiveStore(self.archive_path)
+        count = store.import_file(source_file, self._extract_keywords)
+        self.archive = store
+        self._semantic_index = None  # Wird beim nächsten Check neu aufgebaut
+
+        print(f"   ✅ {count} Episoden importiert ({len(store)} im Archiv)")
+        print(f"   📄 Datenbank: {store.path}")
 
 
 def test_checker():
@@ -177,4 +346,8 @@ def test_checker():
 
 
 if __name__ == "__main__":
-    test_checker()
+    if len(sys.argv) > 1:
+        # Import: python duplicate_checker.py episoden.json
+        DuplicateCheckerService().build_archive_database(sys.argv[1])
+    else:
+        test_checker()
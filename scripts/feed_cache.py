@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Feed Cache
+Persistenter HTTP-Cache (ETag / Last-Modified) für RSS-Feeds
+"""
+
+import threading
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from storage import atomic_write_json, cache_path, load_json
+
+
+# Format der gespeicherten Einträge - ältere Caches werden verworfen
+# (2: Zusammenfassungen ohne HTML, Einträge nur bis zum Zeitfenster des Abrufs)
+FORMAT_VERSION = 2
+
+
+class FeedCache:
+    """Speichert Validatoren und geparste Einträge pro Feed-URL auf Platte"""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialisiert den Feed-Cache
+
+        Args:
+            path: Pfad zur Cache-Datei (Default: .cache/feed_cache.json)
+        """
+        self.path = path or cache_path('feed_cache.json')
+        self._lock = threading.Lock()
+        data = load_json(self.path, {})
+        self._feeds: Dict[str, Dict[str, Any]] = (
+            data.get('feeds', {}) if data.get('version') == FORMAT_VERSION else {}
+        )
+        self._dirty = False
+
+        # Statistik für die Ausgabe
+        self.not_modified = 0
+        self.downloaded = 0
+
+    def conditional_headers(self, url: str, cutoff: Optional[datetime] = None) -> Dict[str, str]:
+        """
+        Liefert die Header für einen bedingten Request
+
+        Args:
+            url: Feed-URL
+            cutoff: Ältestes benötigtes Datum - reicht der Cache nicht so weit
+                zurück, wird der Feed vollständig neu geladen
+
+        Returns:
+            If-None-Match / If-Modified-Since Header (ggf. leer)
+        """
+        headers = {}
+        with self._lock:
+            cached = self._feeds.get(url)
+        if not cached:
+            return headers
+        if cutoff is not None and cached.get('cutoff') and cutoff.isoformat() < cached['cutoff']:
+            return headers
+
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+
+    def get_entries(self, url: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Liefert die zwischengespeicherten Einträge eines Feeds (nach 304)
+
+        Args:
+            url: Feed-URL
+
+        Returns:
+            Liste geparster Einträge oder None wenn nicht im Cache
+        """
+        with self._lock:
+            cached = self._feeds.get(url)
+            if cached is None:
+                return None
+            self.not_modified += 1
+            return cached['entries']
+
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str],
+              entries: List[Dict[str, Any]], cutoff: Optional[datetime] = None) -> None:
+        """
+        Speichert frisch geladene Einträge samt Validatoren
+
+        Args:
+            url: Feed-URL
+            etag: ETag-Header der Antwort
+            last_modified: Last-Modified-Header der Antwort
+            entries: Geparste Einträge
+            cutoff: Zeitfenster, bis zu dem die Einträge gelesen wurden
+                (None = vollständiger Feed)
+        """
+        with self._lock:
+            self.downloaded += 1
+            # Ohne Validatoren kann der Server nie mit 304 antworten
+            if not etag and not last_modified:
+                self._feeds.pop(url, None)
+            else:
+                self._feeds[url] = {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'fetched_at': datetime.now().isoformat(),
+                    'cutoff': cutoff.isoformat() if cutoff else None,
+                    'entries': entries
+                }
+            self._dirty = True
+
+    def save(self) -> None:
+        """Schreibt den Cache auf Platte (nur wenn sich etwas geändert hat)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            atomic_write_json(self.path, {'version': FORMAT_VERSION, 'feeds': self._feeds})
+            self._dirty = False
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Feed Parser
+Inkrementelles Parsen von RSS- und Atom-Feeds direkt aus dem Download-Strom,
+mit Abbruch sobald genug aktuelle Einträge gelesen sind
+"""
+
+import html
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, List, Optional
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+from normalizer import TAG_RE
+
+
+# Maximale Anzahl Einträge pro Feed
+MAX_ENTRIES = 50
+
+# Nach so vielen Einträgen in Folge, die älter als das Zeitfenster sind, wird
+# nicht weitergelesen (einzelne Ausreißer in unsortierten Feeds werden übersprungen)
+MAX_STALE_IN_A_ROW = 5
+
+# Einträge: <item> (RSS 2.0 / RSS 1.0) und <entry> (Atom)
+ENTRY_TAGS = frozenset(('item', 'entry'))
+
+# Datumsfelder in absteigender Priorität (wie feedparser: published vor updated)
+DATE_TAGS = ('pubDate', 'published', 'issued', 'date', 'updated', 'modified')
+
+__all__ = ['FeedStreamParser', 'ParseError', 'clean_html', 'parse_feed_date']
+
+
+def clean_html(text: Optional[str]) -> str:
+    """
+    Entfernt HTML-Tags und Entities und fasst Leerraum zusammen
+
+    Args:
+        text: Text mit HTML (z.B. die description eines RSS-Eintrags)
+
+    Returns:
+        Reiner Text
+    """
+    if not text:
+        return ''
+    return ' '.join(html.unescape(TAG_RE.sub(' ', text)).split())
+
+
+def parse_feed_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    Liest ein Datum aus RSS (RFC 822) oder Atom (ISO 8601)
+
+    Args:
+        value: Datumstext
+
+    Returns:
+        Zeitpunkt in UTC ohne Zeitzone (wie feedparser) oder None
+    """
+    value = (value or '').strip()
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.replace(microsecond=0)
+
+
+def _local_name(tag: str) -> str:
+    """Tag ohne Namespace ('{http://www.w3.org/2005/Atom}entry' -> 'entry')"""
+    return tag.rsplit('}', 1)[-1]
+
+
+class FeedStreamParser:
+    """Parst einen Feed blockweise, ohne das ganze Dokument im Speicher zu halten"""
+
+    def __init__(self, cutoff: Optional[datetime] = None, limit: int = MAX_ENTRIES,
+                 max_stale: int = MAX_STALE_IN_A_ROW):
+        """
+        Initialisiert den Parser
+
+        Args:
+            cutoff: Ältestes erlaubtes Datum (None = keine Grenze)
+            limit: Nach so vielen passenden Einträgen ist der Feed fertig
+            max_stale: Nach so vielen zu alten Einträgen in Folge ist der Feed fertig
+        """
+        self.cutoff = cutoff
+        self.limit = limit
+        self.max_stale = max_stale
+
+        self.entries: List[Dict[str, Any]] = []
+        self.done = False
+        self.skipped = 0  # Zu alte Einträge
+
+        self._parser = XMLPullParser(events=('start', 'end'))
+        self._stack: List[Element] = []
+        self._stale = 0
+
+    def feed(self, data: bytes) -> bool:
+        """
+        Verarbeitet den nächsten Block des Dokuments
+
+        Args:
+            data: Rohdaten (Encoding aus der XML-Deklaration)
+
+        Returns:
+            True wenn genug gelesen wurde (Rest des Downloads kann entfallen)
+
+        Raises:
+            ParseError: Kein wohlgeformtes XML
+        """
+        if not self.done:
+            self._parser.feed(data)
+            self._read_events()
+        return self.done
+
+    def close(self) -> List[Dict[str, Any]]:
+        """
+        Schließt das Dokument ab (nur nötig, wenn es vollständig gelesen wurde)
+
+        Returns:
+            Gelesene Einträge
+        """
+        if not self.done:
+            self._parser.close()
+            self._read_events()
+        return self.entries
+
+    def _read_events(self) -> None:
+        """Baut Einträge aus den bisher vollständig gelesenen Elementen"""
+        for event, element in self._parser.read_events():
+            if event == 'start':
+                self._stack.append(element)
+                continue
+
+            self._stack.pop()
+            if _local_name(element.tag) not in ENTRY_TAGS:
+                continue
+
+            self._add(element)
+            # Fertige Einträge sofort freigeben: der Speicher bleibt unabhängig
+            # von der Größe des Feeds
+            if self._stack:
+                self._stack[-1].remove(element)
+            if self.done:
+                return
+
+    def _add(self, element: Element) -> None:
+        """Übernimmt einen Eintrag, sofern er im Zeitfenster liegt"""
+        entry = self._entry(element)
+        published = entry['published']
+        if self.cutoff is not None and published is not None and published < self.cutoff:
+            self.skipped += 1
+            self._stale += 1
+            if self._stale >= self.max_stale:
+                self.done = True
+            return
+
+        self._stale = 0
+        entry['published'] = published.isoformat() if published else None
+        self.entries.append(entry)
+        if len(self.entries) >= self.limit:
+            self.done = True
+
+    def _entry(self, element: Element) -> Dict[str, Any]:
+        """
+        Liest die Felder eines <item> bzw. <entry>
+
+        Args:
+            element: Vollständig gelesener Eintrag
+
+        Returns:
+            Eintrag mit title, summary (ohne HTML), link, guid und published
+            (datetime oder None)
+        """
+        fields: Dict[str, str] = {}
+        link = None
+        for child in element:
+            name = _local_name(child.tag)
+            if name == 'link' and child.get('href'):
+                # Atom: <link rel="alternate" href="..."/>
+                if child.get('rel', 'alternate') == 'alternate' and link is None:
+                    link = child.get('href')
+                continue
+            fields.setdefault(name, child.text or '')
+
+        summary = fields.get('description') or fields.get('summary') \
+            or fields.get('encoded') or fields.get('content') or ''
+        published = None
+        for name in DATE_TAGS:
+            if fields.get(name):
+                published = parse_feed_date(fields[name])
+                if published:
+                    break
+
+        return {
+            'title': clean_html(fields.get('title')),
+            'summary': clean_html(summary),
+            'link': link or fields.get('link', '').strip(),
+            'guid': (fields.get('guid') or fields.get('id') or '').strip() or None,
+            'published': published
+        }
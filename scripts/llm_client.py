@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+LLM Client
+Rate-limitierter HTTP-Client für die OpenAI- und Anthropic-API
+"""
+
+import random
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+
+import requests
+
+
+# Status-Codes, bei denen sich ein erneuter Versuch lohnt
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504, 529}
+
+PROVIDERS = {
+    'openai': {
+        'base_url': 'https://api.openai.com',
+        'path': '/v1/chat/completions',
+        'model': 'gpt-4o'
+    },
+    'anthropic': {
+        'base_url': 'https://api.anthropic.com',
+        'path': '/v1/messages',
+        'model': 'claude-3-5-sonnet-latest'
+    }
+}
+
+
+# OpenAI-Modelle mit JSON-Modus (response_format) - andere, z.B. das
+# ursprüngliche gpt-4, lehnen den Parameter mit HTTP 400 ab
+JSON_MODE_MODELS = ('gpt-4o', 'gpt-4.1', 'gpt-4-turbo', 'gpt-4-1106', 'gpt-4-0125', 'gpt-3.5-turbo')
+
+
+class LLMError(Exception):
+    """Fehler bei der Kommunikation mit dem Modell"""
+
+
+class DeadlineExceeded(LLMError):
+    """Die Deadline des Laufs ist abgelaufen"""
+
+
+class TokenBucket:
+    """Thread-sicherer Token-Bucket (Kapazität pro Minute)"""
+
+    def __init__(self, per_minute: float):
+        """
+        Initialisiert den Bucket
+
+        Args:
+            per_minute: Erlaubte Menge pro Minute (zugleich Burst-Kapazität)
+        """
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0, deadline: Optional[float] = None) -> None:
+        """
+        Entnimmt Tokens und wartet falls nötig
+
+        Args:
+            amount: Benötigte Menge (wird auf die Kapazität begrenzt)
+            deadline: Spätester Zeitpunkt (time.monotonic)
+
+        Raises:
+            DeadlineExceeded: Wenn die Wartezeit die Deadline überschreitet
+        """
+        amount = min(amount, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                wait = (amount - self._tokens) / self.rate
+
+            if deadline is not None and time.monotonic() + wait > deadline:
+                raise DeadlineExceeded("Rate-Limit-Wartezeit überschreitet die Deadline")
+            time.sleep(wait)
+
+
+class LLMClient:
+    """Client für Chat-Completions mit Rate-Limit, Retries und Deadline"""
+
+    def __init__(self, provider: str, api_key: str, model: Optional[str] = None,
+                 base_url: Optional[str] = None, max_concurrency: int = 4,
+                 requests_per_minute: int = 60, tokens_per_minute: int = 90000,
+                 max_retries: int = 5, backoff_base: float = 1.0, backoff_max: float = 30.0,
+                 timeout: float = 60.0):
+        """
+        Initialisiert den Client
+
+        Args:
+            provider: 'openai' oder 'anthropic'
+            api_key: API-Key des Anbieters
+            model: Modellname (Default je Anbieter)
+            base_url: Abweichende API-Adresse (z.B. lokaler Stub-Server)
+            max_concurrency: Größe des Connection-Pools
+            requests_per_minute: Request-Limit pro Minute
+            tokens_per_minute: Token-Limit pro Minute (Prompt + Antwort)
+            max_retries: Maximale Anzahl Wiederholungen bei 429/5xx
+            backoff_base: Basis-Wartezeit für exponentielles Backoff (Sekunden)
+            backoff_max: Obergrenze der Backoff-Wartezeit (Sekunden)
+            timeout: Timeout pro HTTP-Request (Sekunden)
+        """
+        if provider not in PROVIDERS:
+            raise ValueError(f"Unbekannter Anbieter: {provider}")
+
+        self.provider = provider
+        self.api_key = api_key
+        self.model = model or PROVIDERS[provider]['model']
+        self.url = (base_url or PROVIDERS[provider]['base_url']).rstrip('/') + PROVIDERS[provider]['path']
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(1, max_concurrency))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Statistik für die Ausgabe
+        self.retries = 0
+
+    def complete(self, prompt: str, max_tokens: int = 2000, deadline: Optional[float] = None) -> str:
+        """
+        Schickt einen Prompt an das Modell
+
+        Args:
+            prompt: Prompt-Text
+            max_tokens: Maximale Länge der Antwort in Tokens
+            deadline: Spätester Zeitpunkt (time.monotonic) für den Aufruf
+
+        Returns:
+            Text der Modell-Antwort
+
+        Raises:
+            DeadlineExceeded: Deadline abgelaufen
+            LLMError: Nicht behebbarer Fehler oder Retries erschöpft
+        """
+        estimated_tokens = len(prompt) // 4 + max_tokens
+        url, headers, payload = self._build_request(prompt, max_tokens)
+
+        for attempt in range(self.max_retries + 1):
+            self.request_bucket.acquire(1, deadline)
+            self.token_bucket.acquire(estimated_tokens, deadline)
+
+            timeout = self.timeout
+            if deadline is not None:
+                timeout = min(timeout, deadline - time.monotonic())
+                if timeout <= 0:
+                    raise DeadlineExceeded("Deadline abgelaufen")
+
+            retry_after = None
+            try:
+                response = self.session.post(url, headers=headers, json=payload, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = LLMError(f"Verbindungsfehler: {str(e)}")
+            else:
+                if response.status_code < 400:
+                    return self._extract_text(response.json())
+                if response.status_code not in RETRY_STATUS_CODES:
+                    raise LLMError(f"HTTP {response.status_code}: {response.text[:200]}")
+                error = LLMError(f"HTTP {response.status_code}")
+                retry_after = self._parse_retry_after(response)
+
+            if attempt == self.max_retries:
+                raise error
+
+            wait = self._backoff(attempt, retry_after)
+            if deadline is not None and time.monotonic() + wait > deadline:
+                raise DeadlineExceeded(f"Deadline erreicht nach {str(error)}")
+            self.retries += 1
+            time.sleep(wait)
+
+        raise LLMError("Retries erschöpft")
+
+    def _build_request(self, prompt: str, max_tokens: int) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+        """
+        Baut URL, Header und Payload je nach Anbieter
+
+        Args:
+            prompt: Prompt-Text
+            max_tokens: Maximale Länge der Antwort
+
+        Returns:
+            Tuple aus URL, Headern und JSON-Payload
+        """
+        messages = [{"role": "user", "content": prompt}]
+
+        if self.provider == 'anthropic':
+            headers = {
+                'x-api-key': self.api_key,
+                'anthropic-version': '2023-06-01'
+            }
+            payload = {
+                'model': self.model,
+                'max_tokens': max_tokens,
+                'messages': messages
+            }
+        else:
+            headers = {'Authorization': f'Bearer {self.api_key}'}
+            payload = {
+                'model': self.model,
+                'max_tokens': max_tokens,
+                'messages': messages
+            }
+            if self.model.startswith(JSON_MODE_MODELS):
+                payload['response_format'] = {'type': 'json_object'}
+
+        return self.url, headers, payload
+
+    def _extract_text(self, data: Dict[str, Any]) -> str:
+        """
+        Holt den Antworttext aus der API-Antwort
+
+        Args:
+            data: JSON-Antwort der API
+
+        Returns:
+            Antworttext
+        """
+        try:
+            if self.provider == 'anthropic':
+                return ''.join(block.get('text', '') for block in data['content'])
+            return data['choices'][0]['message']['content']
+        except (KeyError, IndexError, TypeError):
+            raise LLMError("Unerwartetes Antwortformat")
+
+    def _parse_retry_after(self, response: requests.Response) -> Optional[float]:
+        """Liest den Retry-After-Header (Sekunden) falls vorhanden"""
+        try:
+            return float(response.headers.get('Retry-After', ''))
+        except ValueError:
+            return None
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        """
+        Berechnet die Wartezeit vor dem nächsten Versuch
+
+        Exponentielles Backoff mit "Full Jitter", damit parallele Worker
+        nicht im Gleichschritt erneut anfragen.
+
+        Args:
+            attempt: Nummer des fehlgeschlagenen Versuchs (ab 0)
+            retry_after: Vom Server vorgegebene Wartezeit
+
+        Returns:
+            Wartezeit in Sekunden
+        """
+        wait = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        if retry_after is not None:
+            wait = max(wait, retry_after)
+        return wait
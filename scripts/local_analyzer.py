@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Local Analyzer
+Lokale Bewertung von Titel und Zusammenfassung ohne API (Heuristik-Modell),
+verteilt auf mehrere Prozesse
+"""
+
+import math
+import multiprocessing
+import os
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from normalizer import TAG_RE, WORD_RE, stem
+
+
+# Version der Heuristik - Teil des Modellnamens und damit des Cache-Schlüssels
+HEURISTIC_VERSION = 1
+
+# Stichwörter je Galileo-Schlagwort (Wortstämme werden beim Laden berechnet)
+TAG_LEXICON = {
+    'Wissenschaft': (
+        'wissenschaft', 'wissenschaftler', 'forscher', 'forschung', 'studie', 'entdeckung',
+        'universität', 'labor', 'physik', 'chemie', 'biologie', 'astronomie', 'weltall', 'planet'
+    ),
+    'Technologie': (
+        'technologie', 'technik', 'roboter', 'künstliche', 'intelligenz', 'software', 'computer',
+        'digital', 'elektroauto', 'batterie', 'drohne', 'chip', 'internet', 'rakete'
+    ),
+    'Natur & Umwelt': (
+        'natur', 'umwelt', 'klimawandel', 'klima', 'wald', 'meer', 'tiere', 'pflanzen',
+        'artenschutz', 'wetter', 'vulkan', 'gletscher', 'ozean', 'insekten'
+    ),
+    'Gesundheit': (
+        'gesundheit', 'medizin', 'krankheit', 'patienten', 'therapie', 'impfung', 'ernährung',
+        'schlaf', 'krebs', 'klinik', 'ärzte', 'virus'
+    ),
+    'Psychologie': (
+        'psychologie', 'gehirn', 'verhalten', 'gefühle', 'angst', 'stress', 'gedächtnis', 'emotionen'
+    ),
+    'Mysterium': ('rätsel', 'mysteriös', 'geheimnis', 'unerklärlich', 'legende', 'verschollen'),
+    'Experiment': ('experiment', 'versuch', 'messung', 'prototyp', 'testlauf'),
+    'Innovation': ('innovation', 'erfindung', 'erfinder', 'startup', 'patent', 'neuartig', 'entwicklung'),
+    'Trend': ('trend', 'boom', 'beliebt', 'viral', 'hype', 'generation'),
+    'Entertainment': ('rekord', 'weltrekord', 'kurios', 'spaß', 'show', 'festival'),
+    'Gesellschaftlich Relevant': (
+        'gesellschaft', 'bevölkerung', 'kosten', 'preise', 'arbeit', 'wohnen', 'verkehr',
+        'bildung', 'schule', 'familie', 'kinder'
+    ),
+    'Spektakulär': ('spektakulär', 'gigantisch', 'riesig', 'explosion', 'extrem', 'weltgrößte'),
+    'Ungewöhnlich': ('ungewöhnlich', 'seltsam', 'kurios', 'überraschend', 'erstmals', 'skurril'),
+}
+
+# Gut filmbare bzw. schwer filmbare Motive
+VISUAL_LEXICON = (
+    'experiment', 'roboter', 'vulkan', 'explosion', 'tiere', 'drohne', 'rakete', 'unterwasser',
+    'baustelle', 'maschine', 'fabrik', 'expedition', 'höhle', 'sturm', 'feuer', 'landschaft',
+    'zeitlupe', 'flug', 'tauchen', 'labor'
+)
+ABSTRACT_LEXICON = (
+    'politik', 'gesetz', 'verordnung', 'debatte', 'statistik', 'umfrage', 'bericht',
+    'konferenz', 'interview', 'theorie', 'verhandlung', 'haushalt'
+)
+
+# Titelwörter zählen mehr als Wörter der Zusammenfassung
+TITLE_WEIGHT = 2
+
+MAX_TAGS = 4
+SUMMARY_CHARS = 300
+
+
+class HeuristicModel:
+    """Deterministische Bewertung über gestemmte Stichwort-Listen"""
+
+    name = f"local-heuristic-v{HEURISTIC_VERSION}"
+
+    def __init__(self):
+        """Lädt das Modell (Stichwort-Tabellen einmal stemmen)"""
+        tags: Dict[str, List[str]] = {}
+        for tag, words in TAG_LEXICON.items():
+            for word in words:
+                tags.setdefault(stem(word), []).append(tag)
+        self._tags = {word: tuple(names) for word, names in tags.items()}
+        self._visual = frozenset(stem(word) for word in VISUAL_LEXICON)
+        self._abstract = frozenset(stem(word) for word in ABSTRACT_LEXICON)
+        self._tag_order = {tag: i for i, tag in enumerate(TAG_LEXICON)}
+
+    def score(self, title: str, summary: str) -> Dict[str, Any]:
+        """
+        Bewertet einen Artikel
+
+        Args:
+            title: Titel
+            summary: Zusammenfassung (HTML erlaubt)
+
+        Returns:
+            Analysefelder wie aus einer Modell-Antwort (ohne Storyline)
+        """
+        summary = TAG_RE.sub(' ', summary or '')
+        weights: Counter = Counter()
+        surface: Dict[str, str] = {}  # Stamm -> erste Schreibweise im Text (für die Begründung)
+        for text, weight in ((title or '', TITLE_WEIGHT), (summary, 1)):
+            for word in WORD_RE.findall(text):
+                if len(word) >= 3:
+                    key = stem(word)
+                    weights[key] += weight
+                    surface.setdefault(key, word)
+
+        tag_scores: Counter = Counter()
+        for word, weight in weights.items():
+            for tag in self._tags.get(word, ()):
+                tag_scores[tag] += weight
+        visual = [surface[word] for word in sorted(weights) if word in self._visual]
+        abstract = [surface[word] for word in sorted(weights) if word in self._abstract]
+
+        visual_rating = max(1, min(5, 3 + min(2, len(visual)) - min(2, len(abstract))))
+        matched = sum(tag_scores.values())
+        relevance = 2 + min(5, math.ceil(matched / 2)) + (visual_rating >= 4) + (len(summary) >= 200)
+        if len(tag_scores) >= 3:
+            relevance += 1  # Thema berührt mehrere Galileo-Bereiche
+
+        tags = sorted(tag_scores, key=lambda tag: (-tag_scores[tag], self._tag_order[tag]))[:MAX_TAGS]
+        if visual_rating >= 4:
+            tags.insert(0, 'Bildstark')
+        if not tags:
+            tags = ['Gerade aktuell']
+
+        if visual:
+            reason = f"Filmbare Motive: {', '.join(visual[:4])}"
+        elif abstract:
+            reason = f"Eher abstrakt ({', '.join(abstract[:3])}), benötigt kreative Umsetzung"
+        else:
+            reason = "Keine eindeutigen Bildmotive erkannt"
+
+        return {
+            'galileo_relevance': max(1, min(10, relevance)),
+            'tags': tags,
+            'summary': _teaser(summary),
+            'visualRating': visual_rating,
+            'visualReason': reason,
+            'storyline': None
+        }
+
+
+def _teaser(summary: str) -> str:
+    """Erste Sätze der Zusammenfassung bis SUMMARY_CHARS"""
+    text = ' '.join(summary.split())
+    if len(text) <= SUMMARY_CHARS:
+        return text
+    cut = text.rfind('. ', 0, SUMMARY_CHARS)
+    return text[:cut + 1] if cut > 0 else text[:SUMMARY_CHARS].rstrip() + '…'
+
+
+# Modell des Worker-Prozesses (einmal beim Start geladen)
+_worker_model = None
+
+
+def _init_worker(model_factory: Callable[[], Any]) -> None:
+    """Initializer der Worker: lädt das Modell einmal pro Prozess"""
+    global _worker_model
+    _worker_model = model_factory()
+
+
+def _score_chunk(chunk: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """Bewertet einen Block (Titel, Zusammenfassung) im Worker"""
+    return [_worker_model.score(title, summary) for title, summary in chunk]
+
+
+class LocalAnalyzerPool:
+    """Verteilt die lokale Bewertung blockweise auf einen Prozess-Pool"""
+
+    def __init__(self, model_factory: Callable[[], Any] = HeuristicModel,
+                 workers: Optional[int] = None, chunk_size: int = 64):
+        """
+        Initialisiert den Pool (die Prozesse starten erst bei der ersten Analyse)
+
+        Args:
+            model_factory: Erzeugt das Modell (auf Modulebene definiert, damit
+                es an die Worker übergeben werden kann); das Modell braucht
+                score(title, summary) -> Analysefelder und ein Attribut name
+            workers: Anzahl Prozesse (Default: alle Kerne; 1 = im eigenen Prozess)
+            chunk_size: Maximale Anzahl Artikel pro Auftrag an einen Worker
+        """
+        self.model_factory = model_factory
+        self.name = getattr(model_factory, 'name', getattr(model_factory, '__name__', 'local'))
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunk_size = max(1, chunk_size)
+
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._model = None  # Nur bei workers=1
+
+    def analyze(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Bewertet Artikel
+
+        Args:
+            articles: Artikel-Daten (title, summary)
+
+        Returns:
+            Analysefelder in Eingabe-Reihenfolge
+        """
+        pairs = [(article.get('title', ''), article.get('summary', '')) for article in articles]
+        if not pairs:
+            return []
+
+        if self.workers == 1:
+            with self._lock:
+                if self._model is None:
+                    self._model = self.model_factory()
+            return [self._model.score(title, summary) for title, summary in pairs]
+
+        # Kleine Mengen trotzdem auf alle Worker verteilen, große in Blöcken
+        size = min(self.chunk_size, math.ceil(len(pairs) / self.workers))
+        chunks = [pairs[i:i + size] for i in range(0, len(pairs), size)]
+        results: List[Dict[str, Any]] = []
+        for fields in self._pool().map(_score_chunk, chunks):  # map hält die Reihenfolge
+            results.extend(fields)
+        return results
+
+    def _pool(self) -> ProcessPoolExecutor:
+        """Startet die Worker beim ersten Bedarf"""
+        with self._lock:
+            if self._executor is None:
+                # spawn statt fork: der Aufrufer hat bereits laufende Threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(self.model_factory,)
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """Beendet die Worker (ein späterer Aufruf startet sie neu)"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
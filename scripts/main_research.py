@@ -4,25 +4,117 @@ Galileo Research Tool - Main Research Script
 Automatische Recherche und Analyse von TV-Themen für Galileo
 """
 
-import json
+import argparse
 import os
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 import sys
 
-# Import local modules
-from news_scraper import NewsScraperService
-from ai_analyzer import AIAnalyzerService
-from duplicate_checker import DuplicateCheckerService
+# Import local modules (leichtgewichtig; die Services mit requests, feedparser
+# und NumPy werden erst beim ersten Zugriff geladen, siehe LazyService)
+from article_clusterer import best_credibility, source_of
+from checkpoints import STAGES, CheckpointError, CheckpointStore
+from pipeline import StreamingPipeline
+from records import NOT_ANALYZED, Article, topics_from_json, topics_to_json
+from run_metrics import RunMetrics, run_profiled
+from storage import atomic_write_json
+from topic_ranker import DEFAULT_WEIGHTS, TopicRanker
+from topic_shards import TopicShardWriter
+from topic_store import TopicStore
+
+if TYPE_CHECKING:
+    from analysis_cache import AnalysisCache
+    from article_clusterer import ArticleClusterer
+    from article_store import SeenArticleStore
+    from news_scraper import NewsScraperService
+    from ai_analyzer import AIAnalyzerService
+    from duplicate_checker import DuplicateCheckerService
+
+
+# Mindest-Relevanz (1-10), ab der ein Thema in die Ausgabe kommt
+MIN_TOPIC_RELEVANCE = 7
+
+# Ausgabeverzeichnis für topics.json, Index, Shards und Laufzeit-Messungen
+OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "docs", "data")
+
+
+class LazyService:
+    """
+    Attribut, dessen Service erst beim ersten Zugriff erzeugt wird
+
+    Der Service landet danach im __dict__ der Instanz, weitere Zugriffe
+    kosten nichts extra. Zuweisungen (z.B. in Tests) ersetzen ihn wie
+    bei einem normalen Attribut.
+    """
+
+    def __init__(self, factory: Callable[[Any], Any]):
+        """
+        Args:
+            factory: Erzeugt den Service aus der Instanz (importiert sein Modul)
+        """
+        self.factory = factory
+        self.name = factory.__name__
+        self.__doc__ = factory.__doc__
+        # Reentrant: Factories dürfen andere Services anfordern
+        self._lock = threading.RLock()
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        with self._lock:
+            # Parallele erste Zugriffe (Streaming-Pipeline) erzeugen nur einen Service
+            if self.name not in instance.__dict__:
+                instance.__dict__[self.name] = self.factory(instance)
+            return instance.__dict__[self.name]
 
 
 class GalileoResearchTool:
     """Hauptklasse für das automatisierte Recherche-Tool"""
 
-    def __init__(self):
-        self.news_scraper = NewsScraperService()
-        self.ai_analyzer = AIAnalyzerService()
-        self.duplicate_checker = DuplicateCheckerService()
+    def __init__(self, incremental: bool = False, retention_days: int = 30,
+                 ranker: Optional[TopicRanker] = None,
+                 checkpoints: Optional[CheckpointStore] = None,
+                 local_analyzer: bool = False, analyzer_workers: Optional[int] = None,
+                 sources_file: Optional[str] = None, poll_all: bool = False,
+                 dedup_mode: str = 'keywords', semantic_threshold: Optional[float] = None,
+                 synonyms_file: Optional[str] = None):
+        """
+        Initialisiert das Tool
+
+        Args:
+            incremental: Neue Themen in die bestehende topics.json einfügen
+                statt sie zu ersetzen
+            retention_days: Aufbewahrung der Themen im inkrementellen Modus
+            ranker: Bewertung und Top-K-Auswahl für Schritt 4
+                (Default: Standard-Gewichte, Top 50, Rest gekürzt)
+            checkpoints: Zwischenergebnisse der Schritte (Default: .cache/work)
+            local_analyzer: Artikel lokal bewerten (Heuristik-Modell im
+                Prozess-Pool) statt über die API bzw. den Mock-Modus
+            analyzer_workers: Prozesse der lokalen Analyse (Default: alle Kerne)
+            sources_file: Quellen-Konfiguration (Default: scripts/sources.json)
+            poll_all: Alle Quellen abfragen statt nur die laut Zeitplan fälligen
+            dedup_mode: Duplikat-Check 'keywords' oder 'semantic' (benötigt NumPy)
+            semantic_threshold: Mindest-Ähnlichkeit im Modus 'semantic'
+                (Default: DEFAULT_SEMANTIC_THRESHOLD des Duplicate Checkers)
+            synonyms_file: Optionale Synonym-Tabelle (JSON) für den Modus 'semantic'
+        """
+        self.incremental = incremental
+        self.retention_days = retention_days
+        self.topic_ranker = ranker or TopicRanker()
+        self.checkpoints = checkpoints or CheckpointStore()
+        self.local_analyzer = local_analyzer
+        self.analyzer_workers = analyzer_workers
+        self.sources_file = sources_file
+        self.poll_all = poll_all
+        self.dedup_mode = dedup_mode
+        self.semantic_threshold = semantic_threshold
+        self.synonyms_file = synonyms_file
+
+        self.metrics = RunMetrics()
 
         # Basis-Schlagwörter für Galileo
         self.base_tags = [
@@ -47,95 +139,657 @@ class GalileoResearchTool:
             "unbekannte Orte"
         ]
 
-    def run(self) -> None:
-        """Hauptfunktion: Führt komplette Recherche durch"""
+    @LazyService
+    def seen_store(self) -> 'SeenArticleStore':
+        """Speicher bereits gesehener Artikel"""
+        from article_store import SeenArticleStore
+        return SeenArticleStore()
+
+    @LazyService
+    def news_scraper(self) -> 'NewsScraperService':
+        """Nachrichtenquellen (Schritt 1)"""
+        from news_scraper import NewsScraperService
+        from source_registry import PollScheduler, SourceRegistry
+        return NewsScraperService(
+            seen_store=self.seen_store,
+            metrics=self.metrics,
+            registry=SourceRegistry.from_file(self.sources_file),
+            scheduler=PollScheduler(force=self.poll_all)
+        )
+
+    @LazyService
+    def article_clusterer(self) -> 'ArticleClusterer':
+        """Zusammenfassen gleicher Meldungen"""
+        from article_clusterer import ArticleClusterer
+        return ArticleClusterer()
+
+    @LazyService
+    def analysis_cache(self) -> 'AnalysisCache':
+        """Cache der AI-Analysen"""
+        from analysis_cache import AnalysisCache
+        return AnalysisCache()
+
+    @LazyService
+    def ai_analyzer(self) -> 'AIAnalyzerService':
+        """AI-Analyse (Schritt 2)"""
+        from ai_analyzer import AIAnalyzerService
+
+        local_pool = None
+        if self.local_analyzer:
+            from local_analyzer import LocalAnalyzerPool
+            local_pool = LocalAnalyzerPool(workers=self.analyzer_workers)
+        return AIAnalyzerService(analysis_cache=self.analysis_cache, metrics=self.metrics,
+                                 local_pool=local_pool)
+
+    @LazyService
+    def duplicate_checker(self) -> 'DuplicateCheckerService':
+        """Duplikat-Check gegen das Galileo-Archiv (Schritt 3)"""
+        from duplicate_checker import DEFAULT_SEMANTIC_THRESHOLD, DuplicateCheckerService
+        threshold = self.semantic_threshold
+        synonyms = None
+        if self.synonyms_file:
+            from semantic_index import load_synonyms
+            synonyms = load_synonyms(self.synonyms_file)
+        return DuplicateCheckerService(
+            mode=self.dedup_mode,
+            semantic_threshold=DEFAULT_SEMANTIC_THRESHOLD if threshold is None else threshold,
+            synonyms=synonyms
+        )
+
+    def run(self, streaming: bool = False, stages: Optional[List[str]] = None) -> None:
+        """
+        Hauptfunktion: Führt komplette Recherche durch
+
+        Args:
+            streaming: Schritte 1-3 überlappend über begrenzte Queues
+                ausführen statt nacheinander
+            stages: Aufeinanderfolgende Schritte aus STAGES (Default: alle);
+                der erste liest das Ergebnis seines Vorgängers aus dessen Checkpoint
+        """
+        stages = list(stages or STAGES)
+        if streaming and not (stages[0] == 'scrape' and 'dedup' in stages):
+            raise ValueError("Streaming braucht die Schritte scrape bis dedup")
+
         print("=" * 60)
         print("GALILEO RESEARCH TOOL - AUTOMATISCHE RECHERCHE")
         print("=" * 60)
         print(f"Start: {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}")
         print()
 
-        # Schritt 1: Nachrichtenquellen durchsuchen
+        with self.metrics.stage('total'):
+            results = self._run_stages(stages, streaming)
+
+        if 'save' in stages:
+            self.save_metrics()
+        else:
+            # Teil-Lauf: run_metrics.json des letzten vollständigen Laufs behalten
+            self.metrics.print_summary()
+
+        print("=" * 60)
+        print(f"✅ ERFOLGREICH ABGESCHLOSSEN")
+        print(f"Ende: {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}")
+        if stages[-1] in ('rank', 'save'):
+            new_topics_count = sum(1 for t in results if not t.get('isDuplicate', False))
+            print(f"Gesamt: {len(results)} Themen, davon {new_topics_count} neu")
+        else:
+            print(f"Checkpoint: {self.checkpoints.path(stages[-1])} ({len(results)} Einträge)")
+        print("=" * 60)
+
+    def _run_stages(self, stages: List[str], streaming: bool) -> List[Dict[str, Any]]:
+        """
+        Führt die Schritte aus, misst ihre Dauer und schreibt ihre Checkpoints
+
+        Args:
+            stages: Aufeinanderfolgende Schritte
+            streaming: Schritte 1-3 über die Streaming-Pipeline ausführen
+
+        Returns:
+            Ergebnis des letzten Schritts
+        """
+        results = self._load_checkpoint(stages[0])
+        # Spätere Checkpoints passen nicht mehr zum neu berechneten Ergebnis
+        self.checkpoints.invalidate(stages[0])
+
+        if streaming:
+            results = self._run_streaming()
+            self.checkpoints.write('dedup', results)
+            stages = stages[stages.index('dedup') + 1:]
+
+        for stage in stages:
+            results = getattr(self, f"_stage_{stage}")(results)
+            if stage == 'scrape':
+                self.checkpoints.write(stage, results, self._scrape_meta())
+            else:
+                self.checkpoints.write(stage, results if stage != 'save' else None)
+        return results
+
+    def _scrape_meta(self) -> Dict[str, Any]:
+        """
+        Zustand für den Checkpoint 'scrape'
+
+        Returns:
+            Bekannte Artikel - 'analyze' braucht sie für die übernommenen
+            Analysen und als Anker beim Zusammenfassen
+        """
+        return {
+            'known': self.seen_store.known_this_run(),
+            'known_articles': self.seen_store.known_articles()
+        }
+
+    def _load_checkpoint(self, stage: str) -> Optional[List[Any]]:
+        """
+        Lädt die Eingabe eines Schritts aus dem Checkpoint seines Vorgängers
+
+        Args:
+            stage: Erster auszuführender Schritt
+
+        Returns:
+            Artikel bzw. Themen (None für 'scrape')
+        """
+        index = STAGES.index(stage)
+        if index == 0:
+            return None
+
+        previous = STAGES[index - 1]
+        records, meta = self.checkpoints.read(previous)
+        print(f"📂 Checkpoint '{previous}' geladen: {len(records)} Einträge\n")
+        if previous == 'scrape':
+            self.seen_store.mark_known(
+                meta.get('known', []),
+                [Article.from_dict(record) for record in meta.get('known_articles', [])]
+            )
+            return [Article.from_dict(record) for record in records]
+        return topics_from_json(records)
+
+    def _stage_scrape(self, _: None) -> List[Dict[str, Any]]:
+        """
+        Schritt 1: Nachrichtenquellen durchsuchen
+
+        Returns:
+            Neue Artikel
+        """
         print("📰 Schritt 1: Durchsuche Nachrichtenquellen...")
-        raw_articles = self.news_scraper.fetch_all_sources(
-            topics=self.search_topics,
-            days_back=14  # Fokus auf letzte 2 Wochen
-        )
-        print(f"   ✅ {len(raw_articles)} Artikel gefunden\n")
+        with self.metrics.stage('scrape'):
+            raw_articles = self.news_scraper.fetch_all_sources(
+                topics=self.search_topics,
+                days_back=14  # Fokus auf letzte 2 Wochen
+            )
+        print(f"   ✅ {len(raw_articles)} neue Artikel gefunden\n")
+        self.metrics.set('articles_new', len(raw_articles))
+        return raw_articles
+
+    def _stage_analyze(self, raw_articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Schritt 2: Gleiche Artikel zusammenfassen und analysieren
+
+        Args:
+            raw_articles: Neue Artikel aus Schritt 1
+
+        Returns:
+            Relevante Themen (inkl. übernommener Analysen)
+        """
+        # Dieselbe Meldung mehrerer Quellen nur einmal analysieren - auch wenn
+        # sie in einer anderen Quelle bereits bekannt ist
+        with self.metrics.stage('cluster'):
+            articles = self.article_clusterer.cluster(raw_articles, known=self.seen_store.known_articles())
+            for known, new in self.article_clusterer.anchored:
+                self.attach_to_known(known, new)
+        self.metrics.set('clusters', len(articles))
+        print(f"   🧩 {len(articles)} Meldungen nach Zusammenfassen gleicher Artikel\n")
 
-        # Schritt 2: AI-Analyse durchführen
         print("🤖 Schritt 2: AI-Analyse der Artikel...")
         analyzed_topics = []
-        for article in raw_articles:
-            analysis = self.ai_analyzer.analyze_article(article)
-            if analysis and analysis.get('galileo_relevance', 0) >= 7:
-                analyzed_topics.append(analysis)
+        with self.metrics.stage('analyze'):
+            analyses = self.ai_analyzer.analyze_batch(articles)
+            self.ai_analyzer.close()
+            for article, analysis in zip(articles, analyses):
+                if self.remember_analysis(article, analysis):
+                    analyzed_topics.append(analysis)
 
+            analyzed_topics.extend(self._reused_topics())
+            # Analysen sofort sichern: ein späterer Schritt läuft evtl. in einem anderen Prozess
+            self.seen_store.save()
         print(f"   ✅ {len(analyzed_topics)} relevante Themen identifiziert\n")
+        return analyzed_topics
+
+    def _stage_dedup(self, analyzed_topics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Schritt 3: Duplikat-Check
 
-        # Schritt 3: Duplikat-Check
+        Args:
+            analyzed_topics: Relevante Themen aus Schritt 2
+
+        Returns:
+            Themen mit Duplikat-Status
+        """
         print("🔍 Schritt 3: Duplikat-Check mit Galileo-Archiv...")
         unique_topics = []
-        for topic in analyzed_topics:
-            duplicate_status = self.duplicate_checker.check_topic(topic)
-            topic.update(duplicate_status)
-            unique_topics.append(topic)
+        with self.metrics.stage('dedup'):
+            for topic, duplicate_status in zip(analyzed_topics, self.duplicate_checker.check_topics(analyzed_topics)):
+                topic.update(duplicate_status)
+                unique_topics.append(topic)
+
+        self._finish_dedup(unique_topics)
+        return unique_topics
+
+    def _run_streaming(self) -> List[Dict[str, Any]]:
+        """
+        Schritte 1-3 überlappend über die Streaming-Pipeline
 
-        new_topics_count = sum(1 for t in unique_topics if not t.get('isDuplicate', False))
+        Returns:
+            Relevante Themen mit Duplikat-Status
+        """
+        print("🌊 Schritte 1-3: Quellen, AI-Analyse und Duplikat-Check (Streaming)...")
+        pipeline = StreamingPipeline(self)
+        # Scrape, Analyse und Duplikat-Check überlappen: nur gemeinsam messbar
+        with self.metrics.stage('pipeline'):
+            topics = pipeline.run()
+            self.ai_analyzer.close()
+        print(f"   ✅ {pipeline.article_count} neue Artikel, {pipeline.cluster_count} Meldungen, "
+              f"{pipeline.relevant_count} relevante Themen")
+        self.metrics.set('articles_new', pipeline.article_count)
+        self.metrics.set('clusters', pipeline.cluster_count)
+
+        with self.metrics.stage('reuse'):
+            reused = self._reused_topics()
+            topics.extend(reused)
+            for topic, duplicate_status in zip(reused, self.duplicate_checker.check_topics(reused)):
+                topic.update(duplicate_status)
+            # Analysen sichern wie im Schritt 'analyze'
+            self.seen_store.save()
+
+        # Zwischenstände wie beim Lauf nacheinander: ein folgender Lauf kann
+        # mit 'analyze' bzw. 'dedup' auf diesen Ergebnissen aufsetzen
+        self.checkpoints.write('scrape', pipeline.articles, self._scrape_meta())
+        self.checkpoints.write('analyze', topics)
+
+        self._finish_dedup(topics)
+        return topics
+
+    def _finish_dedup(self, topics: List[Dict[str, Any]]) -> None:
+        """Meldet die neuen Themen, beendet die Archiv-Abfragen und sichert deren Cache"""
+        new_topics_count = sum(1 for t in topics if not t.get('isDuplicate', False))
         print(f"   ✅ {new_topics_count} neue Themen (nicht behandelt)\n")
+        self.metrics.set('topics_new', new_topics_count)
+        self.duplicate_checker.close()
 
-        # Schritt 4: Sortieren nach Relevanz
-        print("📊 Schritt 4: Sortiere nach Relevanz...")
-        sorted_topics = sorted(
-            unique_topics,
-            key=lambda t: (len(t.get('tags', [])), t.get('visualRating', 0)),
-            reverse=True
-        )
-        print(f"   ✅ {len(sorted_topics)} Themen sortiert\n")
+    def _stage_rank(self, unique_topics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Schritt 4: Top K nach gewichtetem Score
+
+        Args:
+            unique_topics: Themen mit Duplikat-Status
+
+        Returns:
+            Top K, danach ggf. die gekürzten übrigen Themen
+        """
+        print("📊 Schritt 4: Bewerte Themen...")
+        with self.metrics.stage('rank'):
+            sorted_topics = self.topic_ranker.rank(unique_topics)
+        ranker = self.topic_ranker
+        print(f"   ✅ Top {min(ranker.top_k, len(unique_topics))} von {len(unique_topics)} Themen ausgewählt "
+              f"({ranker.compacted} gekürzt, {ranker.dropped} verworfen)\n")
+        self.metrics.set('topics_compacted', ranker.compacted)
+        self.metrics.set('topics_dropped', ranker.dropped)
+        return sorted_topics
 
-        # Schritt 5: Speichern
+    def _stage_save(self, sorted_topics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Schritt 5: Speichern
+
+        Args:
+            sorted_topics: Bewertete Themen aus Schritt 4
+
+        Returns:
+            Gespeicherte Themen
+        """
         print("💾 Schritt 5: Speichere Ergebnisse...")
-        self.save_results(sorted_topics)
+        with self.metrics.stage('save'):
+            self.save_results(sorted_topics)
+            self.seen_store.prune()
+            self.seen_store.save()
         print("   ✅ Daten gespeichert\n")
+        self.metrics.set('topics_total', len(sorted_topics))
+        return sorted_topics
 
-        print("=" * 60)
-        print(f"✅ ERFOLGREICH ABGESCHLOSSEN")
-        print(f"Ende: {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}")
-        print(f"Gesamt: {len(sorted_topics)} Themen, davon {new_topics_count} neu")
-        print("=" * 60)
+    def remember_analysis(self, article: Dict[str, Any], analysis: Optional[Dict[str, Any]]) -> bool:
+        """
+        Merkt sich eine Analyse im Artikel-Speicher
+
+        Nicht analysierte Artikel (NOT_ANALYZED) werden nicht gespeichert,
+        damit der nächste Lauf sie erneut analysiert.
+
+        Args:
+            article: Analysierter (ggf. zusammengefasster) Artikel
+            analysis: Analyseergebnis
+
+        Returns:
+            True wenn das Thema relevant genug für die Ausgabe ist
+        """
+        if analysis is NOT_ANALYZED:
+            return False
+        self.seen_store.remember(article, analysis)
+        # Weitere Quellen des Clusters gelten als bekannt, die Analyse
+        # hängt nur am Repräsentanten
+        for member in list(article.get('members', []))[1:]:
+            self.seen_store.remember(member, None)
+        return bool(analysis) and analysis.get('galileo_relevance', 0) >= MIN_TOPIC_RELEVANCE
+
+    def attach_to_known(self, known: List[Dict[str, Any]], articles: List[Dict[str, Any]]) -> None:
+        """
+        Ordnet neue Artikel einer bereits analysierten Meldung zu
+
+        Die neuen Artikel werden nicht analysiert, sondern gelten als bekannt;
+        ihre Quellen ergänzen das gespeicherte Thema.
+
+        Args:
+            known: Bekannte Artikel der Meldung
+            articles: Neue Artikel derselben Meldung
+        """
+        for article in articles:
+            self.seen_store.remember(article, None)
+        self.metrics.increment('articles_attached', len(articles))
+
+        analysis = next((a for a in map(self.seen_store.analysis_of, known) if a), None)
+        if not analysis:
+            return
+        sources = list(analysis.get('sources') or [])
+        urls = {source.get('url') for source in sources}
+        for article in articles:
+            source = source_of(article)
+            if source['url'] not in urls:
+                urls.add(source['url'])
+                sources.append(source)
+        analysis['sources'] = sources
+        analysis['credibility'] = best_credibility(sources, analysis.get('credibility', 'yellow'))
+
+    def _reused_topics(self) -> List[Dict[str, Any]]:
+        """
+        Übernimmt Analysen bereits bekannter Artikel aus früheren Läufen
+
+        Returns:
+            Relevante Themen aus dem Artikel-Speicher
+        """
+        reused = [
+            analysis for analysis in self.seen_store.reused_analyses()
+            if analysis.get('galileo_relevance', 0) >= MIN_TOPIC_RELEVANCE
+        ]
+        print(f"   ♻️  {len(reused)} relevante Themen aus früheren Läufen übernommen")
+        print(f"   💾 Analyse-Cache: {self.analysis_cache.hits} Treffer, "
+              f"{self.analysis_cache.misses} Fehlschläge "
+              f"({self.analysis_cache.hit_rate():.0%} Trefferquote)")
+        self.analysis_cache.save()
+        self.metrics.set('topics_reused', len(reused))
+        return reused
+
+    def save_metrics(self, report: bool = True) -> None:
+        """
+        Schreibt die Laufzeit-Messungen nach run_metrics.json
+
+        Args:
+            report: Dauer der Schritte zusätzlich ausgeben
+        """
+        # Nur Services auswerten, die in diesem Lauf erzeugt wurden (LazyService)
+        if 'analysis_cache' in vars(self):
+            self.metrics.set('analysis_cache_hits', self.analysis_cache.hits)
+            self.metrics.set('analysis_cache_misses', self.analysis_cache.misses)
+            self.metrics.set('analysis_cache_hit_rate', round(self.analysis_cache.hit_rate(), 4))
+        if 'ai_analyzer' in vars(self) and self.ai_analyzer.client:
+            self.metrics.set('llm_retries', self.ai_analyzer.client.retries)
+
+        metrics_path = os.path.join(OUTPUT_DIR, "run_metrics.json")
+        self.metrics.save(metrics_path)
+        if report:
+            self.metrics.print_summary()
+            print(f"   📈 Messwerte: {metrics_path}")
 
     def save_results(self, topics: List[Dict[str, Any]]) -> None:
         """Speichert die Ergebnisse als JSON"""
-        output_data = {
-            "lastUpdate": datetime.now().isoformat(),
-            "topics": topics
-        }
-
         # Pfad zur Output-Datei
-        output_path = os.path.join(
-            os.path.dirname(__file__),
-            "..",
-            "docs",
-            "data",
-            "topics.json"
-        )
+        output_path = os.path.join(OUTPUT_DIR, "topics.json")
+        # Datensätze einmal in Dicts umwandeln (Schema von topics.json)
+        topics = topics_to_json(topics)
+
+        if self.incremental:
+            # Bestehende Datei fortschreiben statt komplett neu zu erzeugen
+            store = TopicStore(output_path, retention_days=self.retention_days)
+            topics = store.merge(topics)
+            if store.save(topics):
+                print(f"   📄 Gespeichert: {output_path} ({store.added} neu, "
+                      f"{store.updated} aktualisiert, {store.expired} entfernt, {len(topics)} gesamt)")
+            else:
+                print(f"   📄 Unverändert: {output_path}")
+        else:
+            output_data = {
+                "lastUpdate": datetime.now().isoformat(),
+                "topics": topics
+            }
+
+            # Speichern (atomar, ein abgebrochener Lauf hinterlässt keine halbe Datei)
+            atomic_write_json(output_path, output_data, indent=2)
+            print(f"   📄 Gespeichert: {output_path}")
+
+        # Kompakter Index + Detail-Shards für den schnellen Seitenaufbau
+        shard_writer = TopicShardWriter(os.path.dirname(output_path))
+        shard_writer.write(topics, datetime.now().isoformat())
+        print(f"   🗂️  Index + Shards: {shard_writer.written} geschrieben, "
+              f"{shard_writer.unchanged} unverändert, {shard_writer.removed} entfernt")
+
+
+def parse_weights(value: str) -> Dict[str, float]:
+    """
+    Liest Score-Gewichte von der Kommandozeile
+
+    Args:
+        value: Paare name=gewicht, durch Kommas getrennt
+
+    Returns:
+        Gewichte je Bestandteil
+    """
+    weights = {}
+    for pair in value.split(','):
+        name, _, weight = pair.partition('=')
+        name = name.strip()
+        if name not in DEFAULT_WEIGHTS:
+            raise argparse.ArgumentTypeError(f"Unbekanntes Gewicht: {name}")
+        try:
+            weights[name] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Ungültiges Gewicht für {name}: {weight}")
+    return weights
+
+
+def select_stages(requested: List[str], resume: bool, checkpoints: CheckpointStore) -> List[str]:
+    """
+    Bestimmt die auszuführenden Schritte
 
-        # Stelle sicher, dass Verzeichnis existiert
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    Args:
+        requested: Schritte von der Kommandozeile (leer = alle)
+        resume: Nach dem zuletzt abgeschlossenen Schritt fortsetzen
+        checkpoints: Checkpoints des letzten Laufs
 
-        # Speichern
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
+    Returns:
+        Aufeinanderfolgende Schritte in Ausführungsreihenfolge (leer = nichts zu tun)
+    """
+    unknown = [stage for stage in requested if stage not in STAGES]
+    if unknown:
+        raise ValueError(f"Unbekannte Schritte: {', '.join(unknown)} (möglich: {', '.join(STAGES)})")
+    if requested and resume:
+        raise ValueError("--resume und einzelne Schritte schließen sich aus")
 
-        print(f"   📄 Gespeichert: {output_path}")
+    if resume:
+        last = checkpoints.last_completed()
+        return list(STAGES[STAGES.index(last) + 1:] if last else STAGES)
+
+    indices = sorted({STAGES.index(stage) for stage in requested})
+    if not indices:
+        return list(STAGES)
+    if indices != list(range(indices[0], indices[-1] + 1)):
+        raise ValueError("Schritte müssen aufeinander folgen, z.B. 'analyze dedup rank'")
+    return [STAGES[i] for i in indices]
 
 
 def main():
     """Entry Point"""
+    parser = argparse.ArgumentParser(description="Galileo Research Tool")
+    parser.add_argument(
+        'stages',
+        nargs='*',
+        metavar='STAGE',
+        help=f"Nur diese Schritte ausführen ({', '.join(STAGES)}; Default: alle). "
+             f"Der erste liest den Checkpoint seines Vorgängers"
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help="Nach dem zuletzt abgeschlossenen Schritt des letzten Laufs fortsetzen"
+    )
+    parser.add_argument(
+        '--work-dir',
+        default=None,
+        help="Verzeichnis für die Checkpoints der Schritte (Default: .cache/work)"
+    )
+    parser.add_argument(
+        '--sources',
+        default=None,
+        help="Quellen-Konfiguration (JSON, Default: scripts/sources.json)"
+    )
+    parser.add_argument(
+        '--all-sources',
+        action='store_true',
+        help="Alle aktiven Quellen abfragen, auch wenn sie laut Zeitplan nicht fällig sind"
+    )
+    parser.add_argument(
+        '--dedup-mode',
+        choices=['keywords', 'semantic'],
+        default='keywords',
+        help="Duplikat-Check über gemeinsame Schlüsselwörter oder Text-Ähnlichkeit "
+             "(semantic, benötigt NumPy; Default: keywords)"
+    )
+    parser.add_argument(
+        '--semantic-threshold',
+        type=float,
+        default=None,
+        help="Mindest-Ähnlichkeit (0-1) im Modus semantic (Default: 0.3)"
+    )
+    parser.add_argument(
+        '--synonyms',
+        default=None,
+        help="Optionale Synonym-Tabelle (JSON, Wort -> Ersatz) für den Modus semantic"
+    )
+    parser.add_argument(
+        '--streaming',
+        action='store_true',
+        help="Scrape, Analyse und Duplikat-Check überlappend ausführen"
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help="Neue Themen in die bestehende topics.json einfügen statt sie zu ersetzen"
+    )
+    parser.add_argument(
+        '--retention-days',
+        type=int,
+        default=30,
+        help="Aufbewahrung der Themen im inkrementellen Modus (Tage, Default: 30)"
+    )
+    parser.add_argument(
+        '--top-k',
+        type=int,
+        default=50,
+        help="Anzahl vollständig ausgegebener Themen (Default: 50)"
+    )
+    parser.add_argument(
+        '--overflow',
+        choices=['compact', 'drop'],
+        default='compact',
+        help="Themen außerhalb der Top K gekürzt ausgeben oder weglassen (Default: compact)"
+    )
+    parser.add_argument(
+        '--weights',
+        type=parse_weights,
+        default=None,
+        help=f"Score-Gewichte, z.B. relevance=0.5,visual=0.3 ({', '.join(DEFAULT_WEIGHTS)})"
+    )
+    parser.add_argument(
+        '--local-analyzer',
+        action='store_true',
+        help="Artikel lokal bewerten (Heuristik, alle Kerne) statt über die API bzw. Mock-Modus"
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help="Prozesse der lokalen Analyse (Default: alle Kerne)"
+    )
+    parser.add_argument(
+        '--profile',
+        choices=['cpu', 'memory'],
+        help="Lauf mit cProfile (cpu) bzw. tracemalloc (memory) profilieren"
+    )
+    args = parser.parse_args()
+    if args.semantic_threshold is not None and not 0 < args.semantic_threshold <= 1:
+        parser.error("--semantic-threshold muss zwischen 0 und 1 liegen")
+
+    checkpoints = CheckpointStore(args.work_dir)
+    try:
+        stages = select_stages(args.stages, args.resume, checkpoints)
+    except ValueError as e:
+        parser.error(str(e))
+    if not stages:
+        print(f"✅ Letzter Lauf vollständig - nichts fortzusetzen ({checkpoints.directory})")
+        sys.exit(0)
+
+    if args.synonyms and args.dedup_mode != 'semantic':
+        parser.error("--synonyms gilt nur für --dedup-mode semantic")
+
+    # Erst hier: die Quellen-Konfiguration braucht nur der Scraper
+    from semantic_index import SynonymConfigError
+    from source_registry import SourceConfigError
+
+    # Ein einzeln gestarteter Scrape soll Daten liefern: der Zeitplan hätte
+    # nach dem letzten Lauf alle Quellen als nicht fällig markiert
+    poll_all = args.all_sources
+    if not poll_all and stages[0] == 'scrape' and stages != list(STAGES):
+        print("ℹ️  Teil-Lauf ab scrape: alle aktiven Quellen werden abgefragt (Zeitplan gilt nur für volle Läufe)")
+        poll_all = True
+
+    streaming = args.streaming
+    if streaming and not (stages[0] == 'scrape' and 'dedup' in stages):
+        print("ℹ️  Streaming nur für die Schritte scrape bis dedup - führe nacheinander aus")
+        streaming = False
+
     try:
-        tool = GalileoResearchTool()
-        tool.run()
+        ranker = TopicRanker(weights=args.weights, top_k=args.top_k, overflow=args.overflow)
+        tool = GalileoResearchTool(
+            incremental=args.incremental,
+            retention_days=args.retention_days,
+            ranker=ranker,
+            checkpoints=checkpoints,
+            local_analyzer=args.local_analyzer,
+            analyzer_workers=args.workers,
+            sources_file=args.sources,
+            poll_all=poll_all,
+            dedup_mode=args.dedup_mode,
+            semantic_threshold=args.semantic_threshold,
+            synonyms_file=args.synonyms
+        )
+        if args.profile:
+            profile_path = run_profiled(
+                args.profile,
+                lambda: tool.run(streaming=streaming, stages=stages),
+                OUTPUT_DIR,
+                metrics=tool.metrics
+            )
+            if 'save' in stages:
+                tool.save_metrics(report=False)  # inkl. Speicher-Peak
+            print(f"   🔬 Profil gespeichert: {profile_path}")
+        else:
+            tool.run(streaming=streaming, stages=stages)
         sys.exit(0)
+    except (CheckpointError, SourceConfigError, SynonymConfigError) as e:
+        print(f"❌ FEHLER: {str(e)}", file=sys.stderr)
+        sys.exit(1)
     except Exception as e:
         print(f"❌ FEHLER: {str(e)}", file=sys.stderr)
         import traceback
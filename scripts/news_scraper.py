@@ -4,62 +4,88 @@ News Scraper Service
 Durchsucht verschiedene Nachrichtenquellen nach relevanten Themen
 """
 
+import os
 import requests
-import feedparser
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
-from bs4 import BeautifulSoup
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from urllib.parse import urlencode
+
+from article_store import SeenArticleStore
+from feed_cache import FeedCache
+from feed_parser import MAX_ENTRIES, FeedStreamParser, ParseError, clean_html, parse_feed_date
+from records import Article
+from run_metrics import RunMetrics
+from source_registry import (
+    ADAPTERS, PollScheduler, SourceAdapter, SourceRegistry, register_adapter
+)
+
+
+# Suchendpunkt der Such-Quellen (liefert RSS) und seine Default-Parameter
+GOOGLE_NEWS_SEARCH = 'https://news.google.com/rss/search'
+GOOGLE_NEWS_PARAMS = {'hl': 'de', 'gl': 'DE', 'ceid': 'DE:de'}
+
+# YouTube Data API: beliebteste Videos einer Region
+YOUTUBE_VIDEOS_API = 'https://www.googleapis.com/youtube/v3/videos'
 
 
 class NewsScraperService:
     """Service zum Scrapen von Nachrichtenquellen"""
 
-    def __init__(self):
-        self.sources = {
-            # Grüne Quellen (Seriös)
-            'green': [
-                {
-                    'name': 'Tagesschau',
-                    'rss': 'https://www.tagesschau.de/xml/rss2/',
-                    'credibility': 'green'
-                },
-                {
-                    'name': 'Der Spiegel',
-                    'rss': 'https://www.spiegel.de/schlagzeilen/index.rss',
-                    'credibility': 'green'
-                },
-                {
-                    'name': 'Zeit Online',
-                    'rss': 'https://newsfeed.zeit.de/index',
-                    'credibility': 'green'
-                },
-                {
-                    'name': 'ScienceDaily',
-                    'rss': 'https://www.sciencedaily.com/rss/all.xml',
-                    'credibility': 'green'
-                }
-            ],
-            # Gelbe Quellen (Mittel)
-            'yellow': [
-                {
-                    'name': 'Bild',
-                    'rss': 'https://www.bild.de/rssfeeds/vw-home/vw-home-16725562,view=rss2.bild.xml',
-                    'credibility': 'yellow'
-                }
-            ]
-        }
+    def __init__(self, max_workers: int = 8, source_timeout: float = 20.0,
+                 feed_cache: Optional[FeedCache] = None, use_cache: bool = True,
+                 seen_store: Optional[SeenArticleStore] = None,
+                 metrics: Optional[RunMetrics] = None,
+                 registry: Optional[SourceRegistry] = None,
+                 scheduler: Optional[PollScheduler] = None):
+        """
+        Initialisiert den News Scraper
+
+        Args:
+            max_workers: Maximale Anzahl parallel abgerufener Feeds
+                (1 = sequenziell wie bisher)
+            source_timeout: Timeout pro Quelle in Sekunden
+            feed_cache: Eigener Feed-Cache (Default: .cache/feed_cache.json)
+            use_cache: False deaktiviert bedingte Requests komplett
+            seen_store: Speicher bereits verarbeiteter Artikel - wenn gesetzt,
+                werden nur neue oder geänderte Artikel zurückgegeben
+            metrics: Messwerte des Laufs (Latenz pro Quelle, Cache-Statistik)
+            registry: Konfigurierte Quellen (Default: scripts/sources.json)
+            scheduler: Abfrage-Zeitplan - wenn gesetzt, werden nur fällige
+                Quellen abgefragt (Default: alle Quellen bei jedem Lauf)
+
+        Raises:
+            SourceConfigError: Quelle mit unbekanntem Typ oder fehlendem Feld
+        """
+        self.max_workers = max(1, max_workers)
+        self.source_timeout = source_timeout
+        self.feed_cache = (feed_cache or FeedCache()) if use_cache else None
+        self.seen_store = seen_store
+        self.metrics = metrics
+
+        self.registry = registry or SourceRegistry.from_file()
+        self.scheduler = scheduler
 
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'GalileoResearchBot/1.0 (Educational Purpose)'
         })
+        # Connection-Pool passend zur Anzahl paralleler Abrufe
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Ein Adapter pro Quellen-Typ (RSS, Suche, Trends)
+        self.adapters = {name: cls(self) for name, cls in ADAPTERS.items()}
+        self.registry.validate(self.adapters)
 
     def fetch_all_sources(self, topics: List[str], days_back: int = 14) -> List[Dict[str, Any]]:
         """
-        Durchsucht alle konfigurierten Quellen
+        Durchsucht alle fälligen Quellen
 
         Args:
-            topics: Liste von Suchbegriffen
+            topics: Liste von Suchbegriffen (für Such-Quellen)
             days_back: Wie viele Tage zurück suchen
 
         Returns:
@@ -70,25 +96,178 @@ class NewsScraperService:
 
         print(f"   🔍 Durchsuche Quellen (letzte {days_back} Tage)...")
 
-        # Grüne Quellen
-        for source in self.sources['green']:
-            try:
-                articles = self._fetch_rss_feed(source, cutoff_date)
-                all_articles.extend(articles)
-                print(f"      ✓ {source['name']}: {len(articles)} Artikel")
-            except Exception as e:
-                print(f"      ✗ {source['name']}: Fehler ({str(e)})")
-
-        # Gelbe Quellen
-        for source in self.sources['yellow']:
+        # Grüne Quellen zuerst, dann gelbe - die Reihenfolge bleibt stabil,
+        # egal in welcher Reihenfolge die Feeds tatsächlich antworten
+        sources = self._due_sources()
+
+        if self.max_workers == 1 or len(sources) <= 1:
+            for source in sources:
+                all_articles.extend(self._fetch_and_report(source, cutoff_date, topics))
+            self._save_cache()
+            return all_articles
+
+        workers = min(self.max_workers, len(sources))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='feed') as executor:
+            futures = [
+                executor.submit(self._fetch_source, source, cutoff_date, topics)
+                for source in sources
+            ]
+            # Ergebnisse in Quellen-Reihenfolge einsammeln und ausgeben
+            for source, future in zip(sources, futures):
+                try:
+                    all_articles.extend(self._accept_articles(source, future.result()))
+                except Exception as e:
+                    print(f"      ✗ {source['name']}: Fehler ({str(e)})")
+
+        self._save_cache()
+        return all_articles
+
+    def iter_sources(self, topics: List[str], days_back: int = 14) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Liefert die Artikel jeder fälligen Quelle, sobald sie angekommen sind
+
+        Für die Streaming-Pipeline: Die Reihenfolge richtet sich nach den
+        Antwortzeiten der Quellen, nicht nach der Konfiguration.
+
+        Args:
+            topics: Liste von Suchbegriffen (für Such-Quellen)
+            days_back: Wie viele Tage zurück suchen
+
+        Yields:
+            Liste der (neuen) Artikel einer Quelle
+        """
+        cutoff_date = datetime.now() - timedelta(days=days_back)
+
+        print(f"   🔍 Durchsuche Quellen (letzte {days_back} Tage, Streaming)...")
+        sources = self._due_sources()
+
+        workers = max(1, min(self.max_workers, len(sources)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='feed') as executor:
+            futures = {
+                executor.submit(self._fetch_source, source, cutoff_date, topics): source
+                for source in sources
+            }
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    articles = self._accept_articles(source, future.result())
+                except Exception as e:
+                    print(f"      ✗ {source['name']}: Fehler ({str(e)})")
+                    continue
+                yield articles
+
+        self._save_cache()
+
+    def _due_sources(self) -> List[Dict[str, Any]]:
+        """
+        Aktive Quellen, die in diesem Lauf abgefragt werden
+
+        Nicht fällige Quellen werden übersprungen; die Artikel ihrer letzten
+        Abfrage gelten als unverändert gesehen, damit deren Analysen erhalten
+        bleiben.
+
+        Returns:
+            Fällige Quellen, grüne zuerst
+        """
+        due = []
+        skipped = 0
+        for source in self.registry.enabled():
+            adapter = self.adapters[source['type']]
+            if not adapter.available():
+                print(f"      ℹ️  {source['name']}: {adapter.requires_env} nicht gesetzt - übersprungen")
+                continue
+
+            if self.scheduler and not self.scheduler.is_due(source):
+                next_due = self.scheduler.next_due(source)
+                print(f"      ⏭️  {source['name']}: nicht fällig "
+                      f"(nächste Abfrage {next_due.strftime('%d.%m. %H:%M')})")
+                if self.seen_store:
+                    self.seen_store.touch(self.scheduler.known_keys(source))
+                if self.metrics:
+                    self.metrics.increment('sources_skipped')
+                skipped += 1
+                continue
+
+            due.append(source)
+
+        if not due and skipped:
+            print("      ℹ️  Keine Quelle fällig - mit --all-sources trotzdem abfragen")
+        return due
+
+    def _save_cache(self) -> None:
+        """Speichert Feed-Cache und Abfrage-Zeitplan und gibt die Cache-Statistik aus"""
+        if self.scheduler:
             try:
-                articles = self._fetch_rss_feed(source, cutoff_date)
-                all_articles.extend(articles)
-                print(f"      ✓ {source['name']}: {len(articles)} Artikel")
-            except Exception as e:
-                print(f"      ✗ {source['name']}: Fehler ({str(e)})")
+                self.scheduler.save()
+            except OSError as e:
+                print(f"      ⚠️  Abfrage-Zeitplan konnte nicht gespeichert werden ({str(e)})")
+
+        if not self.feed_cache:
+            return
+
+        print(f"      ℹ️  Feed-Cache: {self.feed_cache.not_modified} unverändert (304), "
+              f"{self.feed_cache.downloaded} neu geladen")
+        if self.metrics:
+            self.metrics.increment('feed_cache_not_modified', self.feed_cache.not_modified)
+            self.metrics.increment('feed_cache_downloaded', self.feed_cache.downloaded)
+        self.feed_cache.not_modified = 0
+        self.feed_cache.downloaded = 0
+        try:
+            self.feed_cache.save()
+        except OSError as e:
+            print(f"      ⚠️  Feed-Cache konnte nicht gespeichert werden ({str(e)})")
 
-        return all_articles
+    def _accept_articles(self, source: Dict[str, Any], articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Plant die nächste Abfrage, filtert bereits bekannte Artikel heraus
+        und gibt den Status aus
+
+        Args:
+            source: Quellen-Konfiguration
+            articles: Geladene Artikel der Quelle
+
+        Returns:
+            Neue oder geänderte Artikel
+        """
+        if self.metrics:
+            self.metrics.increment('sources_ok')
+        if self.scheduler:
+            self.scheduler.record(source, articles)
+
+        if not self.seen_store:
+            print(f"      ✓ {source['name']}: {len(articles)} Artikel")
+            return articles
+
+        new_articles = [a for a in articles if not self.seen_store.is_known(a)]
+        known = len(articles) - len(new_articles)
+        if self.metrics:
+            self.metrics.increment('articles_known', known)
+        print(f"      ✓ {source['name']}: {len(new_articles)} Artikel ({known} bereits bekannt)")
+        return new_articles
+
+    def _fetch_and_report(self, source: Dict[str, Any], cutoff_date: datetime,
+                          topics: List[str]) -> List[Dict[str, Any]]:
+        """
+        Holt eine Quelle und gibt den Status aus (Fehler werden isoliert)
+
+        Args:
+            source: Quellen-Konfiguration
+            cutoff_date: Ältestes erlaubtes Datum
+            topics: Suchthemen des Laufs
+
+        Returns:
+            Liste von Artikeln (leer bei Fehler)
+        """
+        try:
+            return self._accept_articles(source, self._fetch_source(source, cutoff_date, topics))
+        except Exception as e:
+            print(f"      ✗ {source['name']}: Fehler ({str(e)})")
+            return []
+
+    def _fetch_source(self, source: Dict[str, Any], cutoff_date: datetime,
+                      topics: List[str]) -> List[Dict[str, Any]]:
+        """Holt eine Quelle über den Adapter ihres Typs"""
+        return self.adapters[source['type']].fetch(source, cutoff_date, topics)
 
     def _fetch_rss_feed(self, source: Dict[str, str], cutoff_date: datetime) -> List[Dict[str, Any]]:
         """
@@ -102,69 +281,268 @@ class NewsScraperService:
             Liste von Artikeln
         """
         articles = []
+        started = time.perf_counter()
 
         try:
-            feed = feedparser.parse(source['rss'])
+            entries = self._load_entries(source, cutoff_date)
 
-            for entry in feed.entries[:50]:  # Max 50 pro Quelle
-                # Parse Datum
+            for entry in entries[:MAX_ENTRIES]:
                 published = None
-                if hasattr(entry, 'published_parsed'):
-                    published = datetime(*entry.published_parsed[:6])
-                elif hasattr(entry, 'updated_parsed'):
-                    published = datetime(*entry.updated_parsed[:6])
+                if entry['published']:
+                    published = datetime.fromisoformat(entry['published'])
 
-                # Überspringe zu alte Artikel
+                # Überspringe zu alte Artikel (Cache-Einträge und feedparser-Fallback)
                 if published and published < cutoff_date:
                     continue
 
                 # Extrahiere Daten
-                article = {
-                    'title': entry.get('title', ''),
-                    'summary': entry.get('summary', ''),
-                    'link': entry.get('link', ''),
-                    'published': published.isoformat() if published else None,
-                    'source': source['name'],
-                    'credibility': source['credibility']
-                }
+                article = Article(
+                    title=entry['title'],
+                    summary=entry['summary'],
+                    link=entry['link'],
+                    guid=entry['guid'],
+                    published=entry['published'],
+                    source=source['name'],
+                    credibility=source['credibility']
+                )
 
                 articles.append(article)
 
         except Exception as e:
+            if self.metrics:
+                self.metrics.increment('sources_failed')
             raise Exception(f"RSS-Feed-Fehler: {str(e)}")
+        finally:
+            if self.metrics:
+                self.metrics.observe('source', time.perf_counter() - started, source['name'])
 
         return articles
 
-    def search_google_news(self, query: str, days_back: int = 7) -> List[Dict[str, Any]]:
+    def _load_entries(self, source: Dict[str, str], cutoff_date: datetime) -> List[Dict[str, Any]]:
         """
-        Durchsucht Google News (erfordert API-Key in Produktion)
+        Lädt die Einträge eines Feeds, bei 304 aus dem Feed-Cache
 
         Args:
-            query: Suchbegriff
-            days_back: Wie viele Tage zurück
+            source: Quellen-Konfiguration
+            cutoff_date: Ältestes erlaubtes Datum (Download endet bei älteren Einträgen)
 
         Returns:
-            Liste von Artikeln
+            Liste normalisierter Einträge
+        """
+        url = source['rss']
+        headers = self.feed_cache.conditional_headers(url, cutoff_date) if self.feed_cache else {}
+
+        # Bedingter Request über die gemeinsame Session - bei 304 entfällt
+        # sowohl der Download als auch das Parsen des Feeds
+        response, entries = self._stream_entries(source, cutoff_date, headers)
+
+        if response.status_code == 304:
+            cached = self.feed_cache.get_entries(url)
+            if cached is not None:
+                return cached
+            # Cache-Eintrag verschwunden: vollständig neu laden
+            response, entries = self._stream_entries(source, cutoff_date)
+
+        if self.feed_cache:
+            self.feed_cache.store(
+                url,
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified'),
+                entries,
+                cutoff_date
+            )
+
+        return entries
+
+    def _stream_entries(self, source: Dict[str, str], cutoff_date: datetime,
+                        headers: Optional[Dict[str, str]] = None) -> Tuple[requests.Response, List[Dict[str, Any]]]:
         """
-        # HINWEIS: In Produktion würde hier die Google News API verwendet
-        # Für jetzt: Placeholder
-        print(f"      ℹ️  Google News API würde hier '{query}' suchen")
-        return []
+        Lädt und parst einen Feed in einem Durchgang
+
+        Der Download endet, sobald MAX_ENTRIES passende Einträge gelesen sind
+        oder die Einträge hinter cutoff_date zurückfallen.
+
+        Args:
+            source: Quellen-Konfiguration
+            cutoff_date: Ältestes erlaubtes Datum
+            headers: Zusätzliche Header (z.B. für bedingte Requests)
 
-    def search_youtube_trending(self, category: str = 'all') -> List[Dict[str, Any]]:
+        Returns:
+            Tuple aus Response und normalisierten Einträgen (leer bei 304)
+        """
+        deadline = time.monotonic() + self.source_timeout
+        parser = FeedStreamParser(cutoff=cutoff_date)
+        # Bereits empfangene Daten - für den feedparser-Fallback ohne zweiten Download
+        chunks = []
+
+        with self.session.get(source['rss'], headers=headers, timeout=self.source_timeout,
+                              stream=True) as response:
+            response.raise_for_status()
+            if response.status_code == 304:
+                return response, []
+            stream = response.iter_content(chunk_size=16 * 1024)
+            try:
+                for chunk in stream:
+                    chunks.append(chunk)
+                    if parser.feed(chunk):
+                        break  # Rest des Feeds wird nicht mehr übertragen
+                    # Auch ein tröpfelnder Host darf das Zeitlimit nicht sprengen
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"Timeout nach {self.source_timeout:g}s")
+                else:
+                    parser.close()
+                return response, parser.entries
+            except ParseError:
+                # Rest des Dokuments über dieselbe Verbindung nachladen
+                for chunk in stream:
+                    chunks.append(chunk)
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"Timeout nach {self.source_timeout:g}s")
+
+        # Kein wohlgeformtes XML (z.B. HTML-Entities ohne DTD): der tolerante
+        # feedparser braucht das vollständige Dokument
+        if self.metrics:
+            self.metrics.increment('feeds_fallback')
+        import feedparser
+
+        feed = feedparser.parse(b''.join(chunks))
+        return response, [self._normalize_entry(entry) for entry in feed.entries[:MAX_ENTRIES]]
+
+    def _normalize_entry(self, entry: Any) -> Dict[str, Any]:
         """
-        Holt YouTube Trending Videos (erfordert API-Key)
+        Wandelt einen feedparser-Eintrag in ein cachebares Dict um
 
         Args:
-            category: Video-Kategorie
+            entry: feedparser-Eintrag
 
         Returns:
-            Liste von Videos
+            Eintrag mit title, summary (ohne HTML), link, guid und published (ISO)
+        """
+        # Parse Datum
+        published = None
+        if entry.get('published_parsed'):
+            published = datetime(*entry.published_parsed[:6])
+        elif entry.get('updated_parsed'):
+            published = datetime(*entry.updated_parsed[:6])
+
+        return {
+            'title': clean_html(entry.get('title', '')),
+            'summary': clean_html(entry.get('summary', '')),
+            'link': entry.get('link', ''),
+            'guid': entry.get('id'),
+            'published': published.isoformat() if published else None
+        }
+
+    def _download_feed(self, source: Dict[str, str],
+                       headers: Optional[Dict[str, str]] = None) -> Tuple[requests.Response, bytes]:
         """
-        # HINWEIS: In Produktion würde hier die YouTube Data API verwendet
-        # Erfordert API-Key: https://developers.google.com/youtube/v3
-        print(f"      ℹ️  YouTube API würde hier Trending Videos holen")
-        return []
+        Lädt einen Feed vollständig mit Gesamt-Timeout herunter
+
+        Args:
+            source: Quellen-Konfiguration
+            headers: Zusätzliche Header (z.B. für bedingte Requests)
+
+        Returns:
+            Tuple aus Response und Rohdaten des Feeds
+        """
+        deadline = time.monotonic() + self.source_timeout
+        chunks = []
+
+        with self.session.get(source['rss'], headers=headers, timeout=self.source_timeout,
+                              stream=True) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                chunks.append(chunk)
+                # Auch ein tröpfelnder Host darf das Zeitlimit nicht sprengen
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timeout nach {self.source_timeout:g}s")
+
+        return response, b''.join(chunks)
+
+
+@register_adapter('rss')
+class RssAdapter(SourceAdapter):
+    """RSS- und Atom-Feeds"""
+
+    required_fields = ('rss',)
+
+    def fetch(self, source: Dict[str, Any], cutoff_date: datetime, topics: List[str]) -> List[Article]:
+        return self.scraper._fetch_rss_feed(source, cutoff_date)
+
+
+@register_adapter('search')
+class SearchAdapter(SourceAdapter):
+    """Suche nach den Suchthemen des Laufs über einen RSS-Suchendpunkt (Default: Google News)"""
+
+    def fetch(self, source: Dict[str, Any], cutoff_date: datetime, topics: List[str]) -> List[Article]:
+        search_url = source.get('search_url', GOOGLE_NEWS_SEARCH)
+        days = max(1, (datetime.now() - cutoff_date).days)
+        params = source.get('params', GOOGLE_NEWS_PARAMS)
+
+        articles = []
+        seen_links = set()
+        for topic in topics[:source.get('max_queries', len(topics))]:
+            query = urlencode({'q': f"{topic} when:{days}d", **params})
+            # Jede Suche ist ein eigener Feed (eigener Eintrag im Feed-Cache)
+            feed = dict(source, rss=f"{search_url}?{query}")
+            for article in self.scraper._fetch_rss_feed(feed, cutoff_date):
+                if article['link'] not in seen_links:
+                    seen_links.add(article['link'])
+                    articles.append(article)
+        return articles
+
+
+@register_adapter('trending')
+class TrendingAdapter(SourceAdapter):
+    """Beliebte YouTube-Videos (YouTube Data API, braucht YOUTUBE_API_KEY)"""
+
+    requires_env = 'YOUTUBE_API_KEY'
+
+    def fetch(self, source: Dict[str, Any], cutoff_date: datetime, topics: List[str]) -> List[Article]:
+        scraper = self.scraper
+        params = {
+            'part': 'snippet',
+            'chart': 'mostPopular',
+            'regionCode': source.get('region', 'DE'),
+            'maxResults': MAX_ENTRIES,
+            'key': os.environ[self.requires_env]
+        }
+        if source.get('category'):
+            params['videoCategoryId'] = source['category']
+
+        started = time.perf_counter()
+        try:
+            response = scraper.session.get(source.get('api_url', YOUTUBE_VIDEOS_API), params=params,
+                                           timeout=scraper.source_timeout)
+            if response.status_code != 200:
+                raise ValueError(f"HTTP {response.status_code}")
+            items = response.json().get('items', [])
+        except (requests.RequestException, ValueError) as e:
+            if scraper.metrics:
+                scraper.metrics.increment('sources_failed')
+            # Meldungen von requests enthalten die URL und damit den API-Key
+            reason = type(e).__name__ if isinstance(e, requests.RequestException) else str(e)
+            raise Exception(f"YouTube-API-Fehler: {reason}") from None
+        finally:
+            if scraper.metrics:
+                scraper.metrics.observe('source', time.perf_counter() - started, source['name'])
+
+        articles = []
+        for item in items:
+            snippet = item.get('snippet', {})
+            published = parse_feed_date(snippet.get('publishedAt'))
+            if published and published < cutoff_date:
+                continue
+            articles.append(Article(
+                title=clean_html(snippet.get('title')),
+                summary=clean_html(snippet.get('description')),
+                link=f"https://www.youtube.com/watch?v={item['id']}",
+                guid=f"youtube:{item['id']}",
+                published=published.isoformat() if published else None,
+                source=source['name'],
+                credibility=source['credibility']
+            ))
+        return articles
 
 
 def test_scraper():
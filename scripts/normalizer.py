@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Normalizer
+Gemeinsame Tokenisierung, Umlaut-Faltung und deutsches Stemming für
+Duplikat-Check, Archiv-Index, Clustering und semantischen Index
+"""
+
+import re
+from functools import lru_cache
+from typing import List, Tuple
+
+
+# Version der Normalisierung - bei Änderungen hochzählen (Archiv-Schlüsselwörter
+# werden dann beim nächsten Öffnen neu berechnet)
+NORMALIZER_VERSION = 1
+
+WORD_RE = re.compile(r'\w+')
+NON_WORD_RE = re.compile(r'[^\w]+')
+TAG_RE = re.compile(r'<[^>]+>')
+
+# Wörter, die für den Themenvergleich nichts aussagen (einmalig geladen)
+STOP_WORDS = frozenset((
+    'der', 'die', 'das', 'ein', 'eine', 'und', 'oder', 'für',
+    'mit', 'von', 'zu', 'im', 'am', 'ist', 'sind', 'wird',
+    'werden', 'kann', 'könnte', 'neue', 'neuer', 'neues', 'neuen',
+    'einen', 'einem', 'einer', 'eines', 'nicht', 'sich', 'auch', 'nach',
+    'über', 'unter', 'wurde', 'wurden', 'haben', 'hatte', 'sein', 'seine',
+    'ihre', 'ihren', 'dass', 'diese', 'dieser', 'dieses', 'mehr', 'noch',
+    'schon', 'jetzt', 'heute', 'immer', 'beim', 'gegen', 'durch', 'ohne',
+    'zwischen', 'sowie', 'aber', 'wenn', 'weil', 'alle', 'viele', 'warum',
+    'welche', 'dort', 'hier', 'soll', 'sollen', 'muss', 'müssen', 'will'
+))
+
+# Umlaute auf Grundvokale falten (wie am Ende des Snowball-Stemmers)
+UMLAUT_TABLE = str.maketrans({'ä': 'a', 'ö': 'o', 'ü': 'u', 'ß': 'ss'})
+
+# Mindestlänge eines Schlüsselworts (vor dem Stemming)
+MIN_KEYWORD_CHARS = 4
+
+_VOWELS = frozenset('aeiouyäöü')
+_S_ENDINGS = frozenset('bdfghklmnrt')
+_ST_ENDINGS = frozenset('bdfghklmnt')
+
+
+def fold(text: str) -> str:
+    """
+    Kleinschreibung plus Umlaut-Faltung ("Bäume" -> "baume")
+
+    Args:
+        text: Beliebiger Text
+
+    Returns:
+        Gefalteter Text
+    """
+    return text.lower().translate(UMLAUT_TABLE)
+
+
+def normalize_text(text: str) -> str:
+    """
+    Text ohne Satzzeichen und Umlaute (z.B. für Shingles)
+
+    Args:
+        text: Titel bzw. Zusammenfassung (HTML vorher mit TAG_RE entfernen)
+
+    Returns:
+        Gefaltete Wörter, durch einzelne Leerzeichen getrennt
+    """
+    return NON_WORD_RE.sub(' ', fold(text)).strip()
+
+
+@lru_cache(maxsize=65536)
+def stem(word: str) -> str:
+    """
+    Deutscher Stemmer (Snowball-Algorithmus) inkl. Umlaut-Faltung
+
+    "Batterie" und "Batterien" ergeben beide "batteri".
+
+    Args:
+        word: Einzelnes Wort
+
+    Returns:
+        Wortstamm
+    """
+    word = word.lower().replace('ß', 'ss')
+
+    # u und y zwischen Vokalen sind Konsonanten
+    letters = list(word)
+    for i in range(1, len(letters) - 1):
+        if letters[i] in 'uy' and letters[i - 1] in _VOWELS and letters[i + 1] in _VOWELS:
+            letters[i] = letters[i].upper()
+    word = ''.join(letters)
+
+    r1 = _region(word, 0)
+    r1 = max(r1, 3)
+    r2 = _region(word, r1)
+
+    # Schritt 1: Flexionsendungen
+    for suffix in ('ern', 'em', 'er'):
+        if word.endswith(suffix):
+            if len(word) - len(suffix) >= r1:
+                word = word[:-len(suffix)]
+            break
+    else:
+        for suffix in ('en', 'es', 'e'):
+            if word.endswith(suffix):
+                if len(word) - len(suffix) >= r1:
+                    word = word[:-len(suffix)]
+                    if word.endswith('niss'):
+                        word = word[:-1]
+                break
+        else:
+            if (word.endswith('s') and len(word) - 1 >= r1
+                    and len(word) > 1 and word[-2] in _S_ENDINGS):
+                word = word[:-1]
+
+    # Schritt 2: weitere Endungen
+    for suffix in ('est', 'en', 'er'):
+        if word.endswith(suffix):
+            if len(word) - len(suffix) >= r1:
+                word = word[:-len(suffix)]
+            break
+    else:
+        if (word.endswith('st') and len(word) - 2 >= r1
+                and len(word) > 5 and word[-3] in _ST_ENDINGS):
+            word = word[:-2]
+
+    # Schritt 3: Ableitungen
+    for suffix in ('isch', 'lich', 'heit', 'keit', 'end', 'ung', 'ig', 'ik'):
+        if not word.endswith(suffix):
+            continue
+        start = len(word) - len(suffix)
+        if start < r2:
+            break
+        if suffix in ('end', 'ung'):
+            word = word[:start]
+            if word.endswith('ig') and len(word) - 2 >= r2 and not word[:-2].endswith('e'):
+                word = word[:-2]
+        elif suffix in ('ig', 'ik', 'isch'):
+            if not word[:start].endswith('e'):
+                word = word[:start]
+        elif suffix in ('lich', 'heit'):
+            word = word[:start]
+            for prefix in ('er', 'en'):
+                if word.endswith(prefix) and len(word) - 2 >= r1:
+                    word = word[:-2]
+                    break
+        else:  # keit
+            word = word[:start]
+            for prefix in ('lich', 'ig'):
+                if word.endswith(prefix) and len(word) - len(prefix) >= r2:
+                    word = word[:-len(prefix)]
+                    break
+        break
+
+    return word.lower().translate(UMLAUT_TABLE)
+
+
+def _region(word: str, start: int) -> int:
+    """Beginn der Region nach der ersten Folge Vokal + Konsonant ab start"""
+    for i in range(start + 1, len(word)):
+        if word[i] not in _VOWELS and word[i - 1] in _VOWELS:
+            return i + 1
+    return len(word)
+
+
+def normalize_word(word: str) -> str:
+    """
+    Normalisiert ein einzelnes, bereits bekanntes Schlüsselwort
+
+    Args:
+        word: Schlüsselwort (z.B. aus einer Archiv-Importdatei)
+
+    Returns:
+        Wortstamm in Kleinschreibung ohne Umlaute
+    """
+    return stem(word.strip().lower())
+
+
+def extract_keywords(title: str) -> List[str]:
+    """
+    Extrahiert normalisierte Schlüsselwörter aus einem Titel
+
+    Stoppwörter und kurze Wörter fallen weg, der Rest wird gestemmt.
+    Wiederholte Titel kommen aus einem LRU-Cache.
+
+    Args:
+        title: Titel des Themas bzw. der Episode
+
+    Returns:
+        Liste von Schlüsselwörtern (ohne Wiederholungen)
+    """
+    return list(_keywords(title))
+
+
+@lru_cache(maxsize=16384)
+def _keywords(title: str) -> Tuple[str, ...]:
+    """Gecachte Schlüsselwörter eines Titels (unveränderlich)"""
+    keywords = {}
+    for word in WORD_RE.findall(title.lower()):
+        if word in STOP_WORDS or len(word) < MIN_KEYWORD_CHARS:
+            continue
+        keywords.setdefault(stem(word), None)
+    return tuple(keywords)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Streaming Pipeline
+Scrape → Analyse → Duplikat-Check über begrenzte Queues statt fester Stufen
+"""
+
+import queue
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+from article_clusterer import best_credibility
+from records import NOT_ANALYZED
+
+
+# Markiert das Ende eines Datenstroms in einer Queue
+_DONE = object()
+
+
+class StreamingPipeline:
+    """Führt die Schritte 1-3 überlappend mit Backpressure aus"""
+
+    def __init__(self, tool: Any, queue_size: int = 64, analyze_workers: int = 2,
+                 dedup_workers: int = 1, batch_size: int = 10, days_back: int = 14):
+        """
+        Initialisiert die Pipeline
+
+        Args:
+            tool: GalileoResearchTool mit Scraper, Analyzer und Checker
+            queue_size: Kapazität jeder Queue (voll = vorherige Stufe wartet)
+            analyze_workers: Anzahl paralleler Analyse-Worker
+            dedup_workers: Anzahl paralleler Duplikat-Check-Worker
+            batch_size: Maximale Anzahl Elemente pro Analyse-/Check-Aufruf
+            days_back: Wie viele Tage zurück suchen
+        """
+        self.tool = tool
+        self.queue_size = queue_size
+        self.analyze_workers = max(1, analyze_workers)
+        self.dedup_workers = max(1, dedup_workers)
+        self.batch_size = max(1, batch_size)
+        self.days_back = days_back
+
+        # Alle neuen Artikel (für den Checkpoint 'scrape')
+        self.articles: List[Dict[str, Any]] = []
+
+        # Statistik für die Ausgabe
+        self.article_count = 0
+        self.cluster_count = 0
+        self.relevant_count = 0
+
+    def run(self) -> List[Dict[str, Any]]:
+        """
+        Führt Scrape, Analyse und Duplikat-Check parallel aus
+
+        Die Analyse startet, sobald der erste Feed angekommen ist, der
+        Duplikat-Check sobald die erste Analyse zurückkommt.
+
+        Returns:
+            Geprüfte, relevante Themen (Reihenfolge nach Fertigstellung)
+        """
+        article_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        topic_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        results: List[Dict[str, Any]] = []
+        errors: List[BaseException] = []
+        lock = threading.Lock()
+        remaining_analyzers = [self.analyze_workers]
+        analyzed: List[Dict[str, Any]] = []
+        # Ein Zeitlimit für alle Analyse-Batches des Laufs, nicht pro Batch
+        deadline = self.tool.ai_analyzer.start_deadline()
+
+        def guarded(stage):
+            def wrapper(*args):
+                try:
+                    stage(*args)
+                except BaseException as e:  # Fehler an den Haupt-Thread melden
+                    with lock:
+                        errors.append(e)
+            return wrapper
+
+        def scrape() -> None:
+            clusterer = self.tool.article_clusterer
+            anchored = 0
+            try:
+                for articles in self.tool.news_scraper.iter_sources(self.tool.search_topics, self.days_back):
+                    # Bekannte Artikel der Quelle zuerst: neue Kopien einer
+                    # bereits analysierten Meldung bilden keinen Cluster
+                    known = self.tool.seen_store.known_articles()
+                    for article in known[anchored:]:
+                        clusterer.add_known(article)
+                    anchored = len(known)
+                    for article in articles:
+                        self.articles.append(article)
+                        self.article_count += 1
+                        representative, is_new = clusterer.add(article)
+                        if is_new:
+                            self.cluster_count += 1
+                            article_queue.put(representative)  # blockiert bei voller Queue
+            finally:
+                for _ in range(self.analyze_workers):
+                    article_queue.put(_DONE)
+
+        def analyze() -> None:
+            try:
+                done = False
+                while not done:
+                    batch, done = self._take_batch(article_queue)
+                    if not batch:
+                        continue
+                    try:
+                        analyses = self.tool.ai_analyzer.analyze_batch(batch, deadline=deadline)
+                    except Exception as e:
+                        # Weiter leeren, sonst blockiert der Scraper an der vollen Queue
+                        with lock:
+                            errors.append(e)
+                        continue
+                    for article, analysis in zip(batch, analyses):
+                        if analysis is not NOT_ANALYZED:
+                            with lock:
+                                analyzed.append(article)
+                        if self.tool.remember_analysis(article, analysis):
+                            with lock:
+                                self.relevant_count += 1
+                            topic_queue.put(analysis)
+            finally:
+                with lock:
+                    remaining_analyzers[0] -= 1
+                    last = remaining_analyzers[0] == 0
+                if last:
+                    for _ in range(self.dedup_workers):
+                        topic_queue.put(_DONE)
+
+        def dedup() -> None:
+            done = False
+            while not done:
+                batch, done = self._take_batch(topic_queue)
+                if not batch:
+                    continue
+                try:
+                    statuses = self.tool.duplicate_checker.check_topics(batch)
+                except Exception as e:
+                    with lock:
+                        errors.append(e)
+                    continue
+                for topic, status in zip(batch, statuses):
+                    topic.update(status)
+                with lock:
+                    results.extend(batch)
+
+        threads = [threading.Thread(target=guarded(scrape), name='pipeline-scrape')]
+        threads += [
+            threading.Thread(target=guarded(analyze), name=f'pipeline-analyze-{i}')
+            for i in range(self.analyze_workers)
+        ]
+        threads += [
+            threading.Thread(target=guarded(dedup), name=f'pipeline-dedup-{i}')
+            for i in range(self.dedup_workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+        # Später eingetroffene Artikel eines Clusters gelten erst als bekannt,
+        # wenn ihr Repräsentant tatsächlich analysiert wurde
+        for representative in analyzed:
+            for member in list(representative.get('members', []))[1:]:
+                self.tool.seen_store.remember(member, None)
+
+        for known, new in self.tool.article_clusterer.anchored:
+            if new:
+                self.tool.attach_to_known(known, new)
+
+        # Spät eingetroffene Quellen können die Seriosität noch verbessern
+        for topic in results:
+            topic['credibility'] = best_credibility(topic.get('sources', []), topic.get('credibility', 'yellow'))
+
+        return results
+
+    def _take_batch(self, source: queue.Queue) -> Tuple[List[Any], bool]:
+        """
+        Holt bis zu batch_size Elemente, wartet aber nur auf das erste
+
+        Args:
+            source: Eingangs-Queue
+
+        Returns:
+            Tuple aus Batch und True wenn das Stream-Ende erreicht ist
+        """
+        batch: List[Any] = []
+        item: Optional[Any] = source.get()
+        while True:
+            if item is _DONE:
+                return batch, True
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                return batch, False
+            try:
+                item = source.get_nowait()
+            except queue.Empty:
+                return batch, False
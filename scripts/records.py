@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Records
+Kompakte Datensätze (__slots__) für Artikel, Themen, Quellen und Storylines
+
+Die Klassen verhalten sich beim Zugriff wie die bisherigen Dicts
+(record['title'], record.get('tags', []), record.update(...)) und lassen
+sich verlustfrei ins Schema von topics.json umwandeln.
+"""
+
+import copy
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+
+class Record:
+    """Dict-kompatibler Zugriff über die JSON-Schlüssel eines Datensatzes"""
+
+    __slots__ = ()
+
+    # (JSON-Schlüssel, Attribut) in der Reihenfolge von topics.json
+    _KEYS: Tuple[Tuple[str, str], ...] = ()
+    _ATTRIBUTES: Dict[str, str] = {}
+    # JSON-Schlüssel, die mit Wert None als "nicht vorhanden" gelten
+    _OPTIONAL: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def _attribute(cls, key: str) -> Optional[str]:
+        """Attributname zu einem JSON-Schlüssel (None = unbekannt)"""
+        return cls._ATTRIBUTES.get(key)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Record':
+        """
+        Erzeugt einen Datensatz aus einem Dict (z.B. aus topics.json)
+
+        Args:
+            data: Dict im JSON-Schema; unbekannte Schlüssel landen in 'extra'
+
+        Returns:
+            Datensatz
+        """
+        values: Dict[str, Any] = {}
+        extra: Dict[str, Any] = {}
+        for key, value in data.items():
+            attribute = cls._attribute(key)
+            if attribute is None:
+                extra[key] = value
+            else:
+                values[attribute] = value
+        if extra:
+            values['extra'] = extra
+        return cls(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Wandelt den Datensatz (inkl. verschachtelter Datensätze) in ein Dict
+
+        Returns:
+            Dict im JSON-Schema
+        """
+        data = {}
+        for key, attribute in self._KEYS:
+            value = getattr(self, attribute)
+            if value is None and key in self._OPTIONAL:
+                continue
+            data[key] = as_dict(value)
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def copy(self) -> 'Record':
+        """Flache Kopie (wie dict.copy)"""
+        return copy.copy(self)
+
+    def __getitem__(self, key: str) -> Any:
+        attribute = self._attribute(key)
+        if attribute is None:
+            if self.extra and key in self.extra:
+                return self.extra[key]
+            raise KeyError(key)
+        value = getattr(self, attribute)
+        if value is None and key in self._OPTIONAL:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        attribute = self._attribute(key)
+        if attribute is not None:
+            setattr(self, attribute, value)
+        elif self.extra is None:
+            self.extra = {key: value}
+        else:
+            self.extra[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Record):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None  # veränderlich wie ein Dict
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Wert zu einem JSON-Schlüssel (wie dict.get)"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> List[str]:
+        """Vorhandene JSON-Schlüssel"""
+        return list(self.to_dict())
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """Schlüssel-Wert-Paare im JSON-Schema"""
+        return list(self.to_dict().items())
+
+    def update(self, values: Dict[str, Any]) -> None:
+        """Übernimmt mehrere Werte (wie dict.update)"""
+        for key, value in values.items():
+            self[key] = value
+
+
+class _NotAnalyzed:
+    """Ergebnis eines Artikels, der nicht analysiert wurde (Zeitlimit, API-Fehler)"""
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return 'NOT_ANALYZED'
+
+
+# Anders als None ("nicht relevant") darf der Artikel nicht als bekannt
+# gespeichert werden - der nächste Lauf analysiert ihn erneut
+NOT_ANALYZED = _NotAnalyzed()
+
+
+def as_dict(value: Any) -> Any:
+    """
+    Wandelt Datensätze (auch in Listen) rekursiv in JSON-taugliche Werte
+
+    Args:
+        value: Datensatz, Liste, Tupel oder einfacher Wert
+
+    Returns:
+        Wert ohne Datensätze (Tupel werden zu Listen)
+    """
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, (list, tuple)):
+        return [as_dict(item) for item in value]
+    return value
+
+
+def intern_tags(tags: Optional[List[str]]) -> Optional[List[str]]:
+    """Interniert Schlagwörter (dieselben wenigen Strings in allen Themen)"""
+    if tags is None:
+        return None
+    return [sys.intern(tag) if isinstance(tag, str) else tag for tag in tags]
+
+
+@dataclass(slots=True, eq=False)
+class Source(Record):
+    """Quellenangabe eines Themas"""
+
+    name: str = 'Unbekannte Quelle'
+    url: str = '#'
+    credibility: str = 'yellow'
+    extra: Optional[Dict[str, Any]] = None
+
+    _KEYS = (('name', 'name'), ('url', 'url'), ('credibility', 'credibility'))
+    _ATTRIBUTES = dict(_KEYS)
+
+    def __post_init__(self):
+        self.credibility = sys.intern(self.credibility)
+
+
+@dataclass(slots=True, eq=False, frozen=True)
+class Storyline(Record):
+    """Storyline-Vorschlag (unveränderlich, kann von vielen Themen geteilt werden)"""
+
+    duration: Optional[str] = None
+    structure: Tuple[str, ...] = ()
+    locations: Tuple[str, ...] = ()
+    protagonists: Tuple[str, ...] = ()
+    dramatic_arc: Optional[str] = None
+    extra: Optional[Dict[str, Any]] = None
+
+    _KEYS = (
+        ('duration', 'duration'),
+        ('structure', 'structure'),
+        ('locations', 'locations'),
+        ('protagonists', 'protagonists'),
+        ('dramaticArc', 'dramatic_arc')
+    )
+    _ATTRIBUTES = dict(_KEYS)
+    _OPTIONAL = frozenset(('duration', 'dramaticArc'))
+
+    def __post_init__(self):
+        # Listen aus JSON bzw. Modell-Antworten als Tupel ablegen
+        for attribute in ('structure', 'locations', 'protagonists'):
+            value = getattr(self, attribute)
+            if isinstance(value, list):
+                object.__setattr__(self, attribute, tuple(value))
+
+
+@dataclass(slots=True, eq=False)
+class Article(Record):
+    """Gescrapter Artikel (bzw. Repräsentant eines Clusters)"""
+
+    title: str = ''
+    summary: str = ''
+    link: str = ''
+    guid: Optional[str] = None
+    published: Optional[str] = None
+    source: str = 'Unbekannte Quelle'
+    credibility: str = 'yellow'
+    # Nur bei Cluster-Repräsentanten gesetzt
+    sources: Optional[List[Source]] = None
+    members: Optional[List['Article']] = None
+    extra: Optional[Dict[str, Any]] = None
+
+    _KEYS = (
+        ('title', 'title'),
+        ('summary', 'summary'),
+        ('link', 'link'),
+        ('guid', 'guid'),
+        ('published', 'published'),
+        ('source', 'source'),
+        ('credibility', 'credibility'),
+        ('sources', 'sources'),
+        ('members', 'members')
+    )
+    _ATTRIBUTES = dict(_KEYS)
+    _OPTIONAL = frozenset(('sources', 'members'))
+
+
+@dataclass(slots=True, eq=False)
+class Topic(Record):
+    """Analysiertes Thema im Schema von topics.json"""
+
+    id: int
+    title: str = 'Unbekanntes Thema'
+    tags: Optional[List[str]] = None
+    summary: Optional[str] = None
+    visual_rating: Optional[int] = None
+    visual_reason: Optional[str] = None
+    credibility: str = 'yellow'
+    sources: Optional[List[Source]] = None
+    is_duplicate: Optional[bool] = None
+    duplicate_info: Optional[str] = None
+    storyline: Optional[Storyline] = None
+    date: Optional[str] = None
+    galileo_relevance: Optional[int] = None
+    duplicate_matches: Optional[List[str]] = None
+    extra: Optional[Dict[str, Any]] = None
+
+    _KEYS = (
+        ('id', 'id'),
+        ('title', 'title'),
+        ('tags', 'tags'),
+        ('summary', 'summary'),
+        ('visualRating', 'visual_rating'),
+        ('visualReason', 'visual_reason'),
+        ('credibility', 'credibility'),
+        ('sources', 'sources'),
+        ('isDuplicate', 'is_duplicate'),
+        ('duplicateInfo', 'duplicate_info'),
+        ('storyline', 'storyline'),
+        ('date', 'date'),
+        ('galileo_relevance', 'galileo_relevance'),
+        ('duplicateMatches', 'duplicate_matches')
+    )
+    _ATTRIBUTES = dict(_KEYS)
+    _OPTIONAL = frozenset((
+        'tags', 'summary', 'visualRating', 'visualReason', 'sources', 'isDuplicate',
+        'duplicateInfo', 'storyline', 'galileo_relevance', 'duplicateMatches'
+    ))
+
+    def __post_init__(self):
+        self.tags = intern_tags(self.tags)
+        self.credibility = sys.intern(self.credibility)
+        if self.sources is not None:
+            # An Ort und Stelle: die Liste wird mit dem Cluster geteilt
+            for i, source in enumerate(self.sources):
+                if isinstance(source, dict):
+                    self.sources[i] = Source.from_dict(source)
+        if isinstance(self.storyline, dict):
+            self.storyline = Storyline.from_dict(self.storyline)
+
+
+def topics_to_json(topics: List[Union[Topic, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Wandelt Themen für die Ausgabe in Dicts (bereits vorhandene Dicts bleiben)
+
+    Args:
+        topics: Themen als Datensätze oder Dicts
+
+    Returns:
+        Themen im Schema von topics.json
+    """
+    return [topic.to_dict() if isinstance(topic, Record) else topic for topic in topics]
+
+
+def topics_from_json(topics: List[Dict[str, Any]]) -> List[Topic]:
+    """
+    Liest Themen aus topics.json als Datensätze
+
+    Args:
+        topics: Themen-Dicts
+
+    Returns:
+        Themen als Datensätze
+    """
+    return [Topic.from_dict(topic) for topic in topics]
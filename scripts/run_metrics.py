@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Run Metrics
+Laufzeit-Messungen pro Schritt, Latenz-Histogramme und optionales Profiling
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - nicht unter Windows
+    resource = None
+
+from storage import atomic_write_json
+
+
+# Obergrenzen der Histogramm-Buckets in Sekunden
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class LatencyHistogram:
+    """Latenzverteilung mit festen Buckets und Perzentilen"""
+
+    def __init__(self):
+        self.samples: List[float] = []
+
+    def observe(self, seconds: float) -> None:
+        """Nimmt eine Messung auf"""
+        self.samples.append(seconds)
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Perzentil der Messungen (nächster Rang)
+
+        Args:
+            fraction: Anteil zwischen 0 und 1 (z.B. 0.95)
+
+        Returns:
+            Latenz in Sekunden (0 ohne Messungen)
+        """
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Zusammenfassung für run_metrics.json"""
+        buckets = {f"le_{bound:g}": 0 for bound in LATENCY_BUCKETS}
+        buckets['le_inf'] = 0
+        for sample in self.samples:
+            for bound in LATENCY_BUCKETS:
+                if sample <= bound:
+                    buckets[f"le_{bound:g}"] += 1
+                    break
+            else:
+                buckets['le_inf'] += 1
+
+        return {
+            'count': len(self.samples),
+            'total': round(sum(self.samples), 4),
+            'min': round(min(self.samples, default=0.0), 4),
+            'max': round(max(self.samples, default=0.0), 4),
+            'p50': round(self.percentile(0.5), 4),
+            'p95': round(self.percentile(0.95), 4),
+            'p99': round(self.percentile(0.99), 4),
+            'buckets': buckets
+        }
+
+
+class RunMetrics:
+    """Sammelt die Messwerte eines Recherche-Laufs (thread-sicher)"""
+
+    def __init__(self):
+        self.started = datetime.now().isoformat()
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Dict[str, float]] = {}
+        self._latencies: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self._values: Dict[str, Any] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Misst Wall- und CPU-Zeit eines Schritts
+
+        Args:
+            name: Name des Schritts (z.B. 'scrape')
+        """
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            with self._lock:
+                totals = self._stages.setdefault(name, {'wall': 0.0, 'cpu': 0.0})
+                totals['wall'] += wall
+                totals['cpu'] += cpu
+
+    def observe(self, metric: str, seconds: float, key: str = 'all') -> None:
+        """
+        Nimmt eine Latenz-Messung auf
+
+        Args:
+            metric: Art der Messung (z.B. 'source', 'article')
+            seconds: Dauer in Sekunden
+            key: Unterscheidung innerhalb der Messung (z.B. Quellenname)
+        """
+        with self._lock:
+            self._latencies.setdefault(metric, {}).setdefault(key, LatencyHistogram()).observe(seconds)
+
+    def samples(self, metric: str) -> List[float]:
+        """
+        Alle Messungen einer Art über alle Unterscheidungen hinweg
+
+        Args:
+            metric: Art der Messung (z.B. 'source')
+
+        Returns:
+            Einzelmessungen in Sekunden
+        """
+        with self._lock:
+            return [
+                sample
+                for histogram in self._latencies.get(metric, {}).values()
+                for sample in histogram.samples
+            ]
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Erhöht einen Zähler"""
+        with self._lock:
+            self._values[name] = self._values.get(name, 0) + amount
+
+    def set(self, name: str, value: Any) -> None:
+        """Setzt einen Einzelwert (z.B. Cache-Trefferquote)"""
+        with self._lock:
+            self._values[name] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Alle Messwerte als JSON-taugliches Dict
+
+        Returns:
+            Schritte, Latenzen und Einzelwerte
+        """
+        with self._lock:
+            values = dict(self._values)
+            if resource is not None:
+                # ru_maxrss ist unter Linux in KB angegeben
+                values['peak_rss_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return {
+                'started': self.started,
+                'finished': datetime.now().isoformat(),
+                'stages': {
+                    name: {'wall': round(totals['wall'], 4), 'cpu': round(totals['cpu'], 4)}
+                    for name, totals in self._stages.items()
+                },
+                'latencies': {
+                    metric: {key: histogram.to_dict() for key, histogram in sorted(histograms.items())}
+                    for metric, histograms in self._latencies.items()
+                },
+                'values': values
+            }
+
+    def save(self, path: str) -> None:
+        """Schreibt die Messwerte atomar als JSON"""
+        atomic_write_json(path, self.to_dict(), indent=2)
+
+    def print_summary(self) -> None:
+        """Gibt die Dauer der einzelnen Schritte aus"""
+        with self._lock:
+            stages = list(self._stages.items())
+        for name, totals in stages:
+            print(f"   ⏱️  {name}: {totals['wall']:.2f}s Wall, {totals['cpu']:.2f}s CPU")
+
+
+def run_profiled(mode: str, run: Callable[[], None], output_dir: str,
+                 metrics: Optional[RunMetrics] = None, top: int = 25) -> str:
+    """
+    Führt einen Lauf unter cProfile oder tracemalloc aus
+
+    cProfile erfasst nur den aufrufenden Thread - Feed- und Analyse-Worker
+    erscheinen dort als Wartezeit, ihre Dauer steht in run_metrics.json.
+
+    Args:
+        mode: 'cpu' (cProfile) oder 'memory' (tracemalloc)
+        run: Auszuführender Lauf
+        output_dir: Verzeichnis für die Profil-Datei
+        metrics: Messwerte, in die z.B. der Speicher-Peak eingetragen wird
+        top: Anzahl der ausgegebenen Einträge
+
+    Returns:
+        Pfad der geschriebenen Profil-Datei
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    if mode == 'cpu':
+        profiler = cProfile.Profile()
+        try:
+            profiler.runcall(run)
+        finally:
+            path = os.path.join(output_dir, 'run_profile.prof')
+            profiler.dump_stats(path)
+            stream = io.StringIO()
+            pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(top)
+            print(stream.getvalue())
+        return path
+
+    if mode == 'memory':
+        tracemalloc.start(25)
+        try:
+            run()
+        finally:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            path = os.path.join(output_dir, 'run_memory.tracemalloc')
+            snapshot.dump(path)
+            print(f"   🧠 Speicher-Peak (Python-Heap): {peak / 1024 / 1024:.1f} MB")
+            for stat in snapshot.statistics('lineno')[:top]:
+                print(f"      {stat}")
+            if metrics:
+                metrics.set('tracemalloc_peak_bytes', peak)
+        return path
+
+    raise ValueError(f"Unbekannter Profiling-Modus: {mode}")
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Semantic Index
+Vektorisierter Ähnlichkeitsvergleich (TF-IDF bzw. Embeddings) gegen das Archiv
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import zlib
+from collections import Counter
+from typing import Callable, Dict, Any, Iterable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optionale Abhängigkeit
+    np = None
+
+from normalizer import NORMALIZER_VERSION, stem
+from storage import atomic_write_json, cache_path
+
+
+# Version der Vektorisierung - bei Änderungen hochzählen (erzwingt Neuaufbau)
+VECTORIZER_VERSION = 3
+
+# Wörter inkl. Bindestrich-Komposita ("E-Auto")
+WORD_RE = re.compile(r'\w+(?:-\w+)*')
+
+# Rechenblockgröße für die Matrix-Multiplikation (begrenzt den Speicher)
+CHUNK_ROWS = 65536
+
+
+class SynonymConfigError(Exception):
+    """Ungültige Synonym-Datei"""
+
+
+def load_synonyms(path: str) -> Dict[str, str]:
+    """
+    Lädt eine optionale Synonym-Tabelle (JSON-Objekt Wort -> Ersatz)
+
+    Args:
+        path: Pfad zur JSON-Datei, z.B. {"erderwärmung": "klimawandel"}
+
+    Returns:
+        Tabelle mit kleingeschriebenen Wörtern
+
+    Raises:
+        SynonymConfigError: Datei fehlt, ist kein JSON oder kein Objekt aus Strings
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise SynonymConfigError(f"Synonym-Datei {path} nicht lesbar: {e}") from e
+
+    if not isinstance(data, dict) or not all(
+            isinstance(word, str) and isinstance(target, str) and target.strip()
+            for word, target in data.items()):
+        raise SynonymConfigError(
+            f"Synonym-Datei {path}: erwartet ein Objekt Wort -> Ersatz (Strings)"
+        )
+    return {word.strip().lower(): target.strip().lower() for word, target in data.items()}
+
+
+def _require_numpy() -> None:
+    """Bricht mit klarer Meldung ab, wenn NumPy fehlt"""
+    if np is None:
+        raise ImportError(
+            "Der semantische Duplikat-Check benötigt NumPy: pip install numpy"
+        )
+
+
+class HashingVectorizer:
+    """TF-IDF über gehashte Wort- und Zeichen-n-Gramme (ohne Vokabular)"""
+
+    def __init__(self, dim: int = 1024, ngram: int = 4,
+                 synonyms: Optional[Dict[str, str]] = None):
+        """
+        Initialisiert den Vektorisierer
+
+        Args:
+            dim: Dimension der Vektoren
+            ngram: Länge der Zeichen-n-Gramme
+            synonyms: Optionale Tabelle Wort -> Ersatz für Umschreibungen, die
+                rein lexikalisch nie zusammenfinden ("Erderwärmung" -> "Klimawandel")
+        """
+        self.dim = dim
+        self.ngram = ngram
+        self.synonyms = synonyms or {}
+        self.idf = None
+
+    @property
+    def synonyms_digest(self) -> Optional[str]:
+        """Fingerabdruck der Synonym-Tabelle (None ohne Tabelle)"""
+        if not self.synonyms:
+            return None
+        data = json.dumps(self.synonyms, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+    def features(self, text: str) -> Counter:
+        """
+        Zerlegt einen Text in gehashte Merkmale
+
+        Args:
+            text: Titel bzw. Beschreibung
+
+        Returns:
+            Counter Bucket -> Häufigkeit
+        """
+        words = []
+        for word in WORD_RE.findall(text.lower()):
+            word = self.synonyms.get(word, word)
+            words.extend(word.split())
+            if '-' in word:
+                words.extend(part for part in word.split('-') if part)
+
+        counts: Counter = Counter()
+        for word in words:
+            # Gemeinsamer Wortstamm: "Batterie" und "Batterien" treffen sich
+            word = stem(word)
+            counts[zlib.crc32(word.encode('utf-8')) % self.dim] += 1
+            padded = f"<{word}>"
+            for i in range(len(padded) - self.ngram + 1):
+                gram = padded[i:i + self.ngram]
+                counts[zlib.crc32(gram.encode('utf-8')) % self.dim] += 1
+        return counts
+
+    def fit(self, texts: Iterable[str]) -> 'np.ndarray':
+        """
+        Berechnet IDF-Gewichte und die Vektoren der Archiv-Texte
+
+        Args:
+            texts: Archiv-Texte
+
+        Returns:
+            L2-normalisierte Matrix (Einträge x dim, float32)
+        """
+        _require_numpy()
+        rows = [self.features(text) for text in texts]
+
+        df = np.zeros(self.dim, dtype=np.float64)
+        for row in rows:
+            for bucket in row:
+                df[bucket] += 1
+        self.idf = (np.log((1 + len(rows)) / (1 + df)) + 1).astype(np.float32)
+
+        matrix = np.zeros((len(rows), self.dim), dtype=np.float32)
+        for i, row in enumerate(rows):
+            self._fill(matrix[i], row)
+        return _normalize(matrix)
+
+    def transform(self, texts: List[str]) -> 'np.ndarray':
+        """
+        Vektorisiert Anfrage-Texte mit den gelernten IDF-Gewichten
+
+        Args:
+            texts: Anfrage-Texte
+
+        Returns:
+            L2-normalisierte Matrix (Texte x dim, float32)
+        """
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            self._fill(matrix[i], self.features(text))
+        return _normalize(matrix)
+
+    def _fill(self, vector: 'np.ndarray', counts: Counter) -> None:
+        """Trägt sublineare TF-IDF-Gewichte in einen Vektor ein"""
+        for bucket, count in counts.items():
+            vector[bucket] = (1 + math.log(count)) * self.idf[bucket]
+
+
+def _normalize(matrix: 'np.ndarray') -> 'np.ndarray':
+    """L2-Normalisierung pro Zeile (Null-Zeilen bleiben Null)"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return matrix / norms
+
+
+class SemanticIndex:
+    """Vorberechnete, memory-mapped Archiv-Matrix für Batch-Abfragen"""
+
+    def __init__(self, directory: Optional[str] = None, dim: int = 1024,
+                 embed: Optional[Callable[[List[str]], Any]] = None,
+                 synonyms: Optional[Dict[str, str]] = None):
+        """
+        Initialisiert den semantischen Index
+
+        Args:
+            directory: Ablage für Matrix und Metadaten (Default: .cache/semantic)
+            dim: Vektor-Dimension für TF-IDF
+            embed: Optionale Embedding-Funktion (Liste Texte -> Matrix), z.B.
+                ein lokales sentence-transformers-Modell; ersetzt TF-IDF
+            synonyms: Optionale Synonym-Tabelle für TF-IDF (siehe load_synonyms)
+        """
+        _require_numpy()
+        self.directory = directory or cache_path('semantic')
+        self.vectorizer = HashingVectorizer(dim, synonyms=synonyms)
+        self.embed = embed
+        self.ids: List[Any] = []
+        self.titles: List[str] = []
+        self.matrix = None
+        self.revision: Optional[str] = None
+
+    @property
+    def matrix_path(self) -> str:
+        return os.path.join(self.directory, 'archive_vectors.npy')
+
+    @property
+    def meta_path(self) -> str:
+        return os.path.join(self.directory, 'archive_meta.json')
+
+    def build(self, entries: List[Dict[str, Any]], revision: Optional[str] = None,
+              persist: bool = True) -> None:
+        """
+        Berechnet die Archiv-Matrix einmalig
+
+        Args:
+            entries: Archiv-Einträge mit 'id', 'title' und optional 'description'
+            revision: Stand des Archivs (für die Erkennung veralteter Matrizen)
+            persist: Matrix auf Platte schreiben und memory-mapped laden
+        """
+        texts = [f"{entry['title']} {entry.get('description') or ''}" for entry in entries]
+        if self.embed:
+            matrix = _normalize(np.asarray(self.embed(texts), dtype=np.float32))
+        else:
+            matrix = self.vectorizer.fit(texts)
+
+        self.ids = [entry['id'] for entry in entries]
+        self.titles = [entry['title'] for entry in entries]
+        self.revision = revision
+
+        if not persist:
+            self.matrix = matrix
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.matrix_path + '.tmp.npy'
+        np.save(tmp_path, matrix)
+        os.replace(tmp_path, self.matrix_path)
+        atomic_write_json(self.meta_path, {
+            'version': VECTORIZER_VERSION,
+            'normalizer': NORMALIZER_VERSION,
+            'embedding': bool(self.embed),
+            'dim': self.vectorizer.dim,
+            'synonyms': self.vectorizer.synonyms_digest,
+            'revision': revision,
+            'ids': self.ids,
+            'titles': self.titles,
+            'idf': self.vectorizer.idf.tolist() if self.vectorizer.idf is not None else None
+        })
+        self.matrix = np.load(self.matrix_path, mmap_mode='r')
+
+    def load(self, revision: Optional[str] = None) -> bool:
+        """
+        Lädt eine gespeicherte Matrix memory-mapped
+
+        Args:
+            revision: Erwarteter Archiv-Stand (None = egal)
+
+        Returns:
+            True wenn eine passende Matrix geladen wurde
+        """
+        try:
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if (meta.get('version') != VECTORIZER_VERSION
+                or meta.get('normalizer') != NORMALIZER_VERSION
+                or meta.get('embedding') != bool(self.embed)
+                or meta.get('dim') != self.vectorizer.dim
+                or meta.get('synonyms') != self.vectorizer.synonyms_digest
+                or (revision is not None and meta.get('revision') != revision)
+                or not os.path.exists(self.matrix_path)):
+            return False
+
+        self.ids = meta['ids']
+        self.titles = meta['titles']
+        self.revision = meta.get('revision')
+        if meta.get('idf') is not None:
+            self.vectorizer.idf = np.asarray(meta['idf'], dtype=np.float32)
+        self.matrix = np.load(self.matrix_path, mmap_mode='r')
+        return True
+
+    def query(self, texts: List[str], top_k: int = 3,
+              threshold: float = 0.0) -> List[List[Dict[str, Any]]]:
+        """
+        Bewertet einen ganzen Batch von Themen mit einer Matrix-Multiplikation
+
+        Args:
+            texts: Anfrage-Texte (z.B. Themen-Titel)
+            top_k: Maximale Anzahl Treffer pro Text
+            threshold: Mindest-Kosinus-Ähnlichkeit
+
+        Returns:
+            Pro Text eine Liste Treffer mit 'id', 'title' und 'score' (beste zuerst)
+        """
+        if not texts:
+            return []
+        if self.matrix is None or len(self.ids) == 0:
+            return [[] for _ in texts]
+
+        if self.embed:
+            queries = _normalize(np.asarray(self.embed(texts), dtype=np.float32))
+        else:
+            queries = self.vectorizer.transform(texts)
+
+        k = min(top_k, len(self.ids))
+        best_scores = np.full((len(texts), 0), -1.0, dtype=np.float32)
+        best_rows = np.zeros((len(texts), 0), dtype=np.int64)
+
+        # Blockweise über das Archiv, damit auch sehr große Archive nur
+        # (Themen x CHUNK_ROWS) Ähnlichkeiten gleichzeitig im Speicher halten
+        for start in range(0, len(self.ids), CHUNK_ROWS):
+            scores = queries @ np.asarray(self.matrix[start:start + CHUNK_ROWS]).T
+            chunk_k = min(k, scores.shape[1])
+            rows = np.argpartition(-scores, chunk_k - 1, axis=1)[:, :chunk_k]
+            best_scores = np.concatenate([best_scores, np.take_along_axis(scores, rows, axis=1)], axis=1)
+            best_rows = np.concatenate([best_rows, rows + start], axis=1)
+
+        order = np.argsort(-best_scores, axis=1)[:, :k]
+        results = []
+        for i in range(len(texts)):
+            matches = []
+            for j in order[i]:
+                score = float(best_scores[i, j])
+                if score < threshold:
+                    break
+                row = int(best_rows[i, j])
+                matches.append({'id': self.ids[row], 'title': self.titles[row], 'score': round(score, 4)})
+            results.append(matches)
+        return results
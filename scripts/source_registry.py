@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Source Registry
+Quellen aus der Konfigurationsdatei, Adapter je Quellen-Typ und adaptiver
+Abfrage-Zeitplan pro Quelle
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from article_store import SeenArticleStore
+from storage import atomic_write_json, cache_path, load_json
+
+if TYPE_CHECKING:
+    from news_scraper import NewsScraperService
+    from records import Article
+
+
+# Mitgelieferte Quellen-Konfiguration
+DEFAULT_SOURCES_FILE = os.path.join(os.path.dirname(__file__), 'sources.json')
+
+# Grüne Quellen zuerst, dann gelbe - unabhängig von der Reihenfolge in der Datei
+CREDIBILITY_ORDER = ('green', 'yellow', 'red')
+
+# Abfrage-Intervall ohne Angabe in der Konfiguration (Stunden)
+DEFAULT_POLL_HOURS = 24.0
+
+# Ohne min_hours / max_hours darf das Intervall um diesen Faktor
+# vom konfigurierten abweichen (nach oben begrenzt durch MAX_ADAPTIVE_HOURS)
+INTERVAL_SPREAD = 4.0
+
+# Angestrebte Anzahl neuer Einträge pro Abfrage - deutlich unter dem Limit
+# pro Feed, damit bei schnellen Quellen zwischen zwei Abfragen nichts verloren geht
+TARGET_NEW_PER_POLL = 10
+
+# Gewicht der letzten Abfrage in der geglätteten Rate neuer Einträge
+RATE_ALPHA = 0.3
+
+# So kurz vor ihrem Termin gilt eine Quelle bereits als fällig
+# (der geplante Lauf startet nicht auf die Minute genau)
+DUE_TOLERANCE_HOURS = 1.0
+
+# Abstand der geplanten Läufe (GitHub Actions, täglich 6:00 UTC)
+RUN_PERIOD_HOURS = 24.0
+
+# Obergrenze für max_hours ohne Angabe: eine ruhige Quelle ist spätestens
+# im nächsten geplanten Lauf wieder fällig (DUE_TOLERANCE_HOURS fängt
+# schwankende Startzeiten ab) - ein längeres Intervall würde erst einen
+# ganzen Lauf später greifen
+MAX_ADAPTIVE_HOURS = RUN_PERIOD_HOURS
+
+
+class SourceConfigError(Exception):
+    """Quellen-Konfiguration fehlt oder ist ungültig"""
+
+
+# Quellen-Typ -> Adapter-Klasse (füllt register_adapter)
+ADAPTERS: Dict[str, type] = {}
+
+
+def register_adapter(type_name: str) -> Callable[[type], type]:
+    """
+    Registriert einen Adapter für einen Quellen-Typ (Dekorator)
+
+    Args:
+        type_name: Wert von 'type' in der Quellen-Konfiguration
+
+    Returns:
+        Dekorator für eine Unterklasse von SourceAdapter
+    """
+    def decorator(cls: type) -> type:
+        cls.type_name = type_name
+        ADAPTERS[type_name] = cls
+        return cls
+    return decorator
+
+
+class SourceAdapter:
+    """Schnittstelle eines Quellen-Typs: Konfiguration rein, Artikel raus"""
+
+    type_name = ''
+    # Pflichtfelder der Quellen-Konfiguration (name und credibility haben alle)
+    required_fields: Tuple[str, ...] = ()
+    # Umgebungsvariable, ohne die der Adapter nicht arbeiten kann (z.B. API-Key)
+    requires_env: Optional[str] = None
+
+    def __init__(self, scraper: 'NewsScraperService'):
+        """
+        Args:
+            scraper: Scraper mit gemeinsamer Session, Feed-Cache und Messwerten
+        """
+        self.scraper = scraper
+
+    def available(self) -> bool:
+        """True wenn der Adapter in dieser Umgebung arbeiten kann"""
+        return not self.requires_env or bool(os.environ.get(self.requires_env))
+
+    def fetch(self, source: Dict[str, Any], cutoff_date: datetime, topics: List[str]) -> List['Article']:
+        """
+        Holt die Artikel einer Quelle
+
+        Args:
+            source: Quellen-Konfiguration
+            cutoff_date: Ältestes erlaubtes Datum
+            topics: Suchthemen des Laufs
+
+        Returns:
+            Liste von Artikeln
+        """
+        raise NotImplementedError
+
+
+class SourceRegistry:
+    """Konfigurierte Quellen (RSS, Suche, Trends) mit Abfrage-Intervallen"""
+
+    def __init__(self, sources: List[Dict[str, Any]]):
+        """
+        Initialisiert die Registry
+
+        Args:
+            sources: Quellen-Konfigurationen mit 'name' und optional 'type'
+                (Default: rss), 'credibility', 'enabled', 'poll_hours',
+                'min_hours', 'max_hours' sowie den Feldern ihres Adapters
+
+        Raises:
+            SourceConfigError: Pflichtfeld fehlt oder Name doppelt
+        """
+        self.sources = [self._normalize(source) for source in sources]
+
+        names = [source['name'] for source in self.sources]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise SourceConfigError(f"Quellen mehrfach konfiguriert: {', '.join(duplicates)}")
+
+    @classmethod
+    def from_file(cls, path: Optional[str] = None) -> 'SourceRegistry':
+        """
+        Lädt die Quellen aus einer JSON-Datei ({"sources": [...]})
+
+        Args:
+            path: Pfad zur Konfiguration (Default: scripts/sources.json)
+
+        Returns:
+            Registry
+
+        Raises:
+            SourceConfigError: Datei fehlt oder ist ungültig
+        """
+        path = path or DEFAULT_SOURCES_FILE
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise SourceConfigError(f"Quellen-Konfiguration {path} nicht lesbar ({str(e)})")
+
+        if not isinstance(data, dict) or not isinstance(data.get('sources'), list):
+            raise SourceConfigError(f"Quellen-Konfiguration {path}: Liste 'sources' fehlt")
+        return cls(data['sources'])
+
+    @staticmethod
+    def _normalize(source: Dict[str, Any]) -> Dict[str, Any]:
+        """Prüft die allgemeinen Felder einer Quelle und setzt Defaults"""
+        if not isinstance(source, dict) or not source.get('name'):
+            raise SourceConfigError(f"Quelle ohne Namen: {source!r}")
+
+        source = dict(source)
+        source.setdefault('type', 'rss')
+        source.setdefault('credibility', 'yellow')
+        source.setdefault('enabled', True)
+        if source['credibility'] not in CREDIBILITY_ORDER:
+            raise SourceConfigError(
+                f"{source['name']}: unbekannte credibility '{source['credibility']}' "
+                f"(möglich: {', '.join(CREDIBILITY_ORDER)})"
+            )
+
+        poll_hours = source.setdefault('poll_hours', DEFAULT_POLL_HOURS)
+        source.setdefault('min_hours', poll_hours / INTERVAL_SPREAD)
+        source.setdefault(
+            'max_hours', max(poll_hours, min(poll_hours * INTERVAL_SPREAD, MAX_ADAPTIVE_HOURS))
+        )
+        if not 0 < source['min_hours'] <= poll_hours <= source['max_hours']:
+            raise SourceConfigError(
+                f"{source['name']}: es muss 0 < min_hours <= poll_hours <= max_hours gelten"
+            )
+        return source
+
+    def validate(self, adapters: Dict[str, SourceAdapter]) -> None:
+        """
+        Prüft Typ und Pflichtfelder aller Quellen gegen die Adapter
+
+        Args:
+            adapters: Quellen-Typ -> Adapter
+
+        Raises:
+            SourceConfigError: Unbekannter Typ oder fehlendes Pflichtfeld
+        """
+        for source in self.sources:
+            adapter = adapters.get(source['type'])
+            if adapter is None:
+                raise SourceConfigError(
+                    f"{source['name']}: unbekannter Typ '{source['type']}' "
+                    f"(möglich: {', '.join(sorted(adapters))})"
+                )
+            missing = [field for field in adapter.required_fields if not source.get(field)]
+            if missing:
+                raise SourceConfigError(f"{source['name']}: Feld {', '.join(missing)} fehlt")
+
+    def enabled(self) -> List[Dict[str, Any]]:
+        """
+        Aktive Quellen
+
+        Returns:
+            Quellen nach Glaubwürdigkeit, innerhalb gleicher Stufe in Datei-Reihenfolge
+        """
+        return sorted(
+            (source for source in self.sources if source['enabled']),
+            key=lambda source: CREDIBILITY_ORDER.index(source['credibility'])
+        )
+
+    def of_type(self, type_name: str) -> List[Dict[str, Any]]:
+        """Aktive Quellen eines Typs"""
+        return [source for source in self.enabled() if source['type'] == type_name]
+
+
+class PollScheduler:
+    """
+    Adaptiver Abfrage-Zeitplan pro Quelle
+
+    Aus den Einträgen zweier Abfragen ergibt sich, wie viele neue Einträge
+    eine Quelle pro Stunde liefert. Das nächste Intervall ist so bemessen,
+    dass etwa TARGET_NEW_PER_POLL neue Einträge anfallen - begrenzt auf
+    min_hours / max_hours der Quelle. Schnelle Quellen werden so öfter,
+    ruhige seltener abgefragt.
+    """
+
+    def __init__(self, path: Optional[str] = None, force: bool = False):
+        """
+        Initialisiert den Zeitplan
+
+        Args:
+            path: Pfad zur Zustandsdatei (Default: .cache/source_schedule.json)
+            force: Alle Quellen als fällig behandeln (der Zeitplan lernt trotzdem mit)
+        """
+        self.path = path or cache_path('source_schedule.json')
+        self.force = force
+        self._lock = threading.Lock()
+        self._state: Dict[str, Dict[str, Any]] = load_json(self.path, {}).get('sources', {})
+        self._dirty = False
+
+    def next_due(self, source: Dict[str, Any]) -> Optional[datetime]:
+        """Termin der nächsten Abfrage (None = noch nie abgefragt)"""
+        with self._lock:
+            state = self._state.get(source['name'])
+        return datetime.fromisoformat(state['next_due']) if state else None
+
+    def is_due(self, source: Dict[str, Any], now: Optional[datetime] = None) -> bool:
+        """
+        Prüft ob eine Quelle abgefragt werden soll
+
+        Args:
+            source: Quellen-Konfiguration
+            now: Aktueller Zeitpunkt (Default: jetzt)
+
+        Returns:
+            True wenn fällig, neu oder force gesetzt
+        """
+        due = self.next_due(source)
+        if self.force or due is None:
+            return True
+        return due - timedelta(hours=DUE_TOLERANCE_HOURS) <= (now or datetime.now())
+
+    def known_keys(self, source: Dict[str, Any]) -> List[str]:
+        """Artikel-Schlüssel der letzten Abfrage (für nicht fällige Quellen)"""
+        with self._lock:
+            return list(self._state.get(source['name'], {}).get('keys', []))
+
+    def record(self, source: Dict[str, Any], articles: List[Dict[str, Any]],
+               now: Optional[datetime] = None) -> float:
+        """
+        Verbucht eine erfolgreiche Abfrage und plant die nächste
+
+        Args:
+            source: Quellen-Konfiguration
+            articles: Alle Artikel der Abfrage (auch bereits bekannte)
+            now: Zeitpunkt der Abfrage (Default: jetzt)
+
+        Returns:
+            Neues Intervall in Stunden
+        """
+        now = now or datetime.now()
+        keys = [SeenArticleStore.article_key(article) for article in articles]
+
+        with self._lock:
+            state = self._state.get(source['name'], {})
+            rate = state.get('rate')
+            new = None
+            if state.get('last_polled'):
+                hours = (now - datetime.fromisoformat(state['last_polled'])).total_seconds() / 3600
+                new = len(set(keys) - set(state.get('keys', [])))
+                observed = new / max(hours, 1 / 60)
+                rate = observed if rate is None else RATE_ALPHA * observed + (1 - RATE_ALPHA) * rate
+
+            interval = self._interval(source, rate)
+            self._state[source['name']] = {
+                'last_polled': now.isoformat(),
+                'next_due': (now + timedelta(hours=interval)).isoformat(),
+                'interval_hours': round(interval, 2),
+                'rate': rate,
+                'new': new,
+                'keys': keys
+            }
+            self._dirty = True
+        return interval
+
+    @staticmethod
+    def _interval(source: Dict[str, Any], rate: Optional[float]) -> float:
+        """
+        Intervall bis zur nächsten Abfrage
+
+        Args:
+            source: Quellen-Konfiguration
+            rate: Geglättete neue Einträge pro Stunde (None = noch unbekannt)
+
+        Returns:
+            Stunden bis zur nächsten Abfrage
+        """
+        if rate is None:
+            return source['poll_hours']
+        if rate <= 0:
+            return source['max_hours']
+        return max(source['min_hours'], min(source['max_hours'], TARGET_NEW_PER_POLL / rate))
+
+    def save(self) -> None:
+        """Schreibt den Zeitplan auf Platte (nur wenn sich etwas geändert hat)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            atomic_write_json(self.path, {'sources': self._state})
+            self._dirty = False
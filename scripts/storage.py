@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Storage Helpers
+Gemeinsame Hilfsfunktionen für lokale Caches und Ausgabedateien
+"""
+
+import json
+import os
+import tempfile
+from typing import Any, Optional
+
+
+# Verzeichnis für lokale Caches (wird nicht eingecheckt, in GitHub
+# Actions über actions/cache zwischen den Läufen erhalten)
+DEFAULT_CACHE_DIR = os.path.normpath(os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    ".cache"
+))
+
+# Aktuelle umask (mkstemp legt Dateien sonst nur für den Besitzer lesbar an)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def cache_path(filename: str) -> str:
+    """
+    Liefert den Pfad einer Datei im Cache-Verzeichnis
+
+    Args:
+        filename: Dateiname
+
+    Returns:
+        Absoluter Pfad im Cache-Verzeichnis
+    """
+    return os.path.join(DEFAULT_CACHE_DIR, filename)
+
+
+def load_json(path: str, default: Any = None) -> Any:
+    """
+    Lädt eine JSON-Datei, fehlende oder kaputte Dateien ergeben den Default
+
+    Args:
+        path: Pfad zur Datei
+        default: Rückgabewert falls die Datei nicht lesbar ist
+
+    Returns:
+        Geladene Daten oder Default
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def atomic_write_bytes(path: str, data: bytes) -> None:
+    """
+    Schreibt Bytes atomar (Temp-Datei + Rename)
+
+    Ein abgebrochener Lauf hinterlässt so nie eine halb geschriebene Datei.
+
+    Args:
+        path: Zielpfad
+        data: Zu schreibender Inhalt
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def json_default(value: Any) -> Any:
+    """
+    Serialisiert Datensätze (records.py) für json.dumps
+
+    Args:
+        value: Wert, den json nicht selbst kennt
+
+    Returns:
+        JSON-taugliche Darstellung
+    """
+    to_dict = getattr(value, 'to_dict', None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def atomic_write_json(path: str, data: Any, indent: Optional[int] = None) -> None:
+    """
+    Schreibt JSON atomar (Temp-Datei + Rename)
+
+    Args:
+        path: Zielpfad
+        data: Zu schreibende Daten
+        indent: Einrückung (None = kompakt)
+    """
+    atomic_write_bytes(path, json.dumps(data, ensure_ascii=False, indent=indent,
+                                        default=json_default).encode('utf-8'))
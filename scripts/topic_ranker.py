@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Topic Ranker
+Gewichteter Score und Top-K-Auswahl der Themen (Schritt 4)
+"""
+
+import heapq
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+from records import as_dict
+from topic_shards import TEASER_CHARS
+from topic_store import parse_date
+
+
+# Gewichte der Score-Bestandteile (jeder Bestandteil liegt zwischen 0 und 1)
+DEFAULT_WEIGHTS = {
+    'relevance': 0.4,     # galileo_relevance (1-10)
+    'visual': 0.25,       # visualRating (1-5)
+    'freshness': 0.15,    # Alter von date, Halbwertszeit half_life_days
+    'credibility': 0.1,   # Seriosität der Quelle
+    'duplicate': 0.1      # Noch nicht bei Galileo behandelt
+}
+
+CREDIBILITY_SCORES = {'green': 1.0, 'yellow': 0.5, 'red': 0.0}
+
+# Felder, die Themen außerhalb der Top K in der Ausgabe behalten
+COMPACT_FIELDS = (
+    'id', 'title', 'tags', 'visualRating', 'credibility', 'date',
+    'isDuplicate', 'duplicateInfo', 'galileo_relevance'
+)
+
+
+class TopicRanker:
+    """Bewertet Themen und wählt die besten K über einen Heap aus"""
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None, top_k: int = 50,
+                 overflow: str = 'compact', half_life_days: float = 7.0,
+                 now: Optional[datetime] = None):
+        """
+        Initialisiert den Ranker
+
+        Args:
+            weights: Gewichte je Bestandteil (fehlende aus DEFAULT_WEIGHTS)
+            top_k: Anzahl vollständig ausgegebener Themen
+            overflow: 'compact' (übrige Themen gekürzt ausgeben) oder 'drop'
+            half_life_days: Nach so vielen Tagen zählt die Aktualität nur noch halb
+            now: Bezugszeitpunkt für die Aktualität (Default: jetzt)
+        """
+        unknown = set(weights or {}) - set(DEFAULT_WEIGHTS)
+        if unknown:
+            raise ValueError(f"Unbekannte Gewichte: {', '.join(sorted(unknown))}")
+        if overflow not in ('compact', 'drop'):
+            raise ValueError(f"Unbekannter Overflow-Modus: {overflow}")
+
+        self.weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        self.top_k = max(0, top_k)
+        self.overflow = overflow
+        self.half_life_days = half_life_days
+        self.now = now
+
+        # Statistik für die Ausgabe
+        self.compacted = 0
+        self.dropped = 0
+
+    def score(self, topic: Dict[str, Any], now: Optional[datetime] = None) -> float:
+        """
+        Gewichteter Score eines Themas
+
+        Args:
+            topic: Thema
+            now: Bezugszeitpunkt für die Aktualität
+
+        Returns:
+            Score (Summe der gewichteten Bestandteile)
+        """
+        now = now or self.now or datetime.now()
+        published = parse_date(topic.get('date'))
+        if published is None:
+            freshness = 0.0
+        else:
+            age_days = max(0.0, (now - published).total_seconds() / 86400)
+            freshness = 0.5 ** (age_days / self.half_life_days)
+
+        weights = self.weights
+        return (
+            weights['relevance'] * (topic.get('galileo_relevance') or 0) / 10
+            + weights['visual'] * (topic.get('visualRating') or 0) / 5
+            + weights['freshness'] * freshness
+            + weights['credibility'] * CREDIBILITY_SCORES.get(topic.get('credibility'), 0.5)
+            + weights['duplicate'] * (0.0 if topic.get('isDuplicate') else 1.0)
+        )
+
+    def rank(self, topics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Wählt die besten K Themen aus, ohne die ganze Liste zu sortieren
+
+        Args:
+            topics: Themen in beliebiger Reihenfolge
+
+        Returns:
+            Top K nach Score (vollständig), danach die übrigen Themen in
+            Fundreihenfolge - gekürzt oder (overflow='drop') weggelassen
+        """
+        top, rest = self.select(topics)
+        self.compacted = self.dropped = 0
+
+        if self.overflow == 'drop':
+            self.dropped = len(rest)
+            return top
+
+        self.compacted = len(rest)
+        return top + [self.compact(topic) for topic in rest]
+
+    def select(self, topics: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Teilt die Themen in Top K und Rest
+
+        Args:
+            topics: Themen
+
+        Returns:
+            Tuple aus Top K (bester zuerst) und übrigen Themen (Fundreihenfolge)
+        """
+        now = self.now or datetime.now()
+        scored = [(self.score(topic, now), i) for i, topic in enumerate(topics)]
+        # Bei gleichem Score gewinnt das früher gefundene Thema
+        best = heapq.nlargest(self.top_k, scored, key=lambda item: (item[0], -item[1]))
+        chosen = {i for _, i in best}
+        return (
+            [topics[i] for _, i in best],
+            [topic for i, topic in enumerate(topics) if i not in chosen]
+        )
+
+    @staticmethod
+    def compact(topic: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Kurzform eines Themas außerhalb der Top K
+
+        Args:
+            topic: Vollständiges Thema
+
+        Returns:
+            Thema ohne Storyline und Begründungen, mit gekürzter Zusammenfassung
+            und nur der ersten Quelle
+        """
+        compact = {field: topic[field] for field in COMPACT_FIELDS if field in topic}
+        summary = topic.get('summary') or ''
+        compact['summary'] = summary if len(summary) <= TEASER_CHARS else summary[:TEASER_CHARS].rstrip() + '…'
+        compact['sources'] = as_dict(list(topic.get('sources') or [])[:1])
+        compact['compact'] = True
+        return compact
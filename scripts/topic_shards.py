@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Topic Shards
+Kompakter Index für die Themenliste plus Detail-Dateien pro Tag
+"""
+
+import gzip
+import json
+import os
+from typing import Dict, Any, List, Optional
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optionale Abhängigkeit
+    brotli = None
+
+from storage import atomic_write_bytes
+
+
+# Felder, die das Frontend für die Themenkarten braucht
+CARD_FIELDS = (
+    'id', 'title', 'tags', 'visualRating', 'credibility', 'date', 'isDuplicate',
+    'galileo_relevance'
+)
+
+# Länge des Anrisstexts auf der Karte (die volle Zusammenfassung liegt im Shard)
+TEASER_CHARS = 160
+
+# Unterverzeichnis der Detail-Shards
+DETAILS_DIR = 'details'
+
+
+class TopicShardWriter:
+    """Schreibt index.json und Detail-Shards inkl. vorkomprimierter Varianten"""
+
+    def __init__(self, directory: str):
+        """
+        Initialisiert den Writer
+
+        Args:
+            directory: Ausgabeverzeichnis (z.B. docs/data)
+        """
+        self.directory = directory
+        self.written = 0
+        self.unchanged = 0
+        self.removed = 0
+
+    def write(self, topics: List[Dict[str, Any]], last_update: str) -> None:
+        """
+        Schreibt Index und Shards, unveränderte Dateien bleiben unangetastet
+
+        Args:
+            topics: Alle Themen in Anzeigereihenfolge
+            last_update: Zeitstempel des Datenstands
+        """
+        self.written = self.unchanged = self.removed = 0
+
+        shards: Dict[str, Dict[str, Any]] = {}
+        cards = []
+        for topic in topics:
+            shard = self.shard_name(topic)
+            cards.append(self.card(topic, shard))
+            shards.setdefault(shard, {})[str(topic['id'])] = self.details(topic)
+
+        details_dir = os.path.join(self.directory, DETAILS_DIR)
+        for shard, details in shards.items():
+            self._write_variants(os.path.join(details_dir, f"{shard}.json"), details)
+
+        # Shards ohne Themen (z.B. nach Ablauf der Aufbewahrung) entfernen
+        if os.path.isdir(details_dir):
+            expected = {f"{shard}.json" for shard in shards}
+            for filename in os.listdir(details_dir):
+                base = filename[:-3] if filename.endswith(('.gz', '.br')) else filename
+                if base.endswith('.json') and base not in expected:
+                    os.unlink(os.path.join(details_dir, filename))
+                    self.removed += 1
+
+        index = {'lastUpdate': last_update, 'topics': cards}
+        self._write_variants(os.path.join(self.directory, 'index.json'), index,
+                             compare={'topics': cards})
+
+    @staticmethod
+    def shard_name(topic: Dict[str, Any]) -> str:
+        """
+        Name des Detail-Shards eines Themas (ein Shard pro Tag)
+
+        Args:
+            topic: Thema
+
+        Returns:
+            Datum im Format YYYY-MM-DD oder 'undatiert'
+        """
+        date = str(topic.get('date') or '')[:10]
+        if len(date) == 10 and date[4] == '-' and date[7] == '-':
+            return date
+        return 'undatiert'
+
+    @staticmethod
+    def card(topic: Dict[str, Any], shard: str) -> Dict[str, Any]:
+        """
+        Kartenfelder eines Themas für den Index
+
+        Args:
+            topic: Thema
+            shard: Name des zugehörigen Detail-Shards
+
+        Returns:
+            Kompakter Eintrag
+        """
+        card = {field: topic[field] for field in CARD_FIELDS if field in topic}
+        summary = topic.get('summary') or ''
+        card['teaser'] = summary if len(summary) <= TEASER_CHARS else summary[:TEASER_CHARS].rstrip() + '…'
+        card['shard'] = shard
+        return card
+
+    @staticmethod
+    def details(topic: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Detailfelder eines Themas (alles, was nicht auf der Karte steht)
+
+        Args:
+            topic: Thema
+
+        Returns:
+            Detail-Eintrag für den Shard
+        """
+        return {key: value for key, value in topic.items() if key not in CARD_FIELDS}
+
+    def _write_variants(self, path: str, data: Any, compare: Optional[Any] = None) -> None:
+        """
+        Schreibt JSON kompakt sowie als .gz und (falls verfügbar) .br
+
+        Args:
+            path: Zielpfad der JSON-Datei
+            data: Zu schreibende Daten
+            compare: Teil der Daten, der über "geändert" entscheidet
+                (z.B. ohne Zeitstempel); Default: alles
+        """
+        if self._is_unchanged(path, data if compare is None else compare, compare is not None):
+            self.unchanged += 1
+            return
+
+        raw = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        atomic_write_bytes(path, raw)
+        # mtime=0: identischer Inhalt ergibt identische Bytes (keine Git-Diffs)
+        atomic_write_bytes(path + '.gz', gzip.compress(raw, compresslevel=9, mtime=0))
+        if brotli is not None:
+            atomic_write_bytes(path + '.br', brotli.compress(raw, quality=11))
+        self.written += 1
+
+    @staticmethod
+    def _is_unchanged(path: str, expected: Any, partial: bool) -> bool:
+        """Vergleicht den Inhalt einer bestehenden Datei mit den neuen Daten"""
+        if not os.path.exists(path + '.gz'):
+            return False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                current = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if partial:
+            return all(current.get(key) == value for key, value in expected.items())
+        return current == expected
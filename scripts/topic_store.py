@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Topic Store
+Inkrementelles Zusammenführen neuer Themen in docs/data/topics.json
+"""
+
+import hashlib
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+
+from article_store import SeenArticleStore, normalize_link
+from storage import atomic_write_json, load_json
+
+
+# Felder, die die Kurzform eines Themas (TopicRanker.compact) nur gekürzt
+# bzw. als Markierung enthält
+COMPACT_TRUNCATED = ('summary', 'sources', 'compact')
+
+
+def topic_id(article: Dict[str, Any]) -> int:
+    """
+    Stabile, numerische Themen-ID aus dem Artikel-Schlüssel
+
+    Dieselbe Meldung bekommt in jedem Lauf dieselbe ID. 48 Bit bleiben
+    in JavaScript exakt darstellbar (das Frontend nutzt die ID als Zahl).
+
+    Args:
+        article: (Repräsentativer) Artikel des Themas
+
+    Returns:
+        Positive Ganzzahl
+    """
+    key = SeenArticleStore.article_key(article)
+    return int(hashlib.sha1(key.encode('utf-8')).hexdigest()[:12], 16)
+
+
+def parse_date(value: Any) -> Optional[datetime]:
+    """
+    Liest das Datum eines Themas
+
+    Args:
+        value: ISO-Datum (z.B. '2026-04-30T04:37:18')
+
+    Returns:
+        Naives datetime oder None bei unlesbaren Werten
+    """
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+    # Zeitzonen-behaftete Daten für den Vergleich naiv machen
+    return parsed.replace(tzinfo=None)
+
+
+class TopicStore:
+    """Führt neue Themen mit der bestehenden Ausgabedatei zusammen"""
+
+    def __init__(self, path: str, retention_days: int = 30, max_topics: int = 500):
+        """
+        Initialisiert den Themen-Speicher
+
+        Args:
+            path: Pfad zur Ausgabedatei (topics.json)
+            retention_days: Themen mit älterem Datum fliegen raus
+            max_topics: Maximale Anzahl Themen (älteste zuerst entfernt)
+        """
+        self.path = path
+        self.retention_days = retention_days
+        self.max_topics = max_topics
+
+        self.added = 0
+        self.updated = 0
+        self.expired = 0
+
+    def merge(self, topics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Führt neue Themen mit den bereits gespeicherten zusammen
+
+        Bekannte Themen werden an ihrer bisherigen Position aktualisiert,
+        neue kommen nach vorne. So ändern sich zwischen zwei Läufen nur die
+        Zeilen, die sich tatsächlich geändert haben.
+
+        Args:
+            topics: Themen dieses Laufs (bereits sortiert)
+
+        Returns:
+            Zusammengeführte Themenliste nach Anwendung der Aufbewahrungsregel
+        """
+        existing = self.load()
+        position_by_id = {topic.get('id'): i for i, topic in enumerate(existing)}
+        # Ältere Einträge (vor den stabilen IDs) über die Quell-URL erkennen
+        position_by_url = {
+            self._primary_url(topic): i for i, topic in enumerate(existing)
+            if self._primary_url(topic)
+        }
+
+        merged = list(existing)
+        new_topics = []
+        self.added = self.updated = self.expired = 0
+
+        for topic in topics:
+            position = position_by_id.get(topic.get('id'))
+            if position is None:
+                position = position_by_url.get(self._primary_url(topic))
+            if position is None:
+                new_topics.append(topic)
+                self.added += 1
+                continue
+            topic = self._merge_topic(merged[position], topic)
+            if merged[position] != topic:
+                self.updated += 1
+            merged[position] = topic
+            # Gleiche Position nicht doppelt belegen
+            position_by_id.pop(topic.get('id'), None)
+            position_by_url.pop(self._primary_url(topic), None)
+
+        return self._apply_retention(new_topics + merged)
+
+    @staticmethod
+    def _merge_topic(stored: Dict[str, Any], topic: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Aktualisiert ein gespeichertes Thema
+
+        Fällt ein Thema aus den Top K, liefert der Lauf nur seine Kurzform
+        (TopicRanker.compact). Die ersetzt den vollständigen Eintrag nicht:
+        Storyline, Begründungen, volle Zusammenfassung und alle Quellen bleiben
+        erhalten, nur Kennzahlen wie Tags oder Duplikat-Status werden übernommen.
+
+        Args:
+            stored: Bisheriger Eintrag
+            topic: Thema dieses Laufs
+
+        Returns:
+            Neuer Eintrag
+        """
+        if not topic.get('compact') or stored.get('compact'):
+            return topic
+        merged = dict(stored)
+        merged.update((field, value) for field, value in topic.items() if field not in COMPACT_TRUNCATED)
+        return merged
+
+    def load(self) -> List[Dict[str, Any]]:
+        """
+        Lädt die bisher gespeicherten Themen
+
+        Returns:
+            Themen aus der Ausgabedatei (leer falls nicht vorhanden)
+        """
+        data = load_json(self.path, {})
+        if not isinstance(data, dict):
+            return []
+        return list(data.get('topics', []))
+
+    def save(self, topics: List[Dict[str, Any]]) -> bool:
+        """
+        Schreibt die Themen atomar, aber nur wenn sich etwas geändert hat
+
+        Args:
+            topics: Zusammengeführte Themen
+
+        Returns:
+            True wenn die Datei neu geschrieben wurde
+        """
+        current = load_json(self.path)
+        if isinstance(current, dict) and current.get('topics') == topics:
+            return False  # Kein Commit, kein Pages-Deploy
+
+        atomic_write_json(self.path, {
+            "lastUpdate": datetime.now().isoformat(),
+            "topics": topics
+        }, indent=2)
+        return True
+
+    def _apply_retention(self, topics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Entfernt veraltete Themen und begrenzt die Gesamtzahl"""
+        cutoff = datetime.now() - timedelta(days=self.retention_days)
+        kept = []
+        for topic in topics:
+            published = parse_date(topic.get('date'))
+            if published is not None and published < cutoff:
+                self.expired += 1
+                continue
+            kept.append(topic)
+
+        if len(kept) > self.max_topics:
+            # Neueste behalten, Reihenfolge der übrigen bleibt erhalten
+            newest = sorted(
+                range(len(kept)),
+                key=lambda i: parse_date(kept[i].get('date')) or datetime.max,
+                reverse=True
+            )[:self.max_topics]
+            self.expired += len(kept) - self.max_topics
+            kept = [kept[i] for i in sorted(newest)]
+
+        return kept
+
+    @staticmethod
+    def _primary_url(topic: Dict[str, Any]) -> str:
+        """Normalisierte URL der ersten Quelle ('' wenn keine)"""
+        sources = topic.get('sources') or []
+        url = sources[0].get('url', '') if sources else ''
+        return normalize_link(url) if url and url != '#' else ''
@@ -0,0 +1,91 @@
+"""
+Gemeinsame Fixtures: Module aus scripts/ importierbar machen, alle
+Caches eines Tests in ein eigenes Verzeichnis umleiten und einen lokalen
+HTTP-Server statt echter Quellen bzw. APIs bereitstellen
+"""
+
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+SCRIPTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+import storage  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Eigenes Cache-Verzeichnis pro Test, ohne API-Keys (Mock-Modus)"""
+    directory = tmp_path / 'cache'
+    monkeypatch.setattr(storage, 'DEFAULT_CACHE_DIR', str(directory))
+    for key in ('OPENAI_API_KEY', 'ANTHROPIC_API_KEY', 'YOUTUBE_API_KEY', 'GALILEO_LLM_MODEL'):
+        monkeypatch.delenv(key, raising=False)
+    return directory
+
+
+class StubServer(ThreadingHTTPServer):
+    """Lokaler HTTP-Server mit Antworten pro Pfad, merkt sich alle Anfragen"""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _StubHandler)
+        # Pfad -> Funktion(Anfrage) -> (Status, Header, Body)
+        self.routes = {}
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.server_port}{path}"
+
+    def hits(self, path):
+        with self._lock:
+            return [request for request in self.requests if request['path'] == path]
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    def _respond(self):
+        parts = urlsplit(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        request = {
+            'method': self.command,
+            'path': parts.path,
+            'query': {key: values[0] for key, values in parse_qs(parts.query).items()},
+            'headers': dict(self.headers),
+            'body': self.rfile.read(length) if length else b''
+        }
+        with self.server._lock:
+            self.server.requests.append(request)
+
+        route = self.server.routes.get(parts.path)
+        status, headers, body = route(request) if route else (404, {}, b'')
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    """Lokaler HTTP-Server für Tests der echten HTTP-Pfade"""
+    server = StubServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,151 @@
+"""Tests für AIAnalyzerService: Modell-Antworten und nicht analysierte Artikel"""
+
+import json
+import time
+
+import pytest
+
+from ai_analyzer import AIAnalyzerService, parse_model_json
+from analysis_cache import AnalysisCache
+from article_store import SeenArticleStore
+from checkpoints import CheckpointStore
+from llm_client import LLMClient
+from main_research import GalileoResearchTool
+from records import NOT_ANALYZED, Article
+
+
+TITLES = (
+    'Forscher bauen Roboter für die Tiefsee',
+    'Vulkan auf Island spuckt wieder Lava',
+    'Neue Batterie lädt Elektroautos in fünf Minuten',
+)
+
+
+def make_articles():
+    return [
+        Article(title=title, summary=f"{title}. Ausführlicher Bericht mit Bildern.",
+                link=f"https://example.com/{i}", guid=f"guid-{i}",
+                published='2026-01-01T00:00:00', source='Test', credibility='green')
+        for i, title in enumerate(TITLES)
+    ]
+
+
+def make_tool(tmp_path, analyzer):
+    tool = GalileoResearchTool(checkpoints=CheckpointStore(str(tmp_path / 'work')))
+    tool.seen_store = SeenArticleStore(str(tmp_path / 'seen.json'))
+    tool.analysis_cache = AnalysisCache(str(tmp_path / 'analysis.json'))
+    tool.ai_analyzer = analyzer
+    return tool
+
+
+def test_deadline_skipped_batch_returns_marker():
+    analyzer = AIAnalyzerService(run_deadline=1e-9, seed=1)
+
+    results = analyzer.analyze_batch(make_articles())
+
+    assert all(result is NOT_ANALYZED for result in results)
+
+
+def test_shared_deadline_overrides_run_deadline():
+    analyzer = AIAnalyzerService(run_deadline=900, seed=1)
+
+    results = analyzer.analyze_batch(make_articles(), deadline=time.monotonic() - 1)
+
+    assert all(result is NOT_ANALYZED for result in results)
+
+
+def test_failed_batch_and_single_analysis_return_marker(monkeypatch):
+    analyzer = AIAnalyzerService(seed=1)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("HTTP 400")
+
+    monkeypatch.setattr(analyzer, '_analyze_packed', fail)
+    monkeypatch.setattr(analyzer, '_analyze_fields', fail)
+
+    assert analyzer.analyze_batch(make_articles()) == [NOT_ANALYZED] * len(TITLES)
+
+
+def test_deadline_skipped_article_is_analyzed_next_run(tmp_path):
+    articles = make_articles()
+
+    first = make_tool(tmp_path, AIAnalyzerService(run_deadline=1e-9, seed=1))
+    assert first._stage_analyze(articles) == []
+    first.seen_store.save()
+
+    store = SeenArticleStore(str(tmp_path / 'seen.json'))
+    assert not any(store.is_known(article) for article in articles)
+
+    second = make_tool(tmp_path, AIAnalyzerService(seed=1))
+    second._stage_analyze(articles)
+    second.seen_store.save()
+
+    store = SeenArticleStore(str(tmp_path / 'seen.json'))
+    assert all(store.is_known(article) for article in articles)
+
+
+def test_not_relevant_result_is_remembered(tmp_path):
+    tool = make_tool(tmp_path, AIAnalyzerService(seed=1))
+    article = make_articles()[0]
+
+    assert tool.remember_analysis(article, None) is False
+    assert tool.remember_analysis(make_articles()[1], NOT_ANALYZED) is False
+
+    assert tool.seen_store.is_known(article)
+    assert not tool.seen_store.is_known(make_articles()[1])
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+def test_fenced_anthropic_reply_is_parsed(monkeypatch):
+    monkeypatch.setenv('ANTHROPIC_API_KEY', 'test-key')
+    analyzer = AIAnalyzerService(seed=1)
+    articles = make_articles()
+    results = [
+        {'index': i, 'galileo_relevance': 8, 'tags': ['Wissenschaft'], 'summary': 'S',
+         'visualRating': 4, 'visualReason': 'R'}
+        for i in range(len(articles))
+    ]
+    reply = "Hier die Bewertung:\n```json\n" + json.dumps({'results': results}) + "\n```"
+
+    def post(url, headers, json, timeout):
+        return FakeResponse({'content': [{'type': 'text', 'text': reply}]})
+
+    monkeypatch.setattr(analyzer.client.session, 'post', post)
+
+    topics = analyzer.analyze_batch(articles)
+
+    assert [topic['galileo_relevance'] for topic in topics] == [8, 8, 8]
+
+
+@pytest.mark.parametrize('content', [
+    '{"results": []}',
+    '```json\n{"results": []}\n```',
+    '```\n{"results": []}\n```',
+    'Gerne! {"results": []} Viel Erfolg.',
+])
+def test_parse_model_json_variants(content):
+    assert parse_model_json(content) == {'results': []}
+
+
+def test_parse_model_json_without_json():
+    with pytest.raises(ValueError):
+        parse_model_json('Leider keine Antwort')
+
+
+def test_openai_default_model_supports_json_mode():
+    url, headers, payload = LLMClient('openai', 'key')._build_request('prompt', 100)
+    assert payload['model'] == 'gpt-4o'
+    assert payload['response_format'] == {'type': 'json_object'}
+
+    url, headers, payload = LLMClient('openai', 'key', model='gpt-4')._build_request('prompt', 100)
+    assert 'response_format' not in payload
@@ -0,0 +1,85 @@
+"""Tests für den inhaltsadressierten Analyse-Cache"""
+
+import os
+import time
+
+from analysis_cache import AnalysisCache
+
+
+def make_cache(tmp_path, **kwargs):
+    return AnalysisCache(str(tmp_path / 'analysis.json'), **kwargs)
+
+
+def test_key_ignores_case_and_whitespace_but_not_model():
+    article = {'title': 'Vulkan  auf Island', 'summary': 'Lava fließt.\n'}
+    same = {'title': 'vulkan auf island ', 'summary': ' Lava   fließt.'}
+
+    key = AnalysisCache.make_key(article, 'v1', 'gpt-4o')
+
+    assert key == AnalysisCache.make_key(same, 'v1', 'gpt-4o')
+    assert key != AnalysisCache.make_key(article, 'v2', 'gpt-4o')
+    assert key != AnalysisCache.make_key(article, 'v1', 'claude')
+
+
+def test_hit_and_miss_are_counted(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put('a', {'relevance': 7})
+
+    assert cache.get('a') == {'relevance': 7}
+    assert cache.get('b') is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate() == 0.5
+
+
+def test_expired_entry_is_dropped(tmp_path, monkeypatch):
+    cache = make_cache(tmp_path, ttl_days=1)
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now)
+    cache.put('a', {'relevance': 7})
+
+    monkeypatch.setattr(time, 'time', lambda: now + 2 * 24 * 60 * 60)
+
+    assert cache.get('a') is None
+    assert cache.get('a') is None
+    assert cache.misses == 2
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = make_cache(tmp_path, max_entries=2)
+    cache.put('a', {'n': 1})
+    cache.put('b', {'n': 2})
+    cache.get('a')  # 'b' ist jetzt am längsten unbenutzt
+
+    cache.put('c', {'n': 3})
+
+    assert cache.get('b') is None
+    assert cache.get('a') == {'n': 1}
+    assert cache.get('c') == {'n': 3}
+
+
+def test_save_keeps_access_order(tmp_path):
+    cache = make_cache(tmp_path, max_entries=2)
+    cache.put('a', {'n': 1})
+    cache.put('b', {'n': 2})
+    cache.get('a')
+    cache.save()
+
+    reloaded = make_cache(tmp_path, max_entries=2)
+    reloaded.put('c', {'n': 3})
+
+    assert reloaded.get('a') == {'n': 1}
+    assert reloaded.get('b') is None
+
+
+def test_save_only_when_dirty(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.save()
+    assert not os.path.exists(cache.path)
+
+    cache.put('a', {'n': 1})
+    cache.save()
+    modified = os.path.getmtime(cache.path)
+    os.utime(cache.path, (modified - 60, modified - 60))
+    cache.save()
+
+    assert os.path.getmtime(cache.path) == modified - 60
@@ -0,0 +1,154 @@
+"""Tests für die parallele Abfrage externer Archive gegen einen lokalen Server"""
+
+import json
+import threading
+import time
+
+import pytest
+import requests
+
+from archive_lookup import ArchiveLookup, ArchiveLookupCache
+from duplicate_checker import DuplicateCheckerService
+
+
+def lookup_threads():
+    return [thread for thread in threading.enumerate() if thread.name.startswith('archive-lookup')]
+
+
+def episodes_route(*titles):
+    def route(request):
+        return 200, {'Content-Type': 'application/json'}, json.dumps(
+            [{'id': str(i), 'title': title} for i, title in enumerate(titles)]
+        )
+    return route
+
+
+def make_checker(tmp_path, *sources):
+    return DuplicateCheckerService(
+        archive_sources=[dict(source, enabled=True) for source in sources],
+        lookup_cache=ArchiveLookupCache(str(tmp_path / 'lookup.json'))
+    )
+
+
+def test_no_workers_without_enabled_sources():
+    checker = DuplicateCheckerService()
+
+    checker.check_topic({'title': 'Tiefsee-Roboter erkundet Marianengraben'})
+
+    assert lookup_threads() == []
+
+
+def test_close_stops_workers_and_saves_cache(tmp_path, http_server):
+    http_server.routes['/suche'] = episodes_route('Tiefsee: Roboter im Marianengraben')
+    checker = make_checker(tmp_path, {'name': 'Archiv', 'search_url': http_server.url('/suche'),
+                                      'format': 'json'})
+    topic = {'title': 'Tiefsee-Roboter erkundet Marianengraben'}
+
+    assert checker.check_topic(topic)['isDuplicate']
+    assert lookup_threads()
+
+    checker.close()
+
+    assert lookup_threads() == []
+    assert (tmp_path / 'lookup.json').exists()
+    # Nach close() startet eine neue Abfrage die Worker wieder
+    assert checker.check_topic({'title': 'Roboter taucht in den Marianengraben'})['isDuplicate']
+    checker.close()
+
+
+def test_html_source_yields_episodes_from_links(tmp_path, http_server):
+    http_server.routes['/serie/galileo'] = lambda request: (200, {'Content-Type': 'text/html; charset=utf-8'}, """
+        <html><body>
+          <nav><a href="/">Startseite</a><a href="/login">Anmelden</a></nav>
+          <ul>
+            <li><a href="/episode/41">Tiefsee: Roboter im <b>Marianengraben</b></a></li>
+            <li><a href="/episode/42" title="Wie gef&auml;hrlich sind Vulkane?"><img src="v.jpg"></a></li>
+          </ul>
+        </body></html>""")
+    checker = make_checker(tmp_path, {'name': 'Episodenführer', 'format': 'html',
+                                      'search_url': http_server.url('/serie/galileo')})
+
+    episodes = checker.archive_lookup.search(checker.archive_sources[0], 'Vulkane')
+    status = checker.check_topic({'title': 'Tiefsee-Roboter erkundet Marianengraben'})
+    checker.close()
+
+    assert {'id': http_server.url('/episode/42'), 'title': 'Wie gefährlich sind Vulkane?'} in episodes
+    assert status['duplicateMatches'] == ['Tiefsee: Roboter im Marianengraben']
+
+
+def test_source_without_parser_is_rejected():
+    with pytest.raises(ValueError, match='format'):
+        ArchiveLookup(None, [{'name': 'Archiv', 'search_url': 'https://example.org', 'enabled': True}])
+
+
+def json_source(http_server, name, path):
+    return {'name': name, 'search_url': http_server.url(path), 'format': 'json', 'enabled': True}
+
+
+def test_topics_are_looked_up_concurrently(tmp_path, http_server):
+    titles = ['Vulkan auf Island bricht aus', 'Roboter erkundet Tiefsee',
+              'Komet nähert sich der Erde', 'Bienen erkennen Gesichter']
+    # Jede Antwort wartet, bis alle Anfragen gleichzeitig laufen
+    barrier = threading.Barrier(len(titles), timeout=5)
+
+    def route(request):
+        barrier.wait()
+        return 200, {}, json.dumps([{'id': request['query']['q'], 'title': f"Galileo: {request['query']['q']}"}])
+
+    http_server.routes['/suche'] = route
+    lookup = ArchiveLookup(requests.Session(), [json_source(http_server, 'Archiv', '/suche')],
+                           cache=ArchiveLookupCache(str(tmp_path / 'lookup.json')))
+
+    results = lookup.lookup(titles)
+    lookup.close()
+
+    assert lookup.failed == 0
+    assert [matches[0]['id'] for matches in results] == titles
+
+
+def test_cached_results_skip_requests(tmp_path, http_server):
+    http_server.routes['/suche'] = episodes_route('Tiefsee: Roboter im Marianengraben')
+    sources = [json_source(http_server, 'Archiv', '/suche')]
+    titles = ['Tiefsee-Roboter erkundet Marianengraben', 'Bundestag beschließt Haushalt']
+    cache = ArchiveLookupCache(str(tmp_path / 'lookup.json'))
+
+    lookup = ArchiveLookup(requests.Session(), sources, cache=cache)
+    first = lookup.lookup(titles)
+    second = lookup.lookup(titles)
+    lookup.close()
+    cache.save()
+
+    # Auch leere Ergebnisse kommen aus dem Cache - und nach einem Neustart von Platte
+    reloaded = ArchiveLookup(requests.Session(), sources,
+                             cache=ArchiveLookupCache(str(tmp_path / 'lookup.json')))
+    third = reloaded.lookup(titles)
+
+    assert first == second == third
+    assert [len(matches) for matches in first] == [1, 0]
+    assert len(http_server.hits('/suche')) == 2
+    assert cache.hits == 2
+    assert reloaded.requests == 0
+
+
+def test_confident_match_does_not_wait_for_slow_source(tmp_path, http_server):
+    released = threading.Event()
+
+    def slow(request):
+        released.wait(5)
+        return 200, {}, '[]'
+
+    http_server.routes['/schnell'] = episodes_route('Tiefsee: Roboter im Marianengraben')
+    http_server.routes['/langsam'] = slow
+    lookup = ArchiveLookup(requests.Session(), [json_source(http_server, 'Schnell', '/schnell'),
+                                                json_source(http_server, 'Langsam', '/langsam')],
+                           cache=ArchiveLookupCache(str(tmp_path / 'lookup.json')))
+
+    started = time.monotonic()
+    results = lookup.lookup(['Tiefsee-Roboter erkundet Marianengraben'])
+    elapsed = time.monotonic() - started
+    released.set()
+    lookup.close()
+
+    assert elapsed < 2
+    assert [match['source'] for match in results[0]] == ['Schnell']
+    assert lookup.short_circuits == 1
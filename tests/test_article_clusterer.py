@@ -0,0 +1,126 @@
+"""Tests für das Zusammenfassen gleicher Meldungen (auch mit bekannten Artikeln)"""
+
+from ai_analyzer import AIAnalyzerService
+from analysis_cache import AnalysisCache
+from article_clusterer import ArticleClusterer
+from article_store import SeenArticleStore
+from checkpoints import CheckpointStore
+from main_research import GalileoResearchTool
+from records import Article
+
+SUMMARY = ("Auf Island ist der Vulkan nahe Grindavík erneut ausgebrochen. "
+           "Lava fließt in Richtung der evakuierten Stadt, Straßen sind gesperrt.")
+
+
+def make_article(source, i, title='Vulkan auf Island spuckt wieder Lava', summary=SUMMARY,
+                 credibility='green'):
+    return Article(title=title, summary=summary, link=f"https://{source.lower()}.example/{i}",
+                   source=source, credibility=credibility)
+
+
+STORY = make_article('Tagesschau', 1, credibility='yellow')
+COPY = make_article('Spiegel', 2, summary=SUMMARY + ' (dpa)')
+OTHER = make_article('Zeit', 3, title='Neue Batterie lädt Elektroautos in fünf Minuten',
+                     summary='Forscher stellen einen Akku vor, der in fünf Minuten voll ist.')
+
+
+class FailingAnalyzer(AIAnalyzerService):
+    """Schlägt Alarm, sobald ein Artikel analysiert werden soll"""
+
+    def analyze_batch(self, articles):
+        assert not articles, [article['title'] for article in articles]
+        return []
+
+
+def test_cluster_merges_copies():
+    clusters = ArticleClusterer().cluster([STORY, COPY, OTHER])
+
+    assert [cluster['title'] for cluster in clusters] == [STORY['title'], OTHER['title']]
+    # Grüne Quelle wird Repräsentant
+    assert clusters[0]['link'] == COPY['link']
+    assert [source['name'] for source in clusters[0]['sources']] == ['Spiegel', 'Tagesschau']
+
+
+def test_copy_of_known_article_is_anchored():
+    clusterer = ArticleClusterer()
+
+    clusters = clusterer.cluster([COPY, OTHER], known=[STORY])
+
+    assert [cluster['title'] for cluster in clusters] == [OTHER['title']]
+    assert clusterer.anchored == [([STORY], [COPY])]
+
+
+def test_incremental_known_before_new():
+    clusterer = ArticleClusterer()
+    clusterer.add_known(STORY)
+
+    _, is_new = clusterer.add(COPY)
+
+    assert not is_new
+    assert clusterer.add(OTHER)[1]
+    assert clusterer.anchored == [([STORY], [COPY])]
+
+
+def test_incremental_known_after_new_joins_cluster():
+    clusterer = ArticleClusterer()
+    representative, is_new = clusterer.add(COPY)
+
+    clusterer.add_known(STORY)
+
+    assert is_new
+    assert representative['members'] == [COPY, STORY]
+    assert clusterer.anchored == []
+
+
+def make_tool(tmp_path, analyzer):
+    tool = GalileoResearchTool(checkpoints=CheckpointStore(str(tmp_path / 'work')))
+    tool.seen_store = SeenArticleStore(str(tmp_path / 'seen.json'))
+    tool.analysis_cache = AnalysisCache(str(tmp_path / 'analysis.json'))
+    tool.ai_analyzer = analyzer
+    return tool
+
+
+def remember_story(tmp_path):
+    store = SeenArticleStore(str(tmp_path / 'seen.json'))
+    store.remember(STORY, {
+        'title': 'Vulkanausbruch auf Island',
+        'galileo_relevance': 8,
+        'credibility': 'yellow',
+        'sources': [{'name': 'Tagesschau', 'url': STORY['link'], 'credibility': 'yellow'}]
+    })
+    store.save()
+
+
+def test_copy_of_known_story_extends_reused_topic(tmp_path):
+    remember_story(tmp_path)
+    tool = make_tool(tmp_path, FailingAnalyzer(seed=1))
+    # Scrape: die Tagesschau-Meldung ist bekannt, die Spiegel-Kopie neu
+    assert tool.seen_store.is_known(STORY)
+    assert not tool.seen_store.is_known(COPY)
+
+    topics = tool._stage_analyze([COPY])
+
+    assert [topic['title'] for topic in topics] == ['Vulkanausbruch auf Island']
+    assert [source['name'] for source in topics[0]['sources']] == ['Tagesschau', 'Spiegel']
+    assert topics[0]['credibility'] == 'green'
+
+    store = SeenArticleStore(str(tmp_path / 'seen.json'))
+    assert store.is_known(COPY)
+    assert len(store.analysis_of(STORY)['sources']) == 2
+
+
+def test_known_articles_survive_scrape_checkpoint(tmp_path):
+    remember_story(tmp_path)
+    scrape = make_tool(tmp_path, FailingAnalyzer(seed=1))
+    scrape.seen_store.is_known(STORY)
+    scrape.checkpoints.write('scrape', [COPY], {
+        'known': scrape.seen_store.known_this_run(),
+        'known_articles': scrape.seen_store.known_articles()
+    })
+
+    analyze = make_tool(tmp_path, FailingAnalyzer(seed=1))
+    articles = analyze._load_checkpoint('analyze')
+    topics = analyze._stage_analyze(articles)
+
+    assert len(topics) == 1
+    assert len(topics[0]['sources']) == 2
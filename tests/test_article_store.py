@@ -0,0 +1,85 @@
+"""Tests für den Speicher bereits gesehener Artikel"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from article_store import SeenArticleStore, normalize_link
+
+
+@pytest.mark.parametrize('link, expected', [
+    ('https://Example.org/artikel/?utm_source=rss&utm_medium=feed', 'https://example.org/artikel'),
+    ('https://example.org/a?wt_mc=x&ref=rss&fbclid=abc#kommentare', 'https://example.org/a'),
+    ('https://example.org/a?refid=7&reference=abc', 'https://example.org/a?reference=abc&refid=7'),
+    ('https://example.org/a?id=2&page=1', 'https://example.org/a?id=2&page=1'),
+    ('https://example.org/a?page=1&id=2', 'https://example.org/a?id=2&page=1'),
+    ('https://example.org/', 'https://example.org/'),
+])
+def test_normalize_link(link, expected):
+    assert normalize_link(link) == expected
+
+
+def test_article_key_prefers_guid():
+    article = {'guid': 'abc', 'link': 'https://example.org/a', 'title': 'Titel'}
+
+    assert SeenArticleStore.article_key(article) == 'guid:abc'
+    assert SeenArticleStore.article_key({'link': 'https://example.org/a/?utm_source=x'}) \
+        == 'link:https://example.org/a'
+    assert SeenArticleStore.article_key({'title': ' Titel '}) == 'title:titel'
+
+
+def test_remember_and_reuse(tmp_path):
+    path = str(tmp_path / 'seen.json')
+    article = {'title': 'Titel', 'summary': 'Text', 'link': 'https://example.org/a'}
+    store = SeenArticleStore(path=path)
+    store.remember(article, {'title': 'Analyse'})
+    store.save()
+
+    reloaded = SeenArticleStore(path=path)
+    assert reloaded.is_known(dict(article, link='https://example.org/a?utm_campaign=feed'))
+    assert reloaded.reused_analyses() == [{'title': 'Analyse'}]
+
+
+def test_changed_article_is_not_known(tmp_path):
+    article = {'title': 'Titel', 'summary': 'Text', 'link': 'https://example.org/a'}
+    store = SeenArticleStore(path=str(tmp_path / 'seen.json'))
+    store.remember(article, {'title': 'Analyse'})
+
+    assert not store.is_known(dict(article, summary='Neuer Text'))
+    assert store.reused_analyses() == []
+
+
+def test_not_relevant_article_known_without_analysis(tmp_path):
+    article = {'title': 'Titel', 'link': 'https://example.org/a'}
+    store = SeenArticleStore(path=str(tmp_path / 'seen.json'))
+    store.remember(article, None)
+
+    assert store.is_known(article)
+    assert store.reused_analyses() == []
+
+
+def test_prune_forgets_stale_articles(tmp_path):
+    store = SeenArticleStore(path=str(tmp_path / 'seen.json'), retention_days=30)
+    old = {'title': 'Alt', 'link': 'https://example.org/alt'}
+    fresh = {'title': 'Neu', 'link': 'https://example.org/neu'}
+    store.remember(old, None)
+    store.remember(fresh, None)
+    stale = (datetime.now() - timedelta(days=31)).isoformat()
+    store._articles[SeenArticleStore.article_key(old)]['last_seen'] = stale
+
+    assert store.prune() == 1
+    assert not store.is_known(old)
+    assert store.is_known(fresh)
+
+
+def test_touch_keeps_skipped_source_alive(tmp_path):
+    store = SeenArticleStore(path=str(tmp_path / 'seen.json'))
+    article = {'title': 'Titel', 'link': 'https://example.org/a'}
+    store.remember(article, {'title': 'Analyse'})
+    key = SeenArticleStore.article_key(article)
+    store._articles[key]['last_seen'] = (datetime.now() - timedelta(days=31)).isoformat()
+
+    store.touch([key, 'link:https://example.org/unbekannt'])
+
+    assert store.prune() == 0
+    assert store.reused_analyses() == [{'title': 'Analyse'}]
@@ -0,0 +1,58 @@
+"""Tests für den Offline-Benchmark (Fixtures, synthetische Daten, Baseline-Vergleich)"""
+
+from benchmark import (
+    bench_analyze, bench_dedup, bench_scrape, compare, latency_summary,
+    synthetic_articles, synthetic_vocabulary
+)
+
+
+def test_synthetic_data_is_deterministic():
+    assert synthetic_articles(5, seed=1) == synthetic_articles(5, seed=1)
+    assert synthetic_articles(5, seed=1) != synthetic_articles(5, seed=2)
+    assert len(set(synthetic_vocabulary(1, size=500))) == 500
+
+
+def test_latency_summary():
+    samples = [i / 1000 for i in range(1, 101)]
+
+    assert latency_summary(samples) == {'p50_ms': 51.0, 'p99_ms': 100.0}
+    assert latency_summary([]) == {'p50_ms': 0.0, 'p99_ms': 0.0}
+
+
+def test_compare_reports_regressions_beyond_tolerance():
+    baseline = {
+        'analyze': {'throughput': 100.0, 'p99_ms': 10.0, 'digest': 'abc'},
+        'dedup': {'throughput': 100.0, 'p99_ms': 10.0}
+    }
+    results = {
+        'analyze': {'throughput': 80.0, 'p99_ms': 12.0, 'digest': 'abd'},
+        'dedup': {'throughput': 60.0, 'p99_ms': 20.0},
+        'scrape': {'throughput': 1.0, 'p99_ms': 1.0}
+    }
+
+    regressions = compare(results, baseline, tolerance=0.25)
+
+    assert [line.split(':')[0] for line in regressions] == ['analyze', 'dedup', 'dedup']
+    assert 'Prüfsumme abd' in regressions[0]
+
+
+def test_scrape_replays_recorded_feeds():
+    result = bench_scrape(repeat=1, seed=0)
+
+    assert result['items'] > 50
+    assert result['throughput'] > 0
+
+
+def test_analyze_is_reproducible():
+    first = bench_analyze(30, seed=7)
+    second = bench_analyze(30, seed=7)
+
+    assert first['digest'] == second['digest']
+    assert first['relevant'] == second['relevant'] > 0
+
+
+def test_dedup_finds_reworded_archive_titles():
+    result = bench_dedup(size=200, queries=20, seed=1, mode='keywords')
+
+    # Die Hälfte der Anfragen sind umgestellte Archiv-Titel
+    assert 10 <= result['duplicates'] < 20
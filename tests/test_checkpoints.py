@@ -0,0 +1,95 @@
+"""Tests für die Checkpoints der Schritte und die Auswahl der Schritte"""
+
+import os
+
+import pytest
+
+from checkpoints import STAGES, CheckpointError, CheckpointStore
+from main_research import select_stages
+from records import Article
+
+
+def make_store(tmp_path):
+    return CheckpointStore(str(tmp_path / 'work'))
+
+
+def test_write_and_read_roundtrip(tmp_path):
+    store = make_store(tmp_path)
+    articles = [Article(title='Titel', link='https://example.org/a')]
+
+    assert store.write('scrape', articles, {'known': ['guid:1']}) == 1
+
+    records, meta = store.read('scrape')
+    assert [Article.from_dict(record) for record in records] == articles
+    assert meta == {'known': ['guid:1']}
+    assert store.completed() == ['scrape']
+
+
+def test_invalidate_drops_stage_and_successors(tmp_path):
+    store = make_store(tmp_path)
+    for stage in ('scrape', 'analyze', 'dedup'):
+        store.write(stage, [{'stage': stage}])
+
+    store.invalidate('analyze')
+
+    assert store.completed() == ['scrape']
+    assert store.last_completed() == 'scrape'
+    assert not os.path.exists(store.path('analyze'))
+    assert not os.path.exists(store.path('dedup'))
+    assert store.read('scrape')[0] == [{'stage': 'scrape'}]
+    with pytest.raises(CheckpointError):
+        store.read('analyze')
+
+
+def test_invalidate_without_checkpoints_is_noop(tmp_path):
+    store = make_store(tmp_path)
+
+    store.invalidate('scrape')
+
+    assert not os.path.exists(store.manifest_path)
+
+
+def test_truncated_checkpoint_is_rejected(tmp_path):
+    store = make_store(tmp_path)
+    store.write('analyze', [{'id': 1}, {'id': 2}])
+    with open(store.path('analyze'), 'w', encoding='utf-8') as f:
+        f.write('{"id": 1}\n')
+
+    with pytest.raises(CheckpointError, match='unvollständig'):
+        store.read('analyze')
+
+
+def test_missing_file_is_rejected(tmp_path):
+    store = make_store(tmp_path)
+    store.write('analyze', [{'id': 1}])
+    os.unlink(store.path('analyze'))
+
+    with pytest.raises(CheckpointError, match='unlesbar'):
+        store.read('analyze')
+
+
+def test_select_stages(tmp_path):
+    store = make_store(tmp_path)
+
+    assert select_stages([], False, store) == list(STAGES)
+    assert select_stages(['rank', 'analyze', 'dedup'], False, store) == ['analyze', 'dedup', 'rank']
+    with pytest.raises(ValueError):
+        select_stages(['scrape', 'dedup'], False, store)
+    with pytest.raises(ValueError):
+        select_stages(['crawl'], False, store)
+    with pytest.raises(ValueError):
+        select_stages(['scrape'], True, store)
+
+
+def test_resume_after_last_completed_stage(tmp_path):
+    store = make_store(tmp_path)
+    assert select_stages([], True, store) == list(STAGES)
+
+    store.write('scrape', [])
+    store.write('analyze', [])
+    assert select_stages([], True, store) == ['dedup', 'rank', 'save']
+
+    store.write('dedup', [])
+    store.write('rank', [])
+    store.write('save')
+    assert select_stages([], True, store) == []
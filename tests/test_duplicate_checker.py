@@ -0,0 +1,147 @@
+"""Tests für den Duplikat-Check gegen das Archiv"""
+
+import glob
+import json
+import os
+import sys
+
+import pytest
+
+from archive_store import ArchiveStore
+from duplicate_checker import DEFAULT_SEMANTIC_THRESHOLD, DuplicateCheckerService
+from feed_parser import FeedStreamParser
+from normalizer import extract_keywords
+from semantic_index import SemanticIndex, SynonymConfigError, load_synonyms
+
+pytest.importorskip('numpy')
+
+FEEDS_DIR = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'fixtures', 'feeds')
+
+EPISODES = [
+    'Elektroauto-Batterie: Wie lange hält der Akku?',
+    'Vulkane: Die gefährlichsten Feuerberge der Welt',
+    'Klimawandel Grundlagen',
+    'Schwarze Löcher: Reise ins Zentrum der Milchstraße',
+    'Wie funktioniert eine Wärmepumpe?',
+    'Plastikmüll im Meer',
+]
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    path = str(tmp_path / 'archive.sqlite3')
+    store = ArchiveStore(path)
+    store.upsert([{'id': str(i), 'title': title} for i, title in enumerate(EPISODES)], extract_keywords)
+    store.close()
+    return path
+
+
+@pytest.mark.parametrize('title, episode', [
+    ('Batterien für Elektroautos halten länger als gedacht', EPISODES[0]),
+    ('Vulkan auf Island: Feuerberg bricht erneut aus', EPISODES[1]),
+    ('Wärmepumpen im Altbau: funktioniert das?', EPISODES[4]),
+    ('Schwarzes Loch im Zentrum der Milchstraße fotografiert', EPISODES[3]),
+])
+def test_semantic_mode_flags_reworded_topic(archive_path, title, episode):
+    checker = DuplicateCheckerService(archive_path=archive_path, mode='semantic')
+
+    status = checker.check_topic({'title': title})
+
+    assert status['isDuplicate']
+    assert status['duplicateMatches'] == [episode]
+
+
+def test_semantic_mode_keeps_unrelated_topic(archive_path):
+    checker = DuplicateCheckerService(archive_path=archive_path, mode='semantic')
+
+    status = checker.check_topic({'title': 'Bundeskabinett beschließt Eckpunkte für Haushalt 2027'})
+
+    assert not status['isDuplicate']
+
+
+def test_semantic_threshold_is_respected(archive_path):
+    checker = DuplicateCheckerService(archive_path=archive_path, mode='semantic', semantic_threshold=0.9)
+
+    status = checker.check_topic({'title': 'Vulkan auf Island: Feuerberg bricht erneut aus'})
+
+    assert not status['isDuplicate']
+
+
+def test_synonyms_are_optional(archive_path, tmp_path):
+    topic = {'title': 'Erderwärmung: Neue Studie zeigt Folgen'}
+    synonyms_file = tmp_path / 'synonyms.json'
+    synonyms_file.write_text(json.dumps({'Erderwärmung': 'Klimawandel'}), encoding='utf-8')
+
+    plain = DuplicateCheckerService(archive_path=archive_path, mode='semantic')
+    with_synonyms = DuplicateCheckerService(archive_path=archive_path, mode='semantic',
+                                            synonyms=load_synonyms(str(synonyms_file)))
+
+    assert not plain.check_topic(topic)['isDuplicate']
+    # Gespeicherte Matrix ohne Synonyme passt nicht mehr und wird neu gebaut
+    assert with_synonyms.check_topic(topic)['duplicateMatches'] == ['Klimawandel Grundlagen']
+
+
+@pytest.mark.parametrize('content', ['kein json', '["klimawandel"]', '{"ki": 1}', '{"ki": " "}'])
+def test_invalid_synonyms_file(tmp_path, content):
+    path = tmp_path / 'synonyms.json'
+    path.write_text(content, encoding='utf-8')
+
+    with pytest.raises(SynonymConfigError):
+        load_synonyms(str(path))
+
+
+def feed_entries():
+    entries = []
+    for path in sorted(glob.glob(os.path.join(FEEDS_DIR, '*.xml'))):
+        parser = FeedStreamParser(limit=10000)
+        with open(path, 'rb') as f:
+            parser.feed(f.read())
+        entries.extend(entry for entry in parser.close() if entry['summary'])
+    return entries
+
+
+def test_default_threshold_on_recorded_feeds():
+    # Kalibrierung: jeder Titel gegen die Teaser aller aufgezeichneten Meldungen
+    entries = feed_entries()
+    index = SemanticIndex()
+    index.build([{'id': i, 'title': entry['summary']} for i, entry in enumerate(entries)], persist=False)
+
+    results = index.query([entry['title'] for entry in entries], top_k=len(entries),
+                          threshold=DEFAULT_SEMANTIC_THRESHOLD)
+
+    own = sum(any(match['id'] == i for match in matches) for i, matches in enumerate(results))
+    foreign = sum(any(match['id'] != i for match in matches) for i, matches in enumerate(results))
+    assert len(entries) > 50
+    assert own / len(entries) >= 0.5
+    assert foreign / len(entries) <= 0.02
+
+
+def test_cli_options_reach_checker(monkeypatch, tmp_path):
+    import main_research
+
+    synonyms_file = tmp_path / 'synonyms.json'
+    synonyms_file.write_text('{"ki": "künstliche intelligenz"}', encoding='utf-8')
+    tools = []
+    monkeypatch.setattr(main_research.GalileoResearchTool, 'run',
+                        lambda self, streaming=False, stages=None: tools.append(self))
+    monkeypatch.setattr(sys, 'argv', ['main_research.py', 'dedup',
+                                      '--dedup-mode', 'semantic', '--semantic-threshold', '0.5',
+                                      '--synonyms', str(synonyms_file)])
+
+    with pytest.raises(SystemExit) as exit_info:
+        main_research.main()
+
+    assert exit_info.value.code == 0
+    checker = tools[0].duplicate_checker
+    assert checker.mode == 'semantic'
+    assert checker.semantic_threshold == 0.5
+    assert checker.synonyms == {'ki': 'künstliche intelligenz'}
+
+
+def test_default_threshold():
+    import main_research
+
+    checker = main_research.GalileoResearchTool(dedup_mode='semantic').duplicate_checker
+
+    assert checker.semantic_threshold == DEFAULT_SEMANTIC_THRESHOLD
+    assert checker.synonyms is None
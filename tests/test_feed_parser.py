@@ -0,0 +1,105 @@
+"""Tests für das inkrementelle Parsen von RSS- und Atom-Feeds"""
+
+from datetime import datetime
+
+import pytest
+
+from feed_parser import FeedStreamParser, ParseError, clean_html, parse_feed_date
+
+CUTOFF = datetime(2026, 10, 1)
+
+
+def rss(*items):
+    body = ''.join(
+        f"<item><title>{title}</title><link>https://example.org/{i}</link>"
+        f"<guid>id-{i}</guid><description>&lt;p&gt;Text {i}&lt;/p&gt;</description>"
+        f"<pubDate>{date}</pubDate></item>"
+        for i, (title, date) in enumerate(items)
+    )
+    return f'<?xml version="1.0" encoding="utf-8"?><rss><channel><title>Feed</title>{body}</channel></rss>'.encode()
+
+
+def day(n, month='Oct'):
+    return f"{n:02d} {month} 2026 08:00:00 +0200"
+
+
+def parse(data, chunk=64, **kwargs):
+    parser = FeedStreamParser(**kwargs)
+    for i in range(0, len(data), chunk):
+        if parser.feed(data[i:i + chunk]):
+            break
+    return parser, parser.close()
+
+
+def test_rss_entries():
+    _, entries = parse(rss(('Erster &amp; bester', day(10))))
+
+    assert entries == [{
+        'title': 'Erster & bester',
+        'summary': 'Text 0',
+        'link': 'https://example.org/0',
+        'guid': 'id-0',
+        'published': '2026-10-10T06:00:00'
+    }]
+
+
+def test_atom_entries():
+    data = (b'<feed xmlns="http://www.w3.org/2005/Atom"><entry><title>Atom</title>'
+            b'<link rel="self" href="https://example.org/self"/>'
+            b'<link href="https://example.org/atom"/><id>tag:1</id>'
+            b'<updated>2026-10-05T10:00:00Z</updated><summary>Kurz</summary></entry></feed>')
+
+    _, entries = parse(data)
+
+    assert entries[0]['link'] == 'https://example.org/atom'
+    assert entries[0]['guid'] == 'tag:1'
+    assert entries[0]['published'] == '2026-10-05T10:00:00'
+
+
+def test_cutoff_stops_after_stale_run():
+    data = rss(*[(f'Neu {i}', day(20)) for i in range(3)],
+               *[(f'Alt {i}', day(20, 'Sep')) for i in range(30)])
+
+    parser, entries = parse(data, cutoff=CUTOFF, max_stale=5)
+
+    assert [entry['title'] for entry in entries] == ['Neu 0', 'Neu 1', 'Neu 2']
+    assert parser.done
+    assert parser.skipped == 5
+
+
+def test_single_stale_entry_is_skipped():
+    data = rss(('Neu', day(20)), ('Ausreißer', day(1, 'Sep')), ('Auch neu', day(19)))
+
+    parser, entries = parse(data, cutoff=CUTOFF)
+
+    assert [entry['title'] for entry in entries] == ['Neu', 'Auch neu']
+    assert parser.skipped == 1
+    assert not parser.done
+
+
+def test_entry_without_date_is_kept():
+    data = rss(('Ohne Datum', ''))
+
+    _, entries = parse(data, cutoff=CUTOFF)
+
+    assert entries[0]['published'] is None
+
+
+def test_limit_stops_reading():
+    parser, entries = parse(rss(*[(f'Titel {i}', day(20)) for i in range(10)]), limit=4)
+
+    assert len(entries) == 4
+    assert parser.done
+
+
+def test_malformed_feed_raises():
+    with pytest.raises(ParseError):
+        parse(b'<rss><channel><item><title>kaputt</channel></rss>')
+
+
+def test_clean_html_and_dates():
+    assert clean_html('<b>Fett</b>&nbsp;und\n <i>kursiv</i>') == 'Fett und kursiv'
+    assert clean_html(None) == ''
+    assert parse_feed_date('Sat, 10 Oct 2026 08:00:00 GMT') == datetime(2026, 10, 10, 8, 0)
+    assert parse_feed_date('2026-10-10T10:00:00+02:00') == datetime(2026, 10, 10, 8, 0)
+    assert parse_feed_date('gestern') is None
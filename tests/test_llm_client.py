@@ -0,0 +1,170 @@
+"""Tests für den LLM-Client gegen einen lokalen Stub-Server (Retries, Rate-Limit, Deadline)"""
+
+import json
+import threading
+import time
+
+import pytest
+
+import llm_client
+from ai_analyzer import AIAnalyzerService
+from llm_client import DeadlineExceeded, LLMClient, LLMError
+from records import NOT_ANALYZED, Article
+
+PATH = '/v1/chat/completions'
+
+
+def reply(content='{"ok": true}'):
+    return 200, {'Content-Type': 'application/json'}, json.dumps(
+        {'choices': [{'message': {'content': content}}]}
+    )
+
+
+def sequence(*responses):
+    """Antwortet der Reihe nach, danach immer mit der letzten Antwort"""
+    remaining = list(responses)
+
+    def route(request):
+        request['received'] = time.monotonic()
+        return remaining.pop(0) if len(remaining) > 1 else remaining[0]
+    return route
+
+
+def make_client(http_server, **kwargs):
+    kwargs.setdefault('backoff_base', 0.01)
+    return LLMClient('openai', 'test-key', base_url=http_server.url(''), **kwargs)
+
+
+def test_retry_after_is_respected(http_server):
+    http_server.routes[PATH] = sequence((429, {'Retry-After': '0.3'}, ''), reply('fertig'))
+    client = make_client(http_server)
+
+    assert client.complete('Prompt') == 'fertig'
+
+    first, second = http_server.hits(PATH)
+    assert second['received'] - first['received'] >= 0.3
+    assert client.retries == 1
+    assert first['headers']['Authorization'] == 'Bearer test-key'
+    assert json.loads(first['body'])['messages'] == [{'role': 'user', 'content': 'Prompt'}]
+
+
+def test_backoff_uses_full_jitter(http_server, monkeypatch):
+    limits = []
+
+    def uniform(low, high):
+        limits.append((low, high))
+        return high / 2
+
+    monkeypatch.setattr(llm_client.random, 'uniform', uniform)
+    http_server.routes[PATH] = sequence(*[(503, {}, '')] * 4, reply())
+    client = make_client(http_server, backoff_base=0.02, backoff_max=0.05)
+
+    client.complete('Prompt')
+
+    # Obergrenze wächst exponentiell bis backoff_max, gewartet wird ein Zufallsanteil davon
+    assert limits == [(0, 0.02), (0, 0.04), (0, 0.05), (0, 0.05)]
+    hits = http_server.hits(PATH)
+    gaps = [later['received'] - earlier['received'] for earlier, later in zip(hits, hits[1:])]
+    assert all(gap >= high / 2 for gap, (_, high) in zip(gaps, limits))
+
+
+def test_jitter_spreads_parallel_retries():
+    client = LLMClient('openai', 'test-key', backoff_base=1.0, backoff_max=8.0)
+
+    waits = [client._backoff(3, None) for _ in range(50)]
+
+    assert all(0 <= wait <= 8.0 for wait in waits)
+    assert len(set(waits)) > 40
+
+
+def test_exhausted_retries_raise(http_server):
+    http_server.routes[PATH] = sequence((500, {}, ''))
+    client = make_client(http_server, max_retries=2)
+
+    with pytest.raises(LLMError, match='HTTP 500'):
+        client.complete('Prompt')
+
+    assert len(http_server.hits(PATH)) == 3
+
+
+def test_client_error_is_not_retried(http_server):
+    http_server.routes[PATH] = sequence((400, {}, 'response_format nicht unterstützt'))
+    client = make_client(http_server)
+
+    with pytest.raises(LLMError, match='HTTP 400'):
+        client.complete('Prompt')
+
+    assert len(http_server.hits(PATH)) == 1
+
+
+def test_token_bucket_delays_second_request(http_server):
+    http_server.routes[PATH] = sequence(reply())
+    # Jeder Aufruf braucht gut die Hälfte des Minuten-Budgets: der zweite
+    # wartet, bis 0.5 % der Kapazität nachgeflossen sind (0.3 s)
+    client = make_client(http_server, tokens_per_minute=60000)
+
+    client.complete('', max_tokens=30150)
+    client.complete('', max_tokens=30150)
+
+    first, second = http_server.hits(PATH)
+    assert second['received'] - first['received'] >= 0.25
+
+
+def test_token_bucket_wait_beyond_deadline_fails_fast(http_server):
+    http_server.routes[PATH] = sequence(reply())
+    client = make_client(http_server, tokens_per_minute=60000)
+    client.complete('', max_tokens=40000)
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        client.complete('', max_tokens=40000, deadline=time.monotonic() + 1)
+
+    assert time.monotonic() - started < 0.5
+    assert len(http_server.hits(PATH)) == 1
+
+
+def test_retry_after_beyond_deadline_fails_fast(http_server):
+    http_server.routes[PATH] = sequence((429, {'Retry-After': '30'}, ''))
+    client = make_client(http_server)
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        client.complete('Prompt', deadline=time.monotonic() + 2)
+
+    assert time.monotonic() - started < 1
+    assert len(http_server.hits(PATH)) == 1
+
+
+def test_slow_response_is_cut_off_at_deadline(http_server):
+    released = threading.Event()
+
+    def slow(request):
+        released.wait(5)
+        return reply()
+
+    http_server.routes[PATH] = slow
+    client = make_client(http_server)
+
+    started = time.monotonic()
+    try:
+        with pytest.raises(DeadlineExceeded):
+            client.complete('Prompt', deadline=time.monotonic() + 0.3)
+    finally:
+        released.set()
+
+    assert time.monotonic() - started < 2
+
+
+def test_analyzer_marks_articles_after_deadline(http_server, monkeypatch):
+    http_server.routes[PATH] = sequence((429, {'Retry-After': '30'}, ''))
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    monkeypatch.setenv('OPENAI_BASE_URL', http_server.url(''))
+    analyzer = AIAnalyzerService(run_deadline=2, seed=1)
+    articles = [Article(title='Vulkan auf Island spuckt wieder Lava', summary='Lava fließt.',
+                        link='https://example.org/1')]
+
+    results = analyzer.analyze_batch(articles)
+    analyzer.close()
+
+    assert results[0] is NOT_ANALYZED
+    assert len(http_server.hits(PATH)) == 1
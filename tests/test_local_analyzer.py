@@ -0,0 +1,112 @@
+"""Tests für die lokale Bewertung (Heuristik-Modell im Prozess-Pool)"""
+
+from ai_analyzer import AIAnalyzerService
+from analysis_cache import AnalysisCache
+from local_analyzer import HeuristicModel, LocalAnalyzerPool
+from records import Article
+
+ROBOT = ('Forscher testen Roboter im Labor',
+         'Ein Roboter taucht mit einer Drohne unter Wasser. Das Experiment zeigt spektakuläre Bilder.')
+BUDGET = ('Debatte über neues Gesetz zum Haushalt',
+          'Die Politik streitet über eine Verordnung, eine Umfrage und einen Bericht.')
+
+
+def make_articles(n=12):
+    pairs = (ROBOT, BUDGET)
+    return [
+        Article(title=f"{pairs[i % 2][0]} {i}", summary=pairs[i % 2][1],
+                link=f"https://example.org/{i}", guid=f"guid-{i}", source='Test', credibility='green')
+        for i in range(n)
+    ]
+
+
+class CountingModel(HeuristicModel):
+    """Heuristik, die die geladenen Modelle zählt"""
+
+    name = 'counting'
+    loaded = 0
+
+    def __init__(self):
+        super().__init__()
+        CountingModel.loaded += 1
+
+
+def test_heuristic_scores_visual_and_abstract_topics():
+    model = HeuristicModel()
+
+    robot = model.score(*ROBOT)
+    budget = model.score(*BUDGET)
+
+    assert robot['visualRating'] > budget['visualRating']
+    assert robot['galileo_relevance'] > budget['galileo_relevance']
+    assert robot['tags'][0] == 'Bildstark'
+    assert 'Technologie' in robot['tags']
+    assert robot['visualReason'].startswith('Filmbare Motive')
+    assert budget['visualReason'].startswith('Eher abstrakt')
+    assert robot['storyline'] is None
+
+
+def test_heuristic_without_keywords_and_long_summary():
+    fields = HeuristicModel().score('Xyz', '<p>' + 'Satz ohne Stichwort. ' * 30 + '</p>')
+
+    assert fields['tags'] == ['Gerade aktuell']
+    assert fields['visualReason'] == 'Keine eindeutigen Bildmotive erkannt'
+    assert '<p>' not in fields['summary']
+    assert fields['summary'].endswith('.')
+    assert len(fields['summary']) <= 300
+
+
+def test_single_worker_runs_in_process_and_loads_model_once():
+    CountingModel.loaded = 0
+    pool = LocalAnalyzerPool(CountingModel, workers=1)
+
+    pool.analyze(make_articles(3))
+    pool.analyze(make_articles(3))
+
+    assert CountingModel.loaded == 1
+    assert pool._executor is None
+    assert pool.name == 'counting'
+    assert pool.analyze([]) == []
+
+
+def test_process_pool_keeps_input_order():
+    articles = make_articles()
+    expected = LocalAnalyzerPool(workers=1).analyze(articles)
+    pool = LocalAnalyzerPool(workers=2, chunk_size=4)
+
+    try:
+        assert pool.analyze(articles) == expected
+        assert pool.analyze(articles[:3]) == expected[:3]
+    finally:
+        pool.close()
+
+    assert pool._executor is None
+    pool.close()
+
+
+def test_local_pool_replaces_api_and_mock(tmp_path, monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY', 'sk-test')
+    cache = AnalysisCache(str(tmp_path / 'analysis.json'))
+    pool = LocalAnalyzerPool(workers=1)
+    analyzer = AIAnalyzerService(analysis_cache=cache, local_pool=pool)
+
+    results = analyzer.analyze_batch(make_articles(2))
+
+    assert not analyzer.mock_mode
+    assert analyzer.client is None
+    assert analyzer.model == HeuristicModel.name
+    expected = HeuristicModel().score(*ROBOT)
+    assert results[0]['galileo_relevance'] == expected['galileo_relevance']
+    assert results[0]['visualRating'] == expected['visualRating']
+
+    # Zweiter Lauf kommt aus dem Cache, ohne das Modell zu fragen
+    assert analyzer.analyze_batch(make_articles(2)) == results
+    assert cache.hits == 2
+    analyzer.close()
+
+
+def test_cache_key_depends_on_local_model():
+    article = make_articles(1)[0]
+
+    assert (AnalysisCache.make_key(article, 'v1', HeuristicModel.name)
+            != AnalysisCache.make_key(article, 'v1', 'mock'))
@@ -0,0 +1,56 @@
+"""Tests für den reproduzierbaren Mock-Modus des AIAnalyzerService"""
+
+import random
+
+from ai_analyzer import AIAnalyzerService
+
+FIELDS = ('galileo_relevance', 'tags', 'visualRating', 'visualReason', 'summary')
+
+
+def make_articles(count=20):
+    return [
+        {'title': f'Meldung {i} über Forschung', 'summary': f'Bericht Nummer {i}.',
+         'link': f'https://example.org/{i}', 'guid': f'guid-{i}',
+         'published': '2026-10-01T08:00:00', 'source': 'Test', 'credibility': 'green'}
+        for i in range(count)
+    ]
+
+
+def fields(results):
+    return [tuple(str(result[field]) for field in FIELDS) if result else None for result in results]
+
+
+def test_same_seed_same_results_regardless_of_order():
+    articles = make_articles()
+
+    forward = AIAnalyzerService(seed=3).analyze_batch(articles)
+    backward = AIAnalyzerService(seed=3, max_batch_size=3).analyze_batch(articles[::-1])
+
+    assert fields(forward) == fields(backward)[::-1]
+
+
+def test_global_random_state_is_ignored():
+    articles = make_articles()
+
+    random.seed(1)
+    first = AIAnalyzerService(seed=3).analyze_batch(articles)
+    random.seed(2)
+    second = AIAnalyzerService(seed=3).analyze_batch(articles)
+
+    assert fields(first) == fields(second)
+
+
+def test_different_seed_different_results():
+    articles = make_articles()
+
+    assert fields(AIAnalyzerService(seed=1).analyze_batch(articles)) != \
+        fields(AIAnalyzerService(seed=2).analyze_batch(articles))
+
+
+def test_mock_analyses_match_batch_analysis():
+    articles = make_articles()
+    analyzer = AIAnalyzerService(seed=5)
+
+    assert fields(analyzer.mock_analyses(articles)) == fields(AIAnalyzerService(seed=5).analyze_batch(articles))
+    # Nicht relevante Artikel fallen auch hier heraus
+    assert None in analyzer.mock_analyses(articles)
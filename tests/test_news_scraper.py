@@ -0,0 +1,89 @@
+"""Tests für den Feed-Abruf gegen einen lokalen Server (bedingte Requests, Fallback)"""
+
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+
+import feed_cache
+from feed_cache import FeedCache
+from news_scraper import NewsScraperService
+from source_registry import SourceRegistry
+
+LAST_MODIFIED = 'Sat, 17 Oct 2026 06:00:00 GMT'
+
+
+def rss(*titles, entity=''):
+    date = format_datetime(datetime.now().astimezone() - timedelta(days=1))
+    items = ''.join(
+        f"<item><title>{title}{entity}</title><link>https://example.org/{i}</link>"
+        f"<guid>id-{i}</guid><description>Text {i}</description><pubDate>{date}</pubDate></item>"
+        for i, title in enumerate(titles)
+    )
+    return f'<?xml version="1.0" encoding="utf-8"?><rss><channel><title>Feed</title>{items}</channel></rss>'
+
+
+def conditional_feed(body, etag='"v1"', last_modified=LAST_MODIFIED):
+    """Antwortet mit 304, wenn der Client einen passenden Validator mitschickt"""
+    def route(request):
+        headers = request['headers']
+        if (etag and headers.get('If-None-Match') == etag) or (
+                not etag and last_modified and headers.get('If-Modified-Since') == last_modified):
+            request['status'] = 304
+            return 304, {}, b''
+        request['status'] = 200
+        validators = {'ETag': etag, 'Last-Modified': last_modified}
+        return 200, dict({'Content-Type': 'application/rss+xml'},
+                         **{name: value for name, value in validators.items() if value}), body
+    return route
+
+
+def make_scraper(tmp_path, http_server):
+    return NewsScraperService(
+        max_workers=1,
+        feed_cache=FeedCache(str(tmp_path / 'feeds.json')),
+        registry=SourceRegistry([{'name': 'Feed', 'rss': http_server.url('/rss'), 'credibility': 'green'}])
+    )
+
+
+def fetch(tmp_path, http_server):
+    scraper = make_scraper(tmp_path, http_server)
+    return [article['title'] for article in scraper.fetch_all_sources(topics=[], days_back=14)]
+
+
+@pytest.mark.parametrize('etag, sent', [('"v1"', 'If-None-Match'), (None, 'If-Modified-Since')])
+def test_unchanged_feed_is_served_from_cache(tmp_path, http_server, etag, sent):
+    http_server.routes['/rss'] = conditional_feed(rss('Vulkan', 'Komet'), etag=etag)
+
+    first = fetch(tmp_path, http_server)
+    second = fetch(tmp_path, http_server)
+
+    initial, conditional = http_server.hits('/rss')
+    assert sent not in initial['headers']
+    assert conditional['headers'][sent] == (etag or LAST_MODIFIED)
+    assert [initial['status'], conditional['status']] == [200, 304]
+    assert first == second == ['Vulkan', 'Komet']
+
+
+def test_cache_of_older_format_is_discarded(tmp_path, http_server, monkeypatch):
+    http_server.routes['/rss'] = conditional_feed(rss('Vulkan'))
+    fetch(tmp_path, http_server)
+
+    monkeypatch.setattr(feed_cache, 'FORMAT_VERSION', feed_cache.FORMAT_VERSION + 1)
+    titles = fetch(tmp_path, http_server)
+
+    request = http_server.hits('/rss')[-1]
+    assert 'If-None-Match' not in request['headers']
+    assert request['status'] == 200
+    assert titles == ['Vulkan']
+
+
+def test_feedparser_fallback_reuses_downloaded_feed(tmp_path, http_server):
+    pytest.importorskip('feedparser')
+    # HTML-Entity ohne DTD: kein wohlgeformtes XML
+    http_server.routes['/rss'] = conditional_feed(rss('Vulkan', 'Komet', entity='&nbsp;'))
+
+    titles = fetch(tmp_path, http_server)
+
+    assert [title.strip() for title in titles] == ['Vulkan', 'Komet']
+    assert len(http_server.hits('/rss')) == 1
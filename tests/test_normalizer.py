@@ -0,0 +1,101 @@
+"""Tests für die gemeinsame Normalisierung und den Neuaufbau des Archiv-Index"""
+
+import archive_store
+from archive_store import ArchiveStore
+from duplicate_checker import DuplicateCheckerService
+from normalizer import extract_keywords, fold, normalize_text, normalize_word, stem
+
+EPISODES = [
+    {'id': 'e1', 'title': 'Die Batterien der Zukunft', 'description': 'Akkus für Elektroautos'},
+    {'id': 'e2', 'title': 'Schwarze Löcher im Überblick', 'description': 'Wie Sterne kollabieren'},
+]
+
+
+def test_fold_and_normalize_text():
+    assert fold('Bäume über Flüssen ßtraße') == 'baume uber flussen sstrasse'
+    assert normalize_text('Klima-Gipfel: Ärger, Streit & Tränen!') == 'klima gipfel arger streit tranen'
+
+
+def test_stem_merges_inflections():
+    assert stem('Batterie') == stem('Batterien') == 'batteri'
+    assert stem('Vulkane') == stem('Vulkan')
+    assert stem('Löcher') == stem('locher')
+    assert normalize_word(' Batterien ') == 'batteri'
+
+
+def test_extract_keywords_drops_stop_words_and_short_words():
+    keywords = extract_keywords('Neue Batterie für das Auto: die Batterien laden schneller')
+
+    assert keywords == [stem('Batterie'), stem('Auto'), stem('laden'), stem('schneller')]
+    assert extract_keywords('Die und das im Zoo') == []
+
+
+def test_extract_keywords_returns_fresh_list():
+    keywords = extract_keywords('Vulkan auf Island')
+    keywords.append('geändert')
+
+    assert extract_keywords('Vulkan auf Island') == [stem('Vulkan'), stem('Island')]
+
+
+def make_store(tmp_path):
+    return ArchiveStore(str(tmp_path / 'archive.sqlite3'))
+
+
+def test_terms_are_rebuilt_when_normalizer_changes(tmp_path, monkeypatch):
+    store = make_store(tmp_path)
+    # Alte Normalisierung: ungestemmte Wörter
+    store.upsert(EPISODES, lambda title: title.lower().split())
+    assert store.match(extract_keywords('Batterie der Zukunft')) == []
+    assert not store.needs_reindex()
+
+    monkeypatch.setattr(archive_store, 'NORMALIZER_VERSION', 99)
+
+    assert store.needs_reindex()
+    assert store.reindex(extract_keywords) == 2
+    assert not store.needs_reindex()
+    assert store.get_meta('normalizer_version') == '99'
+    assert [hit['id'] for hit in store.match(extract_keywords('Batterie der Zukunft'))] == ['e1']
+
+
+def test_imported_keywords_are_normalized(tmp_path):
+    store = make_store(tmp_path)
+    store.upsert([{'id': 'e3', 'title': 'Plastik', 'keywords': 'Plastikmüll Meere'}], extract_keywords)
+
+    assert store.match([normalize_word('Plastikmüll'), normalize_word('Meer')]) == [
+        {'id': 'e3', 'title': 'Plastik', 'common': 2}
+    ]
+
+
+def test_upsert_reindexes_stale_entries_first(tmp_path, monkeypatch):
+    store = make_store(tmp_path)
+    store.upsert(EPISODES[:1], lambda title: title.lower().split())
+    monkeypatch.setattr(archive_store, 'NORMALIZER_VERSION', 99)
+
+    store.upsert(EPISODES[1:], extract_keywords)
+
+    assert [hit['id'] for hit in store.match(extract_keywords('Batterien der Zukunft'))] == ['e1']
+    assert [hit['id'] for hit in store.match(extract_keywords('Schwarzes Loch Überblick'))] == ['e2']
+
+
+def test_full_text_search_survives_reindex(tmp_path, monkeypatch):
+    store = make_store(tmp_path)
+    store.upsert(EPISODES, lambda title: title.lower().split())
+    monkeypatch.setattr(archive_store, 'NORMALIZER_VERSION', 99)
+    store.reindex(extract_keywords)
+
+    assert [hit['id'] for hit in store.search('Elektroautos')] == ['e1']
+    assert sorted(hit['id'] for hit in store.search('Sterne Batterien')) == ['e1', 'e2']
+    assert store.search('""') == []
+
+
+def test_checker_reindexes_outdated_archive(tmp_path, monkeypatch):
+    store = make_store(tmp_path)
+    store.upsert(EPISODES, lambda title: title.lower().split())
+    store.close()
+    monkeypatch.setattr(archive_store, 'NORMALIZER_VERSION', 99)
+
+    checker = DuplicateCheckerService(archive_path=str(tmp_path / 'archive.sqlite3'))
+
+    assert not checker.archive.needs_reindex()
+    result = checker.check_topic({'title': 'Batterie der Zukunft'})
+    assert result['duplicateMatches'] == ['Die Batterien der Zukunft']
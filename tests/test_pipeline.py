@@ -0,0 +1,95 @@
+"""Tests für die Streaming-Pipeline (Scrape → Analyse → Duplikat-Check)"""
+
+from ai_analyzer import AIAnalyzerService
+from analysis_cache import AnalysisCache
+from article_store import SeenArticleStore
+from checkpoints import CheckpointStore
+from main_research import GalileoResearchTool
+from pipeline import StreamingPipeline
+from records import Article
+
+TITLES = (
+    'Vulkan auf Island spuckt wieder Lava',
+    'Forscher bauen Roboter für die Tiefsee',
+    'Neue Batterie lädt Elektroautos in fünf Minuten',
+    'Komet nähert sich der Erde bis auf wenige Millionen Kilometer',
+    'Gletscher in den Alpen schmelzen schneller als erwartet',
+    'Bienen erkennen Gesichter von Imkern',
+    'Laserteleskop misst Abstand zum Mond auf Millimeter genau',
+)
+
+
+class FeedScraper:
+    """Liefert feste Artikel, eine Liste pro Quelle"""
+
+    def __init__(self, *sources):
+        self.sources = sources
+
+    def iter_sources(self, topics, days_back=14):
+        yield from self.sources
+
+
+class RecordingAnalyzer(AIAnalyzerService):
+    """Merkt sich das Zeitlimit jedes Batch-Aufrufs"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.deadlines = []
+
+    def analyze_batch(self, articles, max_batch_tokens=None, deadline=None):
+        self.deadlines.append(deadline)
+        return super().analyze_batch(articles, max_batch_tokens, deadline)
+
+
+def make_articles(source, count):
+    return [
+        Article(title=title, link=f"https://{source}.example/{i}", summary=f"{title}. Mit Bildern.",
+                guid=f"{source}-{i}", source=source, credibility='green')
+        for i, title in enumerate(TITLES[:count])
+    ]
+
+
+def make_tool(tmp_path, analyzer, *sources):
+    tool = GalileoResearchTool(checkpoints=CheckpointStore(str(tmp_path / 'work')))
+    tool.seen_store = SeenArticleStore(str(tmp_path / 'seen.json'))
+    tool.analysis_cache = AnalysisCache(str(tmp_path / 'analysis.json'))
+    tool.news_scraper = FeedScraper(*sources)
+    tool.ai_analyzer = analyzer
+    return tool
+
+
+def test_batches_share_one_run_deadline(tmp_path):
+    analyzer = RecordingAnalyzer(seed=1)
+    tool = make_tool(tmp_path, analyzer, make_articles('a', 7), make_articles('b', 7)[::-1])
+
+    StreamingPipeline(tool, batch_size=3).run()
+
+    assert len(analyzer.deadlines) > 1
+    assert len(set(analyzer.deadlines)) == 1
+    assert analyzer.deadlines[0] is not None
+
+
+def test_expired_run_deadline_skips_later_batches(tmp_path, monkeypatch):
+    analyzer = AIAnalyzerService(seed=1)
+    monkeypatch.setattr(analyzer, 'start_deadline', lambda: 0.0)
+    tool = make_tool(tmp_path, analyzer, make_articles('a', 7))
+
+    pipeline = StreamingPipeline(tool, batch_size=3)
+
+    assert pipeline.run() == []
+    assert pipeline.relevant_count == 0
+
+
+def test_streaming_run_persists_seen_store_and_checkpoints(tmp_path):
+    articles = make_articles('a', 5)
+    tool = make_tool(tmp_path, AIAnalyzerService(seed=1), articles[:3], articles[3:])
+
+    topics = tool._run_stages(['scrape', 'analyze', 'dedup'], streaming=True)
+
+    store = SeenArticleStore(str(tmp_path / 'seen.json'))
+    assert all(store.is_known(article) for article in articles)
+    assert tool.checkpoints.completed() == ['scrape', 'analyze', 'dedup']
+    scraped, meta = tool.checkpoints.read('scrape')
+    assert [Article.from_dict(record) for record in scraped] == articles
+    assert set(meta) == {'known', 'known_articles'}
+    assert len(tool.checkpoints.read('analyze')[0]) == len(topics)
@@ -0,0 +1,84 @@
+"""Tests für die dict-kompatiblen Datensätze (Artikel, Themen, Quellen, Storylines)"""
+
+import dataclasses
+import json
+
+import pytest
+
+from records import Article, Source, Storyline, Topic, topics_from_json, topics_to_json
+from storage import json_default
+
+TOPIC = {
+    'id': 7,
+    'title': 'Vulkan auf Island',
+    'tags': ['Bildstark', 'Wissenschaft'],
+    'summary': 'Lava fließt.',
+    'visualRating': 5,
+    'visualReason': 'Spektakuläre Bilder',
+    'credibility': 'green',
+    'sources': [{'name': 'Tagesschau', 'url': 'https://example.org/a', 'credibility': 'green'}],
+    'isDuplicate': False,
+    'duplicateInfo': '✅ Noch nicht bei Galileo behandelt',
+    'storyline': {'duration': '8-10 Minuten', 'structure': ['Einstieg', 'Ausbruch'],
+                  'locations': [], 'protagonists': ['Vulkanologin'], 'dramaticArc': 'Spannung'},
+    'date': '2026-10-17T08:00:00',
+    'galileo_relevance': 9,
+    'neuesFeld': {'bleibt': True}
+}
+
+
+def test_topic_roundtrip_keeps_schema_order_and_unknown_keys():
+    topic = Topic.from_dict(TOPIC)
+
+    assert topic.to_dict() == TOPIC
+    assert list(topic.to_dict()) == list(TOPIC)
+    assert topics_to_json(topics_from_json([TOPIC])) == [TOPIC]
+
+
+def test_nested_records_are_converted():
+    topic = Topic.from_dict(TOPIC)
+
+    assert isinstance(topic.sources[0], Source)
+    assert isinstance(topic.storyline, Storyline)
+    assert topic.storyline.structure == ('Einstieg', 'Ausbruch')
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        topic.storyline.duration = '5 Minuten'
+
+
+def test_dict_style_access():
+    article = Article(title='Titel', link='https://example.org/a')
+
+    assert article['title'] == 'Titel'
+    assert article.get('sources', []) == []
+    assert 'members' not in article
+    with pytest.raises(KeyError):
+        article['sources']
+
+    article.update({'summary': 'Text', 'score': 0.5})
+    article['credibility'] = 'green'
+
+    assert article['summary'] == 'Text'
+    assert article['score'] == 0.5
+    assert article.to_dict()['credibility'] == 'green'
+    assert article == dict(article.to_dict())
+
+
+def test_copy_is_shallow():
+    article = Article(title='Titel', sources=[Source(name='A')])
+
+    copy = article.copy()
+    copy['title'] = 'Kopie'
+
+    assert article['title'] == 'Titel'
+    assert copy['sources'] is article['sources']
+
+
+def test_records_have_no_instance_dict():
+    for record in (Article(), Topic(id=1), Source(), Storyline()):
+        assert not hasattr(record, '__dict__')
+
+
+def test_records_serialize_as_json():
+    topic = Topic.from_dict(TOPIC)
+
+    assert json.loads(json.dumps(topic, default=json_default)) == TOPIC
@@ -0,0 +1,171 @@
+"""Tests für Quellen-Registry und adaptiven Abfrage-Zeitplan"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from source_registry import (
+    DEFAULT_SOURCES_FILE, DUE_TOLERANCE_HOURS, MAX_ADAPTIVE_HOURS, RATE_ALPHA, TARGET_NEW_PER_POLL,
+    PollScheduler, SourceAdapter, SourceConfigError, SourceRegistry
+)
+
+NOW = datetime(2026, 10, 18, 6, 0)
+
+
+def make_source(**fields):
+    return SourceRegistry([dict({'name': 'Feed', 'rss': 'https://example.org/rss'}, **fields)]).sources[0]
+
+
+def articles(*ids):
+    return [{'title': f'Artikel {i}', 'link': f'https://example.org/{i}'} for i in ids]
+
+
+def test_default_max_hours_fits_daily_run():
+    assert make_source()['max_hours'] == MAX_ADAPTIVE_HOURS
+    assert make_source(poll_hours=2)['max_hours'] == 8
+    # Ausdrücklich seltener konfigurierte Quellen bleiben gültig
+    assert make_source(poll_hours=48)['max_hours'] == 48
+    assert make_source(max_hours=96)['max_hours'] == 96
+
+
+def test_invalid_interval_rejected():
+    with pytest.raises(SourceConfigError):
+        make_source(poll_hours=24, max_hours=12)
+    with pytest.raises(SourceConfigError):
+        make_source(min_hours=0)
+
+
+@pytest.mark.parametrize('sources, message', [
+    ([{'rss': 'https://example.org/rss'}], 'ohne Namen'),
+    (['Feed'], 'ohne Namen'),
+    ([{'name': 'Feed', 'credibility': 'blue'}], 'credibility'),
+    ([{'name': 'Feed'}, {'name': 'Feed'}], 'mehrfach'),
+])
+def test_invalid_source_rejected(sources, message):
+    with pytest.raises(SourceConfigError, match=message):
+        SourceRegistry(sources)
+
+
+@pytest.mark.parametrize('content, message', [
+    (None, 'nicht lesbar'),
+    ('{kein json', 'nicht lesbar'),
+    ('{"feeds": []}', "'sources' fehlt"),
+])
+def test_invalid_file_rejected(tmp_path, content, message):
+    path = tmp_path / 'sources.json'
+    if content is not None:
+        path.write_text(content, encoding='utf-8')
+
+    with pytest.raises(SourceConfigError, match=message):
+        SourceRegistry.from_file(str(path))
+
+
+class FeedAdapter(SourceAdapter):
+    required_fields = ('rss',)
+
+
+def test_validate_checks_type_and_required_fields():
+    adapters = {'rss': FeedAdapter(scraper=None)}
+
+    SourceRegistry([{'name': 'Feed', 'rss': 'https://example.org/rss'}]).validate(adapters)
+    with pytest.raises(SourceConfigError, match="unbekannter Typ 'podcast'"):
+        SourceRegistry([{'name': 'Feed', 'type': 'podcast'}]).validate(adapters)
+    with pytest.raises(SourceConfigError, match='Feld rss fehlt'):
+        SourceRegistry([{'name': 'Feed', 'rss': ''}]).validate(adapters)
+
+
+def test_enabled_sorted_by_credibility():
+    registry = SourceRegistry([
+        {'name': 'Gelb', 'credibility': 'yellow'},
+        {'name': 'Rot', 'credibility': 'red'},
+        {'name': 'Grün', 'credibility': 'green', 'type': 'search'},
+        {'name': 'Aus', 'credibility': 'green', 'enabled': False},
+        {'name': 'Auch gelb'},
+    ])
+
+    assert [source['name'] for source in registry.enabled()] == ['Grün', 'Gelb', 'Auch gelb', 'Rot']
+    assert [source['name'] for source in registry.of_type('search')] == ['Grün']
+
+
+def test_shipped_sources_need_no_api_key():
+    registry = SourceRegistry.from_file(DEFAULT_SOURCES_FILE)
+
+    assert {source['type'] for source in registry.enabled()} == {'rss'}
+
+
+def test_new_source_is_due(tmp_path):
+    scheduler = PollScheduler(path=str(tmp_path / 'schedule.json'))
+
+    assert scheduler.is_due(make_source(), now=NOW)
+
+
+def test_first_poll_uses_configured_interval(tmp_path):
+    scheduler = PollScheduler(path=str(tmp_path / 'schedule.json'))
+    source = make_source(poll_hours=12)
+
+    assert scheduler.record(source, articles(1, 2), now=NOW) == 12
+    assert not scheduler.is_due(source, now=NOW + timedelta(hours=10))
+    assert scheduler.is_due(source, now=NOW + timedelta(hours=12 - DUE_TOLERANCE_HOURS))
+
+
+def test_quiet_source_due_in_next_daily_run(tmp_path):
+    scheduler = PollScheduler(path=str(tmp_path / 'schedule.json'))
+    source = make_source()
+
+    scheduler.record(source, articles(1, 2), now=NOW)
+    interval = scheduler.record(source, articles(1, 2), now=NOW + timedelta(hours=24))
+
+    assert interval == MAX_ADAPTIVE_HOURS
+    # Der nächste Lauf startet etwas früher als geplant
+    assert scheduler.is_due(source, now=NOW + timedelta(hours=47, minutes=50))
+
+
+def test_busy_source_polled_more_often(tmp_path):
+    scheduler = PollScheduler(path=str(tmp_path / 'schedule.json'))
+    source = make_source(poll_hours=2)
+
+    scheduler.record(source, articles(*range(10)), now=NOW)
+    # 40 neue Einträge in 4 Stunden
+    interval = scheduler.record(source, articles(*range(10, 50)), now=NOW + timedelta(hours=4))
+
+    assert interval == pytest.approx(TARGET_NEW_PER_POLL / 10)
+    assert len(scheduler.known_keys(source)) == 40
+
+
+def test_rate_is_smoothed(tmp_path):
+    scheduler = PollScheduler(path=str(tmp_path / 'schedule.json'))
+    source = make_source(poll_hours=2, min_hours=0.01)
+
+    scheduler.record(source, articles(*range(10)), now=NOW)
+    scheduler.record(source, articles(*range(10, 50)), now=NOW + timedelta(hours=4))
+    # Danach 2 neue Einträge pro Stunde statt 10
+    interval = scheduler.record(source, articles(*range(50, 58)), now=NOW + timedelta(hours=8))
+
+    rate = RATE_ALPHA * 2 + (1 - RATE_ALPHA) * 10
+    assert interval == pytest.approx(TARGET_NEW_PER_POLL / rate)
+
+
+def test_busy_source_limited_by_min_hours(tmp_path):
+    scheduler = PollScheduler(path=str(tmp_path / 'schedule.json'))
+    source = make_source()
+
+    scheduler.record(source, articles(*range(10)), now=NOW)
+    interval = scheduler.record(source, articles(*range(10, 50)), now=NOW + timedelta(hours=4))
+
+    assert interval == source['min_hours'] == 6
+
+
+def test_force_and_persistence(tmp_path):
+    path = str(tmp_path / 'schedule.json')
+    source = make_source()
+    scheduler = PollScheduler(path=path)
+    scheduler.record(source, articles(1), now=NOW)
+    scheduler.save()
+
+    reloaded = PollScheduler(path=path)
+    assert reloaded.next_due(source) == NOW + timedelta(hours=24)
+    assert not reloaded.is_due(source, now=NOW + timedelta(hours=1))
+    assert PollScheduler(path=path, force=True).is_due(source, now=NOW + timedelta(hours=1))
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f)['sources']['Feed']['keys']
@@ -0,0 +1,126 @@
+"""Tests für den gewichteten Score und die Top-K-Auswahl der Themen"""
+
+import argparse
+from datetime import datetime, timedelta
+
+import pytest
+
+from main_research import parse_weights
+from topic_ranker import DEFAULT_WEIGHTS, TopicRanker
+
+NOW = datetime(2026, 10, 18, 12, 0)
+
+
+def make_topic(i, relevance=5, days_ago=0, **fields):
+    topic = {
+        'id': i,
+        'title': f'Thema {i}',
+        'summary': 'Zusammenfassung ' * 20,
+        'date': (NOW - timedelta(days=days_ago)).isoformat(),
+        'galileo_relevance': relevance,
+        'visualRating': 3,
+        'credibility': 'green',
+        'isDuplicate': False,
+        'storyline': {'hook': 'Einstieg'},
+        'reasons': ['weil'],
+        'sources': [{'name': 'A', 'url': f'https://example.org/{i}/a', 'credibility': 'green'},
+                    {'name': 'B', 'url': f'https://example.org/{i}/b', 'credibility': 'green'}]
+    }
+    topic.update(fields)
+    return topic
+
+
+def only(weight):
+    """Gewichte, bei denen nur ein Bestandteil zählt"""
+    return {name: (1.0 if name == weight else 0.0) for name in DEFAULT_WEIGHTS}
+
+
+def test_freshness_halves_after_half_life():
+    ranker = TopicRanker(weights=only('freshness'), half_life_days=7, now=NOW)
+
+    assert ranker.score(make_topic(1)) == pytest.approx(1.0)
+    assert ranker.score(make_topic(1, days_ago=7)) == pytest.approx(0.5)
+    assert ranker.score(make_topic(1, days_ago=14)) == pytest.approx(0.25)
+    assert ranker.score(make_topic(1, date=None)) == 0.0
+    # Datum in der Zukunft zählt wie heute
+    assert ranker.score(make_topic(1, days_ago=-3)) == pytest.approx(1.0)
+
+
+def test_score_combines_weighted_parts():
+    ranker = TopicRanker(now=NOW)
+    topic = make_topic(1, relevance=10, visualRating=5, credibility='yellow', isDuplicate=True)
+
+    expected = (DEFAULT_WEIGHTS['relevance'] + DEFAULT_WEIGHTS['visual']
+                + DEFAULT_WEIGHTS['freshness'] + DEFAULT_WEIGHTS['credibility'] * 0.5)
+    assert ranker.score(topic) == pytest.approx(expected)
+
+
+def test_rank_puts_top_k_first_and_compacts_rest():
+    topics = [make_topic(1, relevance=3), make_topic(2, relevance=9),
+              make_topic(3, relevance=1), make_topic(4, relevance=7)]
+    ranker = TopicRanker(top_k=2, now=NOW)
+
+    ranked = ranker.rank(topics)
+
+    assert [topic['id'] for topic in ranked] == [2, 4, 1, 3]
+    assert ranked[0] is topics[1]
+    assert (ranker.compacted, ranker.dropped) == (2, 0)
+
+    compact = ranked[2]
+    assert compact['compact'] is True
+    assert 'storyline' not in compact and 'reasons' not in compact
+    assert [source['name'] for source in compact['sources']] == ['A']
+    assert compact['summary'].endswith('…')
+    assert compact['galileo_relevance'] == 3
+    # Das Original bleibt unverändert
+    assert len(topics[0]['sources']) == 2
+
+
+def test_overflow_drop_leaves_rest_out():
+    topics = [make_topic(i, relevance=i) for i in range(1, 6)]
+    ranker = TopicRanker(top_k=3, overflow='drop', now=NOW)
+
+    ranked = ranker.rank(topics)
+
+    assert [topic['id'] for topic in ranked] == [5, 4, 3]
+    assert (ranker.compacted, ranker.dropped) == (0, 2)
+
+
+def test_ties_keep_discovery_order():
+    topics = [make_topic(i) for i in range(1, 5)]
+
+    top, rest = TopicRanker(top_k=2, now=NOW).select(topics)
+
+    assert [topic['id'] for topic in top] == [1, 2]
+    assert [topic['id'] for topic in rest] == [3, 4]
+
+
+def test_top_k_larger_than_topics():
+    topics = [make_topic(1, relevance=2), make_topic(2, relevance=8)]
+    ranker = TopicRanker(top_k=10, now=NOW)
+
+    assert [topic['id'] for topic in ranker.rank(topics)] == [2, 1]
+    assert ranker.compacted == 0
+
+
+def test_weights_change_order():
+    fresh = make_topic(1, relevance=2)
+    relevant = make_topic(2, relevance=10, days_ago=30)
+
+    assert TopicRanker(weights=only('freshness'), top_k=1, now=NOW).rank([relevant, fresh])[0] is fresh
+    assert TopicRanker(weights=only('relevance'), top_k=1, now=NOW).rank([fresh, relevant])[0] is relevant
+
+
+def test_invalid_configuration_is_rejected():
+    with pytest.raises(ValueError, match='Gewichte'):
+        TopicRanker(weights={'hype': 1.0})
+    with pytest.raises(ValueError, match='Overflow'):
+        TopicRanker(overflow='hide')
+
+
+def test_parse_weights():
+    assert parse_weights('relevance=0.6, visual=0.1') == {'relevance': 0.6, 'visual': 0.1}
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_weights('hype=1')
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_weights('relevance=viel')
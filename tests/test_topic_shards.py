@@ -0,0 +1,33 @@
+"""Tests für den kompakten Themen-Index und die Detail-Shards"""
+
+import json
+
+from topic_shards import TopicShardWriter
+
+
+def make_topic(i, relevance, date='2026-10-17T08:00:00'):
+    return {'id': i, 'title': f'Thema {i}', 'tags': ['Wissenschaft'], 'visualRating': 3,
+            'credibility': 'green', 'date': date, 'isDuplicate': False,
+            'galileo_relevance': relevance, 'summary': 'Zusammenfassung', 'storyline': {'hook': 'H'}}
+
+
+def test_cards_carry_relevance_and_details_the_rest(tmp_path):
+    writer = TopicShardWriter(str(tmp_path))
+
+    writer.write([make_topic(1, 9), make_topic(2, 4, date='2026-10-16T08:00:00')], '2026-10-18T06:00:00')
+
+    index = json.loads((tmp_path / 'index.json').read_text(encoding='utf-8'))
+    assert [card['galileo_relevance'] for card in index['topics']] == [9, 4]
+    assert index['topics'][0]['shard'] == '2026-10-17'
+    details = json.loads((tmp_path / 'details' / '2026-10-17.json').read_text(encoding='utf-8'))
+    assert details == {'1': {'summary': 'Zusammenfassung', 'storyline': {'hook': 'H'}}}
+
+
+def test_unchanged_files_are_not_rewritten(tmp_path):
+    writer = TopicShardWriter(str(tmp_path))
+    writer.write([make_topic(1, 9)], '2026-10-18T06:00:00')
+
+    writer.write([make_topic(1, 9)], '2026-10-19T06:00:00')
+
+    assert writer.written == 0
+    assert writer.unchanged > 0
@@ -0,0 +1,116 @@
+"""Tests für das inkrementelle Zusammenführen von topics.json"""
+
+import json
+from datetime import datetime, timedelta
+
+from topic_store import TopicStore, topic_id
+
+
+def make_topic(i, days_ago=0, **fields):
+    topic = {
+        'id': i,
+        'title': f'Thema {i}',
+        'date': (datetime.now() - timedelta(days=days_ago)).replace(microsecond=0).isoformat(),
+        'sources': [{'name': 'Test', 'url': f'https://example.org/{i}', 'credibility': 'green'}]
+    }
+    topic.update(fields)
+    return topic
+
+
+def make_store(tmp_path, topics=None, **kwargs):
+    path = tmp_path / 'topics.json'
+    if topics is not None:
+        path.write_text(json.dumps({'lastUpdate': '', 'topics': topics}), encoding='utf-8')
+    return TopicStore(str(path), **kwargs)
+
+
+def test_topic_id_is_stable_and_js_safe():
+    article = {'guid': 'abc', 'link': 'https://example.org/a'}
+
+    assert topic_id(article) == topic_id(dict(article))
+    assert topic_id(article) != topic_id({'guid': 'abd'})
+    assert 0 < topic_id(article) < 2 ** 53
+
+
+def test_merge_updates_in_place_and_prepends_new(tmp_path):
+    store = make_store(tmp_path, [make_topic(1), make_topic(2)])
+
+    merged = store.merge([make_topic(2, title='Thema 2 neu'), make_topic(3)])
+
+    assert [topic['id'] for topic in merged] == [3, 1, 2]
+    assert merged[2]['title'] == 'Thema 2 neu'
+    assert (store.added, store.updated, store.expired) == (1, 1, 0)
+
+
+def test_compact_topic_keeps_full_stored_entry(tmp_path):
+    full = make_topic(1, summary='Lange Zusammenfassung', storyline={'hook': 'Einstieg'},
+                      isDuplicate=False)
+    full['sources'].append({'name': 'Zweite', 'url': 'https://example.org/b', 'credibility': 'green'})
+    store = make_store(tmp_path, [full])
+    compact = make_topic(1, summary='Lange…', isDuplicate=True, compact=True)
+
+    merged = store.merge([compact])
+
+    assert merged[0]['storyline'] == {'hook': 'Einstieg'}
+    assert merged[0]['summary'] == 'Lange Zusammenfassung'
+    assert len(merged[0]['sources']) == 2
+    assert merged[0]['isDuplicate'] is True
+    assert 'compact' not in merged[0]
+    assert store.updated == 1
+
+
+def test_compact_topic_replaces_compact_entry(tmp_path):
+    store = make_store(tmp_path, [make_topic(1, summary='Alt…', compact=True)])
+
+    merged = store.merge([make_topic(1, summary='Neu…', compact=True)])
+
+    assert merged[0]['summary'] == 'Neu…'
+
+
+def test_merge_recognizes_legacy_topic_by_source_url(tmp_path):
+    legacy = make_topic(1, id=7)
+    legacy['sources'][0]['url'] = 'https://example.org/1/?utm_source=rss'
+    store = make_store(tmp_path, [legacy])
+
+    merged = store.merge([make_topic(1)])
+
+    assert [topic['id'] for topic in merged] == [1]
+    assert store.added == 0
+
+
+def test_merge_unchanged_topic_is_not_counted(tmp_path):
+    topic = make_topic(1)
+    store = make_store(tmp_path, [topic])
+
+    store.merge([dict(topic)])
+
+    assert (store.added, store.updated) == (0, 0)
+
+
+def test_retention_drops_old_topics(tmp_path):
+    store = make_store(tmp_path, [make_topic(1, days_ago=40), make_topic(2, days_ago=5)],
+                       retention_days=30)
+
+    merged = store.merge([])
+
+    assert [topic['id'] for topic in merged] == [2]
+    assert store.expired == 1
+
+
+def test_max_topics_keeps_newest_in_order(tmp_path):
+    store = make_store(tmp_path, [make_topic(1, days_ago=3), make_topic(2, days_ago=1),
+                                  make_topic(3, days_ago=2)], max_topics=2)
+
+    merged = store.merge([])
+
+    assert [topic['id'] for topic in merged] == [2, 3]
+    assert store.expired == 1
+
+
+def test_save_skips_unchanged_file(tmp_path):
+    store = make_store(tmp_path)
+    topics = [make_topic(1)]
+
+    assert store.save(topics)
+    assert not store.save(topics)
+    assert store.load() == topics